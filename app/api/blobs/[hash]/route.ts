@@ -0,0 +1,41 @@
+import { NextRequest, NextResponse } from "next/server";
+
+const FLASK_BACKEND_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:5000';
+
+// Stream stored images straight through, forwarding the headers that drive
+// conditional and partial requests so caching and Range support keep working
+const FORWARDED_REQUEST_HEADERS = ['range', 'if-none-match', 'if-modified-since', 'if-range'];
+const FORWARDED_RESPONSE_HEADERS = [
+  'content-type', 'content-length', 'content-range', 'accept-ranges',
+  'cache-control', 'etag', 'last-modified',
+  'content-disposition', 'content-security-policy', 'x-content-type-options',
+];
+
+export async function GET(req: NextRequest, { params }: { params: { hash: string } }) {
+  try {
+    const { hash } = params;
+    if (!hash) {
+      return NextResponse.json({ error: "Missing hash" }, { status: 400 });
+    }
+
+    const headers: Record<string, string> = {};
+    for (const name of FORWARDED_REQUEST_HEADERS) {
+      const value = req.headers.get(name);
+      if (value) headers[name] = value;
+    }
+
+    const response = await fetch(`${FLASK_BACKEND_URL}/api/blobs/${encodeURIComponent(hash)}`, {
+      method: 'GET',
+      headers,
+    });
+
+    const outHeaders = new Headers();
+    for (const name of FORWARDED_RESPONSE_HEADERS) {
+      const value = response.headers.get(name);
+      if (value) outHeaders.set(name, value);
+    }
+    return new NextResponse(response.body, { status: response.status, headers: outHeaders });
+  } catch (error) {
+    return NextResponse.json({ error: 'Failed to fetch blob' }, { status: 500 });
+  }
+}
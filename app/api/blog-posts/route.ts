@@ -28,7 +28,7 @@ export type BlogPost = {
 
 export async function GET() {
   try {
-    const response = await fetch(`${FLASK_BACKEND_URL}/api/blog-posts`, {
+    const response = await fetch(`${FLASK_BACKEND_URL}/api/blog-posts?paginate=false`, {
       method: 'GET',
       headers: {
         'Content-Type': 'application/json',
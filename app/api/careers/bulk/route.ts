@@ -0,0 +1,27 @@
+import { NextRequest, NextResponse } from "next/server";
+
+const FLASK_BACKEND_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:5000';
+
+// Body: { items: Career[] }. Per-item results come back as-is (status 200, 207 or 400).
+export async function POST(req: NextRequest) {
+  try {
+    const data = await req.json();
+    const atomic = new URL(req.url).searchParams.get('atomic');
+
+    const response = await fetch(`${FLASK_BACKEND_URL}/api/careers/bulk${atomic ? `?atomic=${atomic}` : ''}`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'Cookie': req.headers.get('cookie') || '',
+      },
+      credentials: 'include',
+      body: JSON.stringify(data),
+    });
+
+    const result = await response.json();
+    return NextResponse.json(result, { status: response.status });
+  } catch (error) {
+    console.error('Error creating careers:', error);
+    return NextResponse.json({ error: 'Failed to create careers' }, { status: 500 });
+  }
+}
@@ -23,7 +23,7 @@ export type Career = {
 
 export async function GET() {
   try {
-    const response = await fetch(`${FLASK_BACKEND_URL}/api/careers`, {
+    const response = await fetch(`${FLASK_BACKEND_URL}/api/careers?paginate=false`, {
       method: 'GET',
       headers: {
         'Content-Type': 'application/json',
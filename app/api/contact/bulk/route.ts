@@ -0,0 +1,23 @@
+import { NextRequest, NextResponse } from "next/server";
+
+const FLASK_BACKEND_URL = process.env.NEXT_PUBLIC_API_URL || "http://127.0.0.1:5000";
+
+// Body: { ids: number[] }
+export async function DELETE(req: NextRequest) {
+  try {
+    const data = await req.json();
+    const res = await fetch(`${FLASK_BACKEND_URL}/api/contact-quotes/bulk`, {
+      method: "DELETE",
+      headers: {
+        "Content-Type": "application/json",
+        Cookie: req.headers.get("cookie") || "",
+      },
+      body: JSON.stringify(data),
+      credentials: "include",
+    });
+    const result = await res.json();
+    return NextResponse.json(result, { status: res.status });
+  } catch (error) {
+    return NextResponse.json({ error: "Internal server error" }, { status: 500 });
+  }
+}
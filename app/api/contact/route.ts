@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from "next/server";
+import { forwardedFor } from "@/lib/client-ip";
 
 const FLASK_BACKEND_URL = process.env.NEXT_PUBLIC_API_URL || "http://127.0.0.1:5000";
 
@@ -19,6 +20,7 @@ export async function POST(req: NextRequest) {
       headers: {
         "Content-Type": "application/json",
         "Idempotency-Key": req.headers.get("idempotency-key") || "",
+        ...forwardedFor(req),
       },
       body: JSON.stringify(data),
     });
@@ -34,7 +36,7 @@ export async function POST(req: NextRequest) {
 
 export async function GET() {
   try {
-    const res = await fetch(`${FLASK_BACKEND_URL}/api/contact-quotes`, {
+    const res = await fetch(`${FLASK_BACKEND_URL}/api/contact-quotes?paginate=false`, {
       method: "GET",
       headers: {
         "Content-Type": "application/json",
@@ -0,0 +1,33 @@
+import { NextRequest, NextResponse } from "next/server";
+
+const FLASK_BACKEND_URL = process.env.NEXT_PUBLIC_API_URL || "http://127.0.0.1:5000";
+
+// Streamed straight through so large exports never sit in memory here either
+const FORWARDED_RESPONSE_HEADERS = ["content-type", "content-disposition", "cache-control"];
+
+export async function GET(req: NextRequest) {
+  try {
+    const url = new URL(req.url);
+    const res = await fetch(`${FLASK_BACKEND_URL}/api/job-applications/export${url.search}`, {
+      method: "GET",
+      headers: {
+        Cookie: req.headers.get("cookie") || "",
+      },
+      credentials: "include",
+      redirect: "manual",
+    });
+    if (!res.ok) {
+      const status = res.status >= 300 && res.status < 400 ? 401 : res.status;
+      const data = await res.json().catch(() => ({}));
+      return NextResponse.json({ error: data.error || "Failed to export applications" }, { status });
+    }
+    const headers = new Headers();
+    for (const name of FORWARDED_RESPONSE_HEADERS) {
+      const value = res.headers.get(name);
+      if (value) headers.set(name, value);
+    }
+    return new NextResponse(res.body, { status: res.status, headers });
+  } catch (error) {
+    return NextResponse.json({ error: "Internal server error" }, { status: 500 });
+  }
+}
@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from "next/server";
+import { forwardedFor } from "@/lib/client-ip";
 
 const FLASK_BACKEND_URL = process.env.NEXT_PUBLIC_API_URL || "http://127.0.0.1:5000";
 
@@ -10,6 +11,7 @@ export async function POST(req: NextRequest) {
       headers: {
         "Content-Type": "application/json",
         "Idempotency-Key": req.headers.get("idempotency-key") || "",
+        ...forwardedFor(req),
       },
       body: JSON.stringify(data),
     });
@@ -26,6 +28,10 @@ export async function POST(req: NextRequest) {
 export async function GET(req: NextRequest) {
   try {
     const url = new URL(req.url);
+    // Flask paginates by default; keep the full list unless the caller asked for a page
+    if (!url.searchParams.has("limit") && !url.searchParams.has("cursor")) {
+      url.searchParams.set("paginate", "false");
+    }
     const params = url.search ? url.search : "";
     const res = await fetch(`${FLASK_BACKEND_URL}/api/job-applications${params}`, {
       method: "GET",
@@ -4,7 +4,7 @@ const FLASK_BACKEND_URL = process.env.NEXT_PUBLIC_FLASK_BACKEND_URL || "http://1
 
 export async function GET() {
   try {
-    const res = await fetch(`${FLASK_BACKEND_URL}/api/careers`, {
+    const res = await fetch(`${FLASK_BACKEND_URL}/api/careers?paginate=false`, {
       method: "GET",
       headers: {
         "Content-Type": "application/json",
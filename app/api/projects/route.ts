@@ -22,7 +22,7 @@ export type Project = {
 
 export async function GET() {
   try {
-    const response = await fetch(`${FLASK_BACKEND_URL}/api/projects`, {
+    const response = await fetch(`${FLASK_BACKEND_URL}/api/projects?paginate=false`, {
       method: 'GET',
       headers: {
         'Content-Type': 'application/json',
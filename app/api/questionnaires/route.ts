@@ -8,8 +8,8 @@ const FLASK_ENDPOINT = FLASK_BASE + "/api/questionnaires";
 export async function GET(req: NextRequest) {
   const url = new URL(req.url);
   const jobId = url.searchParams.get("jobId");
-  let flaskUrl = FLASK_ENDPOINT;
-  if (jobId) flaskUrl += `?jobId=${encodeURIComponent(jobId)}`;
+  let flaskUrl = FLASK_ENDPOINT + "?paginate=false";
+  if (jobId) flaskUrl += `&jobId=${encodeURIComponent(jobId)}`;
   const flaskRes = await fetch(flaskUrl, {
     method: "GET",
     headers: { "Content-Type": "application/json" },
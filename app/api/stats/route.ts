@@ -0,0 +1,25 @@
+import { NextRequest, NextResponse } from "next/server";
+
+const FLASK_BACKEND_URL = process.env.NEXT_PUBLIC_API_URL || "http://127.0.0.1:5000";
+
+// Dashboard aggregates: applications by job/status, submissions per day, active careers
+export async function GET(req: NextRequest) {
+  try {
+    const url = new URL(req.url);
+    const res = await fetch(`${FLASK_BACKEND_URL}/api/stats${url.search}`, {
+      method: "GET",
+      headers: {
+        "Content-Type": "application/json",
+        Cookie: req.headers.get("cookie") || "",
+      },
+      credentials: "include",
+    });
+    const data = await res.json();
+    if (!res.ok) {
+      return NextResponse.json({ error: data.error || "Failed to fetch stats" }, { status: res.status });
+    }
+    return NextResponse.json(data);
+  } catch (error) {
+    return NextResponse.json({ error: "Internal server error" }, { status: 500 });
+  }
+}
@@ -21,7 +21,7 @@ export type Team = {
 
 export async function GET() {
   try {
-    const response = await fetch(`${FLASK_BACKEND_URL}/api/teams`, {
+    const response = await fetch(`${FLASK_BACKEND_URL}/api/teams?paginate=false`, {
       method: 'GET',
       headers: {
         'Content-Type': 'application/json',
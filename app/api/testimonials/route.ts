@@ -19,7 +19,7 @@ export type Testimonial = {
 
 export async function GET() {
   try {
-    const response = await fetch(`${FLASK_BACKEND_URL}/api/testimonials`, {
+    const response = await fetch(`${FLASK_BACKEND_URL}/api/testimonials?paginate=false`, {
       method: 'GET',
       headers: {
         'Content-Type': 'application/json',
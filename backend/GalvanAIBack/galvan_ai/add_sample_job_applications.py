@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+from app import create_app, db
+from app.models.career import Career
+from app.models.job_application import JobApplication
+from app.models.questionnaire import Questionnaire
+import json
+
+FIRST_NAMES = ["Ava", "Liam", "Maya", "Noah", "Sofia", "Ethan", "Zara", "Lucas", "Amira", "Leo"]
+LAST_NAMES = ["Khan", "Smith", "Garcia", "Chen", "Okafor", "Novak", "Silva", "Ahmed", "Rossi", "Kim"]
+STATUSES = ["pending", "pending", "pending", "reviewed", "shortlisted", "rejected", "hired"]
+
+COVER_LETTER = (
+    "I am excited to apply for this position. Over the past few years I have delivered production "
+    "systems end to end, from gathering requirements to monitoring them in the field, and I enjoy "
+    "working closely with designers and product managers. I would love to bring that experience to Galvan AI."
+)
+
+def _answer(question, n):
+    """A plausible answer for one questionnaire question."""
+    kind = question.get("type")
+    options = question.get("options") or []
+    if kind in ("select", "radio") and options:
+        return options[n % len(options)]
+    if kind == "checkbox" and options:
+        return options[:n % len(options) + 1]
+    if kind == "number":
+        return n % 20
+    if kind == "email":
+        return f"applicant{n}@example.com"
+    if kind == "phone":
+        return f"+1 555 {n % 10000:04d}"
+    if kind == "file":
+        return None
+    min_length = (question.get("validation") or {}).get("minLength") or 0
+    return (COVER_LETTER * (min_length // len(COVER_LETTER) + 1))[:max(min_length, 120)]
+
+def _responses(questions, n):
+    responses = []
+    for question in questions:
+        response = {
+            "questionId": question["id"],
+            "questionLabel": question["label"],
+            "questionType": question["type"],
+            "answer": _answer(question, n),
+        }
+        if question["type"] == "file":
+            response["fileUpload"] = {
+                "fileName": f"work-sample-{n}.pdf",
+                "fileSize": 240000,
+                "fileType": "application/pdf",
+                "fileUrl": f"https://files.example.com/work-sample-{n}.pdf",
+                "storageType": "url",
+            }
+        responses.append(response)
+    return responses
+
+def generate_job_applications(count, jobs, questionnaires=None):
+    """Yield count synthetic applications spread across jobs (for bench_api.py).
+
+    jobs is a list of (job_id, job_title); questionnaires maps a job id to
+    (questionnaire_id, questions) and adds answers for those jobs. Emails are
+    unique per job, as the job_applications table requires.
+    """
+    questionnaires = questionnaires or {}
+    for n in range(count):
+        job_id, job_title = jobs[n % len(jobs)]
+        first = FIRST_NAMES[n % len(FIRST_NAMES)]
+        last = LAST_NAMES[n // len(FIRST_NAMES) % len(LAST_NAMES)]
+        application = {
+            "jobId": str(job_id),
+            "jobTitle": job_title,
+            "applicantName": f"{first} {last}",
+            "applicantEmail": f"{first.lower()}.{last.lower()}.{n}@example.com",
+            "applicantPhone": f"+1 555 {n % 10000:04d}",
+            "coverLetter": COVER_LETTER,
+            "resume": {
+                "fileName": f"resume-{n}.pdf",
+                "fileSize": 180000,
+                "fileType": "application/pdf",
+                "fileUrl": f"https://files.example.com/resume-{n}.pdf",
+                "storageType": "url",
+            },
+            "status": STATUSES[n % len(STATUSES)],
+        }
+        if str(job_id) in questionnaires:
+            questionnaire_id, questions = questionnaires[str(job_id)]
+            application["questionnaireId"] = str(questionnaire_id)
+            application["responses"] = _responses(questions, n)
+        yield application
+
+def add_sample_job_applications(count=20):
+    app = create_app()
+    with app.app_context():
+        print("🚀 Adding sample job applications...")
+
+        careers = Career.query.all()
+        if not careers:
+            print("❌ No careers found. Run add_sample_careers.py first.")
+            return
+
+        jobs = [(career.id, career.title) for career in careers]
+        questionnaires = {
+            q.job_id: (q.id, json.loads(q.questions or '[]'))
+            for q in Questionnaire.query.filter_by(is_active=True)
+        }
+        try:
+            for data in generate_job_applications(count, jobs, questionnaires):
+                db.session.add(JobApplication.from_dict(data))
+            db.session.commit()
+            print(f"🎉 Added {count} sample job applications across {len(jobs)} careers!")
+        except Exception as e:
+            print(f"❌ Error adding sample job applications: {e}")
+            db.session.rollback()
+
+if __name__ == "__main__":
+    add_sample_job_applications()
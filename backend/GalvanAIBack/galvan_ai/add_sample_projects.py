@@ -1,175 +1,196 @@
 #!/usr/bin/env python3
 
+import copy
+
 from app import create_app, db
 from app.models.project import Project
 import json
 
-def add_sample_projects():
-    app = create_app()
-    with app.app_context():
-        print("🚀 Adding sample projects...")
-        
-        # Sample projects data
-        sample_projects = [
-            {
-                "hero": {
-                    "subtitle": "AI-Powered E-commerce Platform",
-                    "description": "A modern e-commerce platform with AI-driven product recommendations and personalized shopping experience.",
-                    "banner": "https://images.unsplash.com/photo-1556742049-0cfed4f6a45d?w=800&h=400&fit=crop"
-                },
-                "gallery": [
-                    "https://images.unsplash.com/photo-1556742049-0cfed4f6a45d?w=800&h=400&fit=crop",
-                    "https://images.unsplash.com/photo-1556742049-0cfed4f6a45d?w=800&h=400&fit=crop"
-                ],
-                "features": [
-                    "AI Product Recommendations",
-                    "Personalized Shopping Experience",
-                    "Real-time Inventory Management",
-                    "Advanced Analytics Dashboard"
-                ],
-                "team": [
-                    {
-                        "name": "John Doe",
-                        "role": "Lead Developer",
-                        "avatar": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?w=150&h=150&fit=crop&crop=face"
-                    },
-                    {
-                        "name": "Sarah Johnson",
-                        "role": "UX Designer",
-                        "avatar": "https://images.unsplash.com/photo-1494790108755-2616b612b786?w=150&h=150&fit=crop&crop=face"
-                    }
-                ],
-                "timeline": [
-                    {
-                        "phase": "Planning & Research",
-                        "date": "January 2024"
-                    },
-                    {
-                        "phase": "Development",
-                        "date": "February - March 2024"
-                    },
-                    {
-                        "phase": "Testing & Launch",
-                        "date": "April 2024"
-                    }
-                ],
-                "testimonials": [
-                    {
-                        "quote": "This platform revolutionized our online business!",
-                        "author": "CEO, TechCorp"
-                    }
-                ],
-                "technologies": ["React", "Node.js", "Python", "TensorFlow", "AWS"],
-                "longDescription": "A comprehensive e-commerce solution that leverages artificial intelligence to provide personalized shopping experiences. The platform includes advanced features like real-time inventory management, AI-driven product recommendations, and a sophisticated analytics dashboard.",
-                "bestProject": True
+SAMPLE_PROJECTS = [
+    {
+        "hero": {
+            "subtitle": "AI-Powered E-commerce Platform",
+            "description": "A modern e-commerce platform with AI-driven product recommendations and personalized shopping experience.",
+            "banner": "https://images.unsplash.com/photo-1556742049-0cfed4f6a45d?w=800&h=400&fit=crop"
+        },
+        "gallery": [
+            "https://images.unsplash.com/photo-1556742049-0cfed4f6a45d?w=800&h=400&fit=crop",
+            "https://images.unsplash.com/photo-1556742049-0cfed4f6a45d?w=800&h=400&fit=crop"
+        ],
+        "features": [
+            "AI Product Recommendations",
+            "Personalized Shopping Experience",
+            "Real-time Inventory Management",
+            "Advanced Analytics Dashboard"
+        ],
+        "team": [
+            {
+                "name": "John Doe",
+                "role": "Lead Developer",
+                "avatar": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?w=150&h=150&fit=crop&crop=face"
+            },
+            {
+                "name": "Sarah Johnson",
+                "role": "UX Designer",
+                "avatar": "https://images.unsplash.com/photo-1494790108755-2616b612b786?w=150&h=150&fit=crop&crop=face"
+            }
+        ],
+        "timeline": [
+            {
+                "phase": "Planning & Research",
+                "date": "January 2024"
+            },
+            {
+                "phase": "Development",
+                "date": "February - March 2024"
+            },
+            {
+                "phase": "Testing & Launch",
+                "date": "April 2024"
+            }
+        ],
+        "testimonials": [
+            {
+                "quote": "This platform revolutionized our online business!",
+                "author": "CEO, TechCorp"
+            }
+        ],
+        "technologies": ["React", "Node.js", "Python", "TensorFlow", "AWS"],
+        "longDescription": "A comprehensive e-commerce solution that leverages artificial intelligence to provide personalized shopping experiences. The platform includes advanced features like real-time inventory management, AI-driven product recommendations, and a sophisticated analytics dashboard.",
+        "bestProject": True
+    },
+    {
+        "hero": {
+            "subtitle": "Mobile Banking App",
+            "description": "A secure and user-friendly mobile banking application with biometric authentication and real-time transactions.",
+            "banner": "https://images.unsplash.com/photo-1563013544-824ae1b704d3?w=800&h=400&fit=crop"
+        },
+        "gallery": [
+            "https://images.unsplash.com/photo-1563013544-824ae1b704d3?w=800&h=400&fit=crop",
+            "https://images.unsplash.com/photo-1563013544-824ae1b704d3?w=800&h=400&fit=crop"
+        ],
+        "features": [
+            "Biometric Authentication",
+            "Real-time Transactions",
+            "Investment Portfolio Management",
+            "Secure Messaging System"
+        ],
+        "team": [
+            {
+                "name": "Mike Chen",
+                "role": "Mobile Developer",
+                "avatar": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?w=150&h=150&fit=crop&crop=face"
+            },
+            {
+                "name": "Emily Davis",
+                "role": "Security Engineer",
+                "avatar": "https://images.unsplash.com/photo-1494790108755-2616b612b786?w=150&h=150&fit=crop&crop=face"
+            }
+        ],
+        "timeline": [
+            {
+                "phase": "Security Planning",
+                "date": "March 2024"
             },
             {
-                "hero": {
-                    "subtitle": "Mobile Banking App",
-                    "description": "A secure and user-friendly mobile banking application with biometric authentication and real-time transactions.",
-                    "banner": "https://images.unsplash.com/photo-1563013544-824ae1b704d3?w=800&h=400&fit=crop"
-                },
-                "gallery": [
-                    "https://images.unsplash.com/photo-1563013544-824ae1b704d3?w=800&h=400&fit=crop",
-                    "https://images.unsplash.com/photo-1563013544-824ae1b704d3?w=800&h=400&fit=crop"
-                ],
-                "features": [
-                    "Biometric Authentication",
-                    "Real-time Transactions",
-                    "Investment Portfolio Management",
-                    "Secure Messaging System"
-                ],
-                "team": [
-                    {
-                        "name": "Mike Chen",
-                        "role": "Mobile Developer",
-                        "avatar": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?w=150&h=150&fit=crop&crop=face"
-                    },
-                    {
-                        "name": "Emily Davis",
-                        "role": "Security Engineer",
-                        "avatar": "https://images.unsplash.com/photo-1494790108755-2616b612b786?w=150&h=150&fit=crop&crop=face"
-                    }
-                ],
-                "timeline": [
-                    {
-                        "phase": "Security Planning",
-                        "date": "March 2024"
-                    },
-                    {
-                        "phase": "Development",
-                        "date": "April - May 2024"
-                    },
-                    {
-                        "phase": "Security Audit & Launch",
-                        "date": "June 2024"
-                    }
-                ],
-                "testimonials": [
-                    {
-                        "quote": "The most secure banking app I've ever used!",
-                        "author": "CFO, BankSecure"
-                    }
-                ],
-                "technologies": ["React Native", "Firebase", "Biometric SDK", "Encryption", "AWS"],
-                "longDescription": "A state-of-the-art mobile banking application that prioritizes security and user experience. Features include biometric authentication, real-time transaction processing, investment portfolio management, and a secure messaging system for customer support.",
-                "bestProject": True
+                "phase": "Development",
+                "date": "April - May 2024"
             },
             {
-                "hero": {
-                    "subtitle": "Smart Home IoT Platform",
-                    "description": "An intelligent home automation system that connects and controls all smart devices through a unified platform.",
-                    "banner": "https://images.unsplash.com/photo-1558618666-fcd25c85cd64?w=800&h=400&fit=crop"
-                },
-                "gallery": [
-                    "https://images.unsplash.com/photo-1558618666-fcd25c85cd64?w=800&h=400&fit=crop",
-                    "https://images.unsplash.com/photo-1558618666-fcd25c85cd64?w=800&h=400&fit=crop"
-                ],
-                "features": [
-                    "Device Integration",
-                    "Voice Control",
-                    "Energy Optimization",
-                    "Remote Monitoring"
-                ],
-                "team": [
-                    {
-                        "name": "Alex Rodriguez",
-                        "role": "IoT Engineer",
-                        "avatar": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?w=150&h=150&fit=crop&crop=face"
-                    },
-                    {
-                        "name": "Lisa Wang",
-                        "role": "Backend Developer",
-                        "avatar": "https://images.unsplash.com/photo-1494790108755-2616b612b786?w=150&h=150&fit=crop&crop=face"
-                    }
-                ],
-                "timeline": [
-                    {
-                        "phase": "Hardware Integration",
-                        "date": "May 2024"
-                    },
-                    {
-                        "phase": "Software Development",
-                        "date": "June - July 2024"
-                    },
-                    {
-                        "phase": "Testing & Deployment",
-                        "date": "August 2024"
-                    }
-                ],
-                "testimonials": [
-                    {
-                        "quote": "This platform made my home truly smart!",
-                        "author": "Homeowner, SmartLiving"
-                    }
-                ],
-                "technologies": ["Python", "MQTT", "React", "Docker", "Raspberry Pi"],
-                "longDescription": "A comprehensive IoT platform that seamlessly integrates various smart home devices. The system includes voice control capabilities, energy optimization algorithms, and remote monitoring features for complete home automation.",
-                "bestProject": False
+                "phase": "Security Audit & Launch",
+                "date": "June 2024"
             }
-        ]
+        ],
+        "testimonials": [
+            {
+                "quote": "The most secure banking app I've ever used!",
+                "author": "CFO, BankSecure"
+            }
+        ],
+        "technologies": ["React Native", "Firebase", "Biometric SDK", "Encryption", "AWS"],
+        "longDescription": "A state-of-the-art mobile banking application that prioritizes security and user experience. Features include biometric authentication, real-time transaction processing, investment portfolio management, and a secure messaging system for customer support.",
+        "bestProject": True
+    },
+    {
+        "hero": {
+            "subtitle": "Smart Home IoT Platform",
+            "description": "An intelligent home automation system that connects and controls all smart devices through a unified platform.",
+            "banner": "https://images.unsplash.com/photo-1558618666-fcd25c85cd64?w=800&h=400&fit=crop"
+        },
+        "gallery": [
+            "https://images.unsplash.com/photo-1558618666-fcd25c85cd64?w=800&h=400&fit=crop",
+            "https://images.unsplash.com/photo-1558618666-fcd25c85cd64?w=800&h=400&fit=crop"
+        ],
+        "features": [
+            "Device Integration",
+            "Voice Control",
+            "Energy Optimization",
+            "Remote Monitoring"
+        ],
+        "team": [
+            {
+                "name": "Alex Rodriguez",
+                "role": "IoT Engineer",
+                "avatar": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?w=150&h=150&fit=crop&crop=face"
+            },
+            {
+                "name": "Lisa Wang",
+                "role": "Backend Developer",
+                "avatar": "https://images.unsplash.com/photo-1494790108755-2616b612b786?w=150&h=150&fit=crop&crop=face"
+            }
+        ],
+        "timeline": [
+            {
+                "phase": "Hardware Integration",
+                "date": "May 2024"
+            },
+            {
+                "phase": "Software Development",
+                "date": "June - July 2024"
+            },
+            {
+                "phase": "Testing & Deployment",
+                "date": "August 2024"
+            }
+        ],
+        "testimonials": [
+            {
+                "quote": "This platform made my home truly smart!",
+                "author": "Homeowner, SmartLiving"
+            }
+        ],
+        "technologies": ["Python", "MQTT", "React", "Docker", "Raspberry Pi"],
+        "longDescription": "A comprehensive IoT platform that seamlessly integrates various smart home devices. The system includes voice control capabilities, energy optimization algorithms, and remote monitoring features for complete home automation.",
+        "bestProject": False
+    }
+]
+
+def generate_projects(count, gallery_size=None, timeline_size=None):
+    """Yield count synthetic projects cycled from SAMPLE_PROJECTS (for bench_api.py).
+
+    gallery_size and timeline_size stretch those lists to model large projects.
+    """
+    for i in range(count):
+        project = copy.deepcopy(SAMPLE_PROJECTS[i % len(SAMPLE_PROJECTS)])
+        project["hero"]["subtitle"] = f"{project['hero']['subtitle']} #{i + 1}"
+        if gallery_size is not None:
+            project["gallery"] = [f"{project['hero']['banner']}&v={n}" for n in range(gallery_size)]
+        if timeline_size is not None:
+            project["timeline"] = [
+                {"phase": f"Phase {n + 1}", "date": f"{2020 + n // 12}-{n % 12 + 1:02d}-01"}
+                for n in range(timeline_size)
+            ]
+        # Keep the best-projects list at roughly the sample ratio
+        project["bestProject"] = project["bestProject"] and i < len(SAMPLE_PROJECTS) * 10
+        yield project
+
+
+def add_sample_projects():
+    app = create_app()
+    with app.app_context():
+        print("🚀 Adding sample projects...")
         
-        for project_data in sample_projects:
+        for project_data in SAMPLE_PROJECTS:
             try:
                 project = Project.from_dict(project_data)
                 db.session.add(project)
@@ -2,21 +2,39 @@ from flask import Flask, request, redirect, url_for, jsonify
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, current_user
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+from .compression import init_compression
+from .config import get_config
+from .json_provider import FastJSONProvider
+from .metrics import init_metrics
+from .ratelimit import check_rate_limits
 
 db = SQLAlchemy()
 login_manager = LoginManager()
 
-def create_app():
+def create_app(config=None):
+    """Build the app; config is a name from app.config.CONFIGS, a config class, or None for APP_ENV."""
     app = Flask(__name__)
-    app.config['SECRET_KEY'] = 'galvanai_secret_key'
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///galvan_ai.db'
-    app.config['SESSION_PERMANENT'] = False
-    app.config['REMEMBER_COOKIE_DURATION'] = 0
+    app.config.from_object(config if isinstance(config, type) else get_config(config))
+    app.json = FastJSONProvider(app)
+    # Fail at startup, not with a 500 on every submission
+    check_rate_limits(app.config['RATE_LIMITS'])
+    if app.config['TRUSTED_PROXY_HOPS']:
+        hops = app.config['TRUSTED_PROXY_HOPS']
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=hops, x_proto=hops)
 
     # Enable CORS for all routes
-    CORS(app, origins=['http://localhost:3000', 'http://192.168.18.18:3000'], supports_credentials=True)
+    CORS(app, origins=app.config['CORS_ORIGINS'], supports_credentials=True)
+    # Registered before compression so response sizes are measured as sent
+    init_metrics(app)
+    init_compression(app)
 
     db.init_app(app)
+    # Response cache, idempotency/captcha store and rate limiter, on app.extensions
+    from .state import init_state
+    init_state(app)
+
     login_manager.init_app(app)
     login_manager.login_view = 'auth.login'
     login_manager.session_protection = 'strong'
@@ -28,16 +46,23 @@ def create_app():
     app.register_blueprint(api)
 
     with app.app_context():
-        from .models.user import User
+        from .sqlite import configure_sqlite
+        configure_sqlite(app, db.engine)
+
         from .models.project import Project
         from .models.blog import BlogPost
         from .models.testimonial import Testimonial
         from .models.team import Team
-        from .models.career import Career
-        from .models.questionnaire import Questionnaire
-        from .models.contact_quote import ContactQuote
-        from .models.job_application import JobApplication
-        db.create_all()
+        from .blobstore import register_blob_columns
+        register_blob_columns(Project, BlogPost, Team, Testimonial)
+
+        # Schema changes are versioned migrations (`flask --app run db upgrade`),
+        # not create_all() on every boot
+        from .migrations import check_migrations
+        check_migrations(app, db.engine)
+
+    from .migrations.cli import db_cli
+    app.cli.add_command(db_cli)
 
     @app.before_request
     def require_login():
@@ -53,7 +78,7 @@ def create_app():
             # For other API methods, check if user is authenticated
             if not current_user.is_authenticated:
                 return jsonify({'error': 'Authentication required'}), 401
-        elif not current_user.is_authenticated and request.endpoint not in ['auth.login', 'static']:
+        elif not current_user.is_authenticated and request.endpoint not in ['auth.login', 'static', 'metrics']:
             return redirect(url_for('auth.login'))
 
     return app
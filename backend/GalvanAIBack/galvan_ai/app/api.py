@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify, make_response
+from flask import Blueprint, current_app, request, jsonify, make_response, send_file
 from flask_login import login_required, current_user
 from app import db
 from app.models.project import Project
@@ -9,84 +9,183 @@ from app.models.career import Career
 from app.models.questionnaire import Questionnaire
 from app.models.contact_quote import ContactQuote
 from app.models.job_application import JobApplication
+from app.blobstore import BLOB_CONTENT_TYPES, get_blob_store
+from app.cache import cached_response, invalidates
+from app.ratelimit import parse_rate
+from app.export import (
+    ExportError, application_columns, export_response, filter_created_between, flatten_application,
+    parse_format, response_columns, stream_rows,
+)
+from app.conditional import collection_validators, not_modified, row_validators, with_validators
+from app.models.serialization import FieldSelectionError
+from app.pagination import (
+    PaginationError, decode_offset_cursor, encode_offset_cursor, paginate_query, parse_limit, wants_pagination,
+)
+from app.search import SEARCH_INDEXES, search
+from app.stats import (
+    StatsError, active_careers_with_applicants, applications_by_job_and_status, parse_days, submissions_per_day,
+)
+from datetime import datetime
+from sqlalchemy import insert, update
+import hashlib
 import json
-import os
 import time
-try:
-    import redis
-    _redis_available = True
-except Exception:
-    _redis_available = False
-
-_redis_client = None
-if _redis_available:
+
+_IDEMPOTENCY_PENDING = b'pending'
+# The only headers worth replaying; the rest are rebuilt for every response
+_IDEMPOTENCY_HEADERS = ('Location',)
+
+def _idempotency_record(response):
+    """Compact replay record: a JSON header line, then the body bytes."""
+    header = {'status': response.status_code, 'mimetype': response.mimetype}
+    headers = {name: response.headers[name] for name in _IDEMPOTENCY_HEADERS if name in response.headers}
+    if headers:
+        header['headers'] = headers
+    return json.dumps(header, separators=(',', ':')).encode('utf-8') + b'\n' + response.get_data()
+
+def _replay(record):
+    header, body = record.split(b'\n', 1)
+    header = json.loads(header)
+    response = make_response(body, header['status'], header.get('headers', {}))
+    response.mimetype = header['mimetype']
+    response.headers['Idempotent-Replayed'] = 'true'
+    return response
+
+def _idempotency_conflict():
+    response = jsonify({'error': 'A request with this Idempotency-Key is still in progress'})
+    response.headers['Retry-After'] = '1'
+    return response, 409
+
+def _await_idempotent(store, cache_key):
+    """Wait briefly for the request holding cache_key; returns its record, or None once the key is free."""
+    deadline = time.monotonic() + current_app.config['IDEMPOTENCY_WAIT_SECONDS']
+    delay = 0.05
+    while True:
+        record = store.get(cache_key)
+        if record != _IDEMPOTENCY_PENDING:
+            return record
+        if time.monotonic() >= deadline:
+            return _IDEMPOTENCY_PENDING
+        time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+        delay = min(delay * 2, 0.2)
+
+def _release_idempotency_key(store, cache_key):
     try:
-        _redis_client = redis.Redis(
-            host=os.environ.get('REDIS_HOST', 'localhost'),
-            port=int(os.environ.get('REDIS_PORT', '6379')),
-            db=int(os.environ.get('REDIS_DB', '1')),
-            socket_connect_timeout=1,
-            socket_timeout=1,
-        )
-        # Ping to ensure connection if server exists
-        _redis_client.ping()
+        store.delete(cache_key)
     except Exception:
-        _redis_client = None
+        pass
 
 def idempotent(ttl_seconds: int = 600):
+    """Run a write once per Idempotency-Key and replay its response to retries.
+
+    The key is reserved with SET NX before the handler runs, so concurrent
+    duplicates wait briefly for the original's response instead of repeating
+    the work, then get a 409 with Retry-After. Server errors release the key
+    so the request can be retried. Once a key is known to be taken the
+    handler never runs for it: a record that cannot be replayed is a 500.
+    """
     def decorator(fn):
         def wrapper(*args, **kwargs):
             key = request.headers.get('Idempotency-Key')
             if not key:
                 return jsonify({'error': 'Missing Idempotency-Key'}), 409
-            if _redis_client is None:
-                # Fallback: accept request without cache if redis not available
+            store = current_app.extensions['state_store']
+            if store is None:
+                # No store configured (STATE_BACKEND=none): accept request without replay
                 return fn(*args, **kwargs)
             cache_key = f"idemp:{request.path}:{key}"
-            cached = _redis_client.get(cache_key)
-            if cached:
+            lock_seconds = current_app.config['IDEMPOTENCY_LOCK_SECONDS']
+            while True:
+                try:
+                    reserved = store.set(cache_key, _IDEMPOTENCY_PENDING, nx=True, ex=lock_seconds)
+                except Exception:
+                    # An unreachable store must not take the endpoint down with it
+                    return fn(*args, **kwargs)
+                if reserved:
+                    break
                 try:
-                    body, status, headers = json.loads(cached)
-                    return make_response(body, status, headers)
+                    record = _await_idempotent(store, cache_key)
                 except Exception:
-                    pass
-            response = fn(*args, **kwargs)
+                    return _idempotency_conflict()
+                if record == _IDEMPOTENCY_PENDING:
+                    return _idempotency_conflict()
+                if record is not None:
+                    try:
+                        return _replay(record)
+                    except Exception:
+                        current_app.logger.exception('Unreadable idempotency record for %s', cache_key)
+                        return jsonify({'error': 'The original response for this Idempotency-Key cannot be replayed'}), 500
+                # The original failed and released the key: take it over
+            try:
+                response = make_response(fn(*args, **kwargs))
+            except Exception:
+                _release_idempotency_key(store, cache_key)
+                raise
+            # Server errors and throttling (429) are transient, so a retry runs again
+            if response.status_code >= 500 or response.status_code == 429 or response.is_streamed:
+                _release_idempotency_key(store, cache_key)
+                return response
             try:
-                body = response.get_json() if hasattr(response, 'get_json') else None
-                status = response.status_code if hasattr(response, 'status_code') else 200
-                headers = dict(response.headers) if hasattr(response, 'headers') else {}
-                _redis_client.setex(cache_key, ttl_seconds, json.dumps([body, status, headers]))
+                store.setex(cache_key, ttl_seconds, _idempotency_record(response))
             except Exception:
-                pass
+                _release_idempotency_key(store, cache_key)
             return response
         wrapper.__name__ = fn.__name__
         return wrapper
     return decorator
 
 def _client_ip() -> str:
-    try:
-        return request.headers.get('X-Forwarded-For', '').split(',')[0].strip() or request.remote_addr or 'unknown'
-    except Exception:
-        return 'unknown'
+    # X-Forwarded-For is client-controlled; ProxyFix (TRUSTED_PROXY_HOPS) resolves
+    # remote_addr from the hops our own proxies appended
+    return request.remote_addr or 'unknown'
+
+def rate_limited(name: str, email_field: str):
+    """Apply the RATE_LIMITS[name] buckets (per IP, per email, global); 429 with Retry-After when exhausted."""
+    def decorator(fn):
+        def wrapper(*args, **kwargs):
+            if not current_app.config.get('RATE_LIMIT_ENABLED'):
+                return fn(*args, **kwargs)
+            rates = current_app.config['RATE_LIMITS'].get(name, {})
+            data = request.get_json(silent=True)
+            email = data.get(email_field) if isinstance(data, dict) else None
+            scopes = {'ip': _client_ip(), 'global': '*'}
+            if isinstance(email, str) and email.strip():
+                # Hashed so addresses are not kept in plain text as keys
+                scopes['email'] = hashlib.sha1(email.strip().lower().encode('utf-8')).hexdigest()
+            limits = [
+                (f'{name}:{scope}:{value}', parse_rate(rates[scope]))
+                for scope, value in scopes.items() if parse_rate(rates.get(scope))
+            ]
+            retry_after = current_app.extensions['rate_limiter'].hit(limits)
+            if retry_after:
+                response = jsonify({'error': 'Too many requests, please try again later'})
+                response.headers['Retry-After'] = str(retry_after)
+                return response, 429
+            return fn(*args, **kwargs)
+        wrapper.__name__ = fn.__name__
+        return wrapper
+    return decorator
 
 def _captcha_key(prefix: str, identifier: str) -> str:
     return f"captcha:{prefix}:{identifier}"
 
 def captcha_should_challenge(prefix: str, identifier: str, threshold: int = 3) -> bool:
-    if _redis_client is None:
+    store = current_app.extensions['state_store']
+    if store is None:
         return False
     try:
-        current = _redis_client.get(_captcha_key(prefix, identifier))
+        current = store.get(_captcha_key(prefix, identifier))
         return int(current or 0) >= threshold
     except Exception:
         return False
 
 def captcha_record_failure(prefix: str, identifier: str, ttl_seconds: int = 600) -> None:
-    if _redis_client is None:
+    store = current_app.extensions['state_store']
+    if store is None:
         return
     try:
         key = _captcha_key(prefix, identifier)
-        pipe = _redis_client.pipeline()
+        pipe = store.pipeline()
         pipe.incr(key)
         pipe.expire(key, ttl_seconds)
         pipe.execute()
@@ -94,109 +193,145 @@ def captcha_record_failure(prefix: str, identifier: str, ttl_seconds: int = 600)
         pass
 
 def captcha_reset(prefix: str, identifier: str) -> None:
-    if _redis_client is None:
+    store = current_app.extensions['state_store']
+    if store is None:
         return
     try:
-        _redis_client.delete(_captcha_key(prefix, identifier))
+        store.delete(_captcha_key(prefix, identifier))
     except Exception:
         pass
 
+def _requested_fields(model):
+    """Parse ?fields= for model; raises FieldSelectionError on unknown keys."""
+    return model.parse_fields(request.args.get('fields'))
+
+def _projected(query, model, fields):
+    """Restrict query to the columns needed to serialize fields."""
+    return query.options(*model.load_options(fields))
+
+def _collection_response(query, model, *legacy_order):
+    """Serialize a collection query as a keyset-paginated page.
+
+    Clients that pass ?paginate=false get the legacy bare list, ordered by legacy_order.
+    """
+    try:
+        fields = _requested_fields(model)
+        etag, last_modified = collection_validators(query, model)
+        cached = not_modified(etag, last_modified)
+        if cached is not None:
+            return cached
+        query = _projected(query, model, fields)
+        if not wants_pagination(request.args):
+            rows = query.order_by(*legacy_order).all() if legacy_order else query.all()
+            return with_validators(jsonify([row.to_dict(fields) for row in rows]), etag, last_modified)
+        rows, next_cursor = paginate_query(query, model, request.args)
+    except (FieldSelectionError, PaginationError) as e:
+        return jsonify({'error': str(e)}), 400
+    body = jsonify({'items': [row.to_dict(fields) for row in rows], 'next_cursor': next_cursor})
+    return with_validators(body, etag, last_modified)
+
+def _filtered_list_response(query, model):
+    """Serialize a small, already filtered and ordered list honouring ?fields=."""
+    try:
+        fields = _requested_fields(model)
+    except FieldSelectionError as e:
+        return jsonify({'error': str(e)}), 400
+    etag, last_modified = collection_validators(query, model)
+    cached = not_modified(etag, last_modified)
+    if cached is not None:
+        return cached
+    rows = _projected(query, model, fields).all()
+    return with_validators(jsonify([row.to_dict(fields) for row in rows]), etag, last_modified)
+
+def _detail_response(model, ident, not_found_message):
+    """Serialize one row honouring ?fields=, answering 304 when the client copy is current."""
+    fields = _requested_fields(model)
+    validators = row_validators(model, ident)
+    if validators is None:
+        return jsonify({'error': not_found_message}), 404
+    cached = not_modified(*validators)
+    if cached is not None:
+        return cached
+    row = _projected(model.query, model, fields).get(ident)
+    if row is None:
+        return jsonify({'error': not_found_message}), 404
+    return with_validators(jsonify(row.to_dict(fields)), *validators)
+
+# Largest batch a bulk endpoint accepts in one request
+BULK_MAX_ITEMS = 1000
+
+def _bulk_list(data, key):
+    """Return (items, error) for the list under key in a bulk request body."""
+    if not isinstance(data, dict) or not isinstance(data.get(key), list):
+        return None, f'{key} must be an array'
+    if not data[key]:
+        return None, f'{key} must not be empty'
+    if len(data[key]) > BULK_MAX_ITEMS:
+        return None, f'At most {BULK_MAX_ITEMS} {key} per request'
+    return data[key], None
+
+def _bulk_ids(data):
+    """Return (ids, error) for a bulk request body of the form {"ids": [...]}."""
+    ids, error = _bulk_list(data, 'ids')
+    if error:
+        return None, error
+    if not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+        return None, 'ids must be integers'
+    return ids, None
+
+def _existing_ids(model, ids):
+    """The subset of ids that exist, fetched with one query."""
+    return {row[0] for row in db.session.query(model.id).filter(model.id.in_(set(ids)))}
+
+def _bulk_response(results):
+    """200 when every item succeeded, 207 when some failed, 400 when none did."""
+    results.sort(key=lambda r: r['index'])
+    failed = sum(1 for r in results if not r['success'])
+    status = 200 if not failed else (400 if failed == len(results) else 207)
+    body = {'success': not failed, 'succeeded': len(results) - failed, 'failed': failed, 'results': results}
+    return jsonify(body), status
+
+def _bulk_atomic():
+    # ?atomic=true: apply nothing unless every item is valid
+    return request.args.get('atomic', '').lower() in ('1', 'true', 'yes')
+
+def _validation_error(errors):
+    """400 with every problem in the payload; 'error' keeps the single-message shape clients read."""
+    return jsonify({'error': '; '.join(e['message'] for e in errors), 'errors': errors}), 400
+
 api = Blueprint('api', __name__)
 
 @api.route('/api/projects', methods=['GET'])
 def get_projects():
     """Get all projects"""
     try:
-        projects = Project.query.order_by(Project.created_at.desc()).all()
-        return jsonify([project.to_dict() for project in projects])
+        return _collection_response(Project.query, Project, Project.created_at.desc())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @api.route('/api/projects/best', methods=['GET'])
+@cached_response('projects')
 def get_best_projects():
     """Get only best projects"""
     try:
-        best_projects = Project.query.filter_by(best_project=True).order_by(Project.created_at.desc()).all()
-        return jsonify([project.to_dict() for project in best_projects])
+        return _filtered_list_response(Project.query.filter_by(best_project=True).order_by(Project.created_at.desc()), Project)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @api.route('/api/projects', methods=['POST'])
 @login_required
+@invalidates('projects')
 def create_project():
     """Create a new project"""
     try:
         data = request.get_json()
         
-        # Comprehensive validation
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
-        # Validate hero section
-        if not data.get('hero') or not isinstance(data['hero'], dict):
-            return jsonify({'error': 'Hero section is required and must be an object'}), 400
-        
-        hero = data['hero']
-        if not hero.get('subtitle') or not isinstance(hero['subtitle'], str):
-            return jsonify({'error': 'Hero subtitle is required and must be a string'}), 400
-        
-        if not hero.get('description') or not isinstance(hero['description'], str):
-            return jsonify({'error': 'Hero description is required and must be a string'}), 400
-        
-        if not hero.get('banner') or not isinstance(hero['banner'], str):
-            return jsonify({'error': 'Hero banner is required and must be a string'}), 400
-        
-        # Validate long description
-        if not data.get('longDescription') or not isinstance(data['longDescription'], str):
-            return jsonify({'error': 'Long description is required and must be a string'}), 400
-        
-        # Validate arrays
-        if not isinstance(data.get('gallery', []), list):
-            return jsonify({'error': 'Gallery must be an array'}), 400
-        
-        if not isinstance(data.get('features', []), list):
-            return jsonify({'error': 'Features must be an array'}), 400
-        
-        if not isinstance(data.get('team', []), list):
-            return jsonify({'error': 'Team must be an array'}), 400
-        
-        if not isinstance(data.get('timeline', []), list):
-            return jsonify({'error': 'Timeline must be an array'}), 400
-        
-        if not isinstance(data.get('testimonials', []), list):
-            return jsonify({'error': 'Testimonials must be an array'}), 400
-        
-        if not isinstance(data.get('technologies', []), list):
-            return jsonify({'error': 'Technologies must be an array'}), 400
-        
-        # Validate team members structure
-        for i, member in enumerate(data.get('team', [])):
-            if not isinstance(member, dict):
-                return jsonify({'error': f'Team member {i+1} must be an object'}), 400
-            if not member.get('name') or not isinstance(member['name'], str):
-                return jsonify({'error': f'Team member {i+1} name is required and must be a string'}), 400
-            if not member.get('role') or not isinstance(member['role'], str):
-                return jsonify({'error': f'Team member {i+1} role is required and must be a string'}), 400
-            if not member.get('avatar') or not isinstance(member['avatar'], str):
-                return jsonify({'error': f'Team member {i+1} avatar is required and must be a string'}), 400
-        
-        # Validate timeline items structure
-        for i, item in enumerate(data.get('timeline', [])):
-            if not isinstance(item, dict):
-                return jsonify({'error': f'Timeline item {i+1} must be an object'}), 400
-            if not item.get('phase') or not isinstance(item['phase'], str):
-                return jsonify({'error': f'Timeline item {i+1} phase is required and must be a string'}), 400
-            if not item.get('date') or not isinstance(item['date'], str):
-                return jsonify({'error': f'Timeline item {i+1} date is required and must be a string'}), 400
-        
-        # Validate testimonials structure
-        for i, testimonial in enumerate(data.get('testimonials', [])):
-            if not isinstance(testimonial, dict):
-                return jsonify({'error': f'Testimonial {i+1} must be an object'}), 400
-            if not testimonial.get('quote') or not isinstance(testimonial['quote'], str):
-                return jsonify({'error': f'Testimonial {i+1} quote is required and must be a string'}), 400
-            if not testimonial.get('author') or not isinstance(testimonial['author'], str):
-                return jsonify({'error': f'Testimonial {i+1} author is required and must be a string'}), 400
+        errors = Project.SCHEMA.errors(data)
+        if errors:
+            return _validation_error(errors)
         
         # Check best project limit
         if data.get('bestProject'):
@@ -216,6 +351,7 @@ def create_project():
 
 @api.route('/api/projects/<int:project_id>', methods=['PUT'])
 @login_required
+@invalidates('projects')
 def update_project(project_id):
     """Update an existing project"""
     try:
@@ -225,96 +361,32 @@ def update_project(project_id):
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
+        errors = Project.SCHEMA.errors(data, partial=True)
+        if errors:
+            return _validation_error(errors)
+        
         # Check best project limit if setting to true
         if data.get('bestProject') and not project.best_project:
             best_projects_count = Project.query.filter_by(best_project=True).count()
             if best_projects_count >= 4:
                 return jsonify({'error': 'Maximum of 4 best projects allowed'}), 400
         
-        # Update fields with validation
-        if 'hero' in data:
-            if not isinstance(data['hero'], dict):
-                return jsonify({'error': 'Hero must be an object'}), 400
-            
-            if 'subtitle' in data['hero']:
-                if not isinstance(data['hero']['subtitle'], str):
-                    return jsonify({'error': 'Hero subtitle must be a string'}), 400
-                project.hero_subtitle = data['hero']['subtitle']
-            
-            if 'description' in data['hero']:
-                if not isinstance(data['hero']['description'], str):
-                    return jsonify({'error': 'Hero description must be a string'}), 400
-                project.hero_description = data['hero']['description']
-            
-            if 'banner' in data['hero']:
-                if not isinstance(data['hero']['banner'], str):
-                    return jsonify({'error': 'Hero banner must be a string'}), 400
-                project.hero_banner = data['hero']['banner']
-        
-        if 'gallery' in data:
-            if not isinstance(data['gallery'], list):
-                return jsonify({'error': 'Gallery must be an array'}), 400
-            project.gallery = json.dumps(data['gallery'])
-        
-        if 'features' in data:
-            if not isinstance(data['features'], list):
-                return jsonify({'error': 'Features must be an array'}), 400
-            project.features = json.dumps(data['features'])
-        
-        if 'team' in data:
-            if not isinstance(data['team'], list):
-                return jsonify({'error': 'Team must be an array'}), 400
-            # Validate team structure
-            for i, member in enumerate(data['team']):
-                if not isinstance(member, dict):
-                    return jsonify({'error': f'Team member {i+1} must be an object'}), 400
-                if not member.get('name') or not isinstance(member['name'], str):
-                    return jsonify({'error': f'Team member {i+1} name is required and must be a string'}), 400
-                if not member.get('role') or not isinstance(member['role'], str):
-                    return jsonify({'error': f'Team member {i+1} role is required and must be a string'}), 400
-                if not member.get('avatar') or not isinstance(member['avatar'], str):
-                    return jsonify({'error': f'Team member {i+1} avatar is required and must be a string'}), 400
-            project.team = json.dumps(data['team'])
-        
-        if 'timeline' in data:
-            if not isinstance(data['timeline'], list):
-                return jsonify({'error': 'Timeline must be an array'}), 400
-            # Validate timeline structure
-            for i, item in enumerate(data['timeline']):
-                if not isinstance(item, dict):
-                    return jsonify({'error': f'Timeline item {i+1} must be an object'}), 400
-                if not item.get('phase') or not isinstance(item['phase'], str):
-                    return jsonify({'error': f'Timeline item {i+1} phase is required and must be a string'}), 400
-                if not item.get('date') or not isinstance(item['date'], str):
-                    return jsonify({'error': f'Timeline item {i+1} date is required and must be a string'}), 400
-            project.timeline = json.dumps(data['timeline'])
-        
-        if 'testimonials' in data:
-            if not isinstance(data['testimonials'], list):
-                return jsonify({'error': 'Testimonials must be an array'}), 400
-            # Validate testimonials structure
-            for i, testimonial in enumerate(data['testimonials']):
-                if not isinstance(testimonial, dict):
-                    return jsonify({'error': f'Testimonial {i+1} must be an object'}), 400
-                if not testimonial.get('quote') or not isinstance(testimonial['quote'], str):
-                    return jsonify({'error': f'Testimonial {i+1} quote is required and must be a string'}), 400
-                if not testimonial.get('author') or not isinstance(testimonial['author'], str):
-                    return jsonify({'error': f'Testimonial {i+1} author is required and must be a string'}), 400
-            project.testimonials = json.dumps(data['testimonials'])
+        hero = data.get('hero', {})
+        if 'subtitle' in hero:
+            project.hero_subtitle = hero['subtitle']
+        if 'description' in hero:
+            project.hero_description = hero['description']
+        if 'banner' in hero:
+            project.hero_banner = hero['banner']
         
-        if 'technologies' in data:
-            if not isinstance(data['technologies'], list):
-                return jsonify({'error': 'Technologies must be an array'}), 400
-            project.technologies = json.dumps(data['technologies'])
+        for key in ('gallery', 'features', 'team', 'timeline', 'testimonials', 'technologies'):
+            if key in data:
+                setattr(project, key, json.dumps(data[key]))
         
         if 'longDescription' in data:
-            if not isinstance(data['longDescription'], str):
-                return jsonify({'error': 'Long description must be a string'}), 400
             project.long_description = data['longDescription']
         
         if 'bestProject' in data:
-            if not isinstance(data['bestProject'], bool):
-                return jsonify({'error': 'Best project must be a boolean'}), 400
             project.best_project = data['bestProject']
         
         db.session.commit()
@@ -325,6 +397,7 @@ def update_project(project_id):
 
 @api.route('/api/projects/<int:project_id>', methods=['DELETE'])
 @login_required
+@invalidates('projects')
 def delete_project(project_id):
     """Delete a project"""
     try:
@@ -340,8 +413,9 @@ def delete_project(project_id):
 def get_project(project_id):
     """Get a specific project"""
     try:
-        project = Project.query.get_or_404(project_id)
-        return jsonify(project.to_dict())
+        return _detail_response(Project, project_id, 'Project not found')
+    except FieldSelectionError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -350,86 +424,33 @@ def get_project(project_id):
 def get_blog_posts():
     """Get all blog posts"""
     try:
-        posts = BlogPost.query.order_by(BlogPost.created_at.desc()).all()
-        return jsonify([post.to_dict() for post in posts])
+        return _collection_response(BlogPost.query, BlogPost, BlogPost.created_at.desc())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @api.route('/api/blog-posts/featured', methods=['GET'])
+@cached_response('blog_posts')
 def get_featured_blog_posts():
     """Get only featured blog posts"""
     try:
-        featured_posts = BlogPost.query.filter_by(featured=True).order_by(BlogPost.created_at.desc()).all()
-        return jsonify([post.to_dict() for post in featured_posts])
+        return _filtered_list_response(BlogPost.query.filter_by(featured=True).order_by(BlogPost.created_at.desc()), BlogPost)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @api.route('/api/blog-posts', methods=['POST'])
 @login_required
+@invalidates('blog_posts')
 def create_blog_post():
     """Create a new blog post"""
     try:
         data = request.get_json()
         
-        # Comprehensive validation
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
-        # Validate required fields
-        if not data.get('title') or not isinstance(data['title'], str):
-            return jsonify({'error': 'Title is required and must be a string'}), 400
-        
-        if not data.get('excerpt') or not isinstance(data['excerpt'], str):
-            return jsonify({'error': 'Excerpt is required and must be a string'}), 400
-        
-        # Validate author object
-        if not data.get('author') or not isinstance(data['author'], dict):
-            return jsonify({'error': 'Author is required and must be an object'}), 400
-        
-        author = data['author']
-        if not author.get('name') or not isinstance(author['name'], str):
-            return jsonify({'error': 'Author name is required and must be a string'}), 400
-        
-        if not author.get('avatar') or not isinstance(author['avatar'], str):
-            return jsonify({'error': 'Author avatar is required and must be a string'}), 400
-        
-        if not author.get('role') or not isinstance(author['role'], str):
-            return jsonify({'error': 'Author role is required and must be a string'}), 400
-        
-        if not author.get('bio') or not isinstance(author['bio'], str):
-            return jsonify({'error': 'Author bio is required and must be a string'}), 400
-        
-        # Validate other required fields
-        if not data.get('readTime') or not isinstance(data['readTime'], str):
-            return jsonify({'error': 'Read time is required and must be a string'}), 400
-        
-        if not data.get('publishDate') or not isinstance(data['publishDate'], str):
-            return jsonify({'error': 'Publish date is required and must be a string'}), 400
-        
-        if not data.get('category') or not isinstance(data['category'], str):
-            return jsonify({'error': 'Category is required and must be a string'}), 400
-        
-        if not data.get('image') or not isinstance(data['image'], str):
-            return jsonify({'error': 'Image is required and must be a string'}), 400
-        
-        if not data.get('intro') or not isinstance(data['intro'], str):
-            return jsonify({'error': 'Intro is required and must be a string'}), 400
-        
-        if not data.get('implementation') or not isinstance(data['implementation'], str):
-            return jsonify({'error': 'Implementation is required and must be a string'}), 400
-        
-        if not data.get('conclusion') or not isinstance(data['conclusion'], str):
-            return jsonify({'error': 'Conclusion is required and must be a string'}), 400
-        
-        # Validate arrays
-        if not isinstance(data.get('tags', []), list):
-            return jsonify({'error': 'Tags must be an array'}), 400
-        
-        if not isinstance(data.get('keyConcepts', []), list):
-            return jsonify({'error': 'Key concepts must be an array'}), 400
-        
-        if not isinstance(data.get('bestPractices', []), list):
-            return jsonify({'error': 'Best practices must be an array'}), 400
+        errors = BlogPost.SCHEMA.errors(data)
+        if errors:
+            return _validation_error(errors)
         
         # Create blog post
         blog_post = BlogPost.from_dict(data)
@@ -443,6 +464,7 @@ def create_blog_post():
 
 @api.route('/api/blog-posts/<int:post_id>', methods=['PUT'])
 @login_required
+@invalidates('blog_posts')
 def update_blog_post(post_id):
     """Update an existing blog post"""
     try:
@@ -452,96 +474,26 @@ def update_blog_post(post_id):
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
-        # Update fields with validation
-        if 'title' in data:
-            if not isinstance(data['title'], str):
-                return jsonify({'error': 'Title must be a string'}), 400
-            blog_post.title = data['title']
-        
-        if 'excerpt' in data:
-            if not isinstance(data['excerpt'], str):
-                return jsonify({'error': 'Excerpt must be a string'}), 400
-            blog_post.excerpt = data['excerpt']
-        
-        if 'author' in data:
-            if not isinstance(data['author'], dict):
-                return jsonify({'error': 'Author must be an object'}), 400
-            
-            author = data['author']
-            if 'name' in author:
-                if not isinstance(author['name'], str):
-                    return jsonify({'error': 'Author name must be a string'}), 400
-                blog_post.author_name = author['name']
-            
-            if 'avatar' in author:
-                if not isinstance(author['avatar'], str):
-                    return jsonify({'error': 'Author avatar must be a string'}), 400
-                blog_post.author_avatar = author['avatar']
-            
-            if 'role' in author:
-                if not isinstance(author['role'], str):
-                    return jsonify({'error': 'Author role must be a string'}), 400
-                blog_post.author_role = author['role']
-            
-            if 'bio' in author:
-                if not isinstance(author['bio'], str):
-                    return jsonify({'error': 'Author bio must be a string'}), 400
-                blog_post.author_bio = author['bio']
-        
-        if 'readTime' in data:
-            if not isinstance(data['readTime'], str):
-                return jsonify({'error': 'Read time must be a string'}), 400
-            blog_post.read_time = data['readTime']
+        errors = BlogPost.SCHEMA.errors(data, partial=True)
+        if errors:
+            return _validation_error(errors)
         
-        if 'publishDate' in data:
-            if not isinstance(data['publishDate'], str):
-                return jsonify({'error': 'Publish date must be a string'}), 400
-            blog_post.publish_date = data['publishDate']
+        author = data.get('author', {})
+        for key, column in (('name', 'author_name'), ('avatar', 'author_avatar'),
+                            ('role', 'author_role'), ('bio', 'author_bio')):
+            if key in author:
+                setattr(blog_post, column, author[key])
         
-        if 'category' in data:
-            if not isinstance(data['category'], str):
-                return jsonify({'error': 'Category must be a string'}), 400
-            blog_post.category = data['category']
+        for key, column in (('title', 'title'), ('excerpt', 'excerpt'), ('readTime', 'read_time'),
+                            ('publishDate', 'publish_date'), ('category', 'category'), ('image', 'image'),
+                            ('featured', 'featured'), ('intro', 'intro'),
+                            ('implementation', 'implementation'), ('conclusion', 'conclusion')):
+            if key in data:
+                setattr(blog_post, column, data[key])
         
-        if 'image' in data:
-            if not isinstance(data['image'], str):
-                return jsonify({'error': 'Image must be a string'}), 400
-            blog_post.image = data['image']
-        
-        if 'tags' in data:
-            if not isinstance(data['tags'], list):
-                return jsonify({'error': 'Tags must be an array'}), 400
-            blog_post.tags = json.dumps(data['tags'])
-        
-        if 'featured' in data:
-            if not isinstance(data['featured'], bool):
-                return jsonify({'error': 'Featured must be a boolean'}), 400
-            blog_post.featured = data['featured']
-        
-        if 'intro' in data:
-            if not isinstance(data['intro'], str):
-                return jsonify({'error': 'Intro must be a string'}), 400
-            blog_post.intro = data['intro']
-        
-        if 'keyConcepts' in data:
-            if not isinstance(data['keyConcepts'], list):
-                return jsonify({'error': 'Key concepts must be an array'}), 400
-            blog_post.key_concepts = json.dumps(data['keyConcepts'])
-        
-        if 'implementation' in data:
-            if not isinstance(data['implementation'], str):
-                return jsonify({'error': 'Implementation must be a string'}), 400
-            blog_post.implementation = data['implementation']
-        
-        if 'bestPractices' in data:
-            if not isinstance(data['bestPractices'], list):
-                return jsonify({'error': 'Best practices must be an array'}), 400
-            blog_post.best_practices = json.dumps(data['bestPractices'])
-        
-        if 'conclusion' in data:
-            if not isinstance(data['conclusion'], str):
-                return jsonify({'error': 'Conclusion must be a string'}), 400
-            blog_post.conclusion = data['conclusion']
+        for key, column in (('tags', 'tags'), ('keyConcepts', 'key_concepts'), ('bestPractices', 'best_practices')):
+            if key in data:
+                setattr(blog_post, column, json.dumps(data[key]))
         
         db.session.commit()
         return jsonify({'success': True, 'message': 'Blog post updated successfully'})
@@ -551,6 +503,7 @@ def update_blog_post(post_id):
 
 @api.route('/api/blog-posts/<int:post_id>', methods=['DELETE'])
 @login_required
+@invalidates('blog_posts')
 def delete_blog_post(post_id):
     """Delete a blog post"""
     try:
@@ -566,8 +519,9 @@ def delete_blog_post(post_id):
 def get_blog_post(post_id):
     """Get a specific blog post"""
     try:
-        blog_post = BlogPost.query.get_or_404(post_id)
-        return jsonify(blog_post.to_dict())
+        return _detail_response(BlogPost, post_id, 'Blog post not found')
+    except FieldSelectionError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -576,22 +530,22 @@ def get_blog_post(post_id):
 def get_testimonials():
     """Get all testimonials"""
     try:
-        testimonials = Testimonial.query.order_by(Testimonial.created_at.desc()).all()
-        return jsonify([testimonial.to_dict() for testimonial in testimonials])
+        return _collection_response(Testimonial.query, Testimonial, Testimonial.created_at.desc())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @api.route('/api/testimonials/featured', methods=['GET'])
+@cached_response('testimonials')
 def get_featured_testimonials():
     """Get only featured testimonials"""
     try:
-        featured_testimonials = Testimonial.query.filter_by(featured=True).order_by(Testimonial.created_at.desc()).all()
-        return jsonify([testimonial.to_dict() for testimonial in featured_testimonials])
+        return _filtered_list_response(Testimonial.query.filter_by(featured=True).order_by(Testimonial.created_at.desc()), Testimonial)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @api.route('/api/testimonials', methods=['POST'])
 @login_required
+@invalidates('testimonials')
 def create_testimonial():
     """Create a new testimonial"""
     try:
@@ -638,6 +592,7 @@ def create_testimonial():
 
 @api.route('/api/testimonials/<int:testimonial_id>', methods=['PUT'])
 @login_required
+@invalidates('testimonials')
 def update_testimonial(testimonial_id):
     """Update an existing testimonial"""
     try:
@@ -703,6 +658,7 @@ def update_testimonial(testimonial_id):
 
 @api.route('/api/testimonials/<int:testimonial_id>', methods=['DELETE'])
 @login_required
+@invalidates('testimonials')
 def delete_testimonial(testimonial_id):
     """Delete a testimonial"""
     try:
@@ -718,23 +674,25 @@ def delete_testimonial(testimonial_id):
 def get_testimonial(testimonial_id):
     """Get a specific testimonial"""
     try:
-        testimonial = Testimonial.query.get_or_404(testimonial_id)
-        return jsonify(testimonial.to_dict())
+        return _detail_response(Testimonial, testimonial_id, 'Testimonial not found')
+    except FieldSelectionError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 # Team Routes
 @api.route('/api/teams', methods=['GET'])
+@cached_response('teams')
 def get_teams():
     """Get all team members"""
     try:
-        teams = Team.query.all()
-        return jsonify([team.to_dict() for team in teams])
+        return _collection_response(Team.query, Team)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @api.route('/api/teams', methods=['POST'])
 @login_required
+@invalidates('teams')
 def create_team():
     """Create a new team member"""
     try:
@@ -779,6 +737,7 @@ def create_team():
 
 @api.route('/api/teams/<int:team_id>', methods=['PUT'])
 @login_required
+@invalidates('teams')
 def update_team(team_id):
     """Update a team member"""
     try:
@@ -846,6 +805,7 @@ def update_team(team_id):
 
 @api.route('/api/teams/<int:team_id>', methods=['DELETE'])
 @login_required
+@invalidates('teams')
 def delete_team(team_id):
     """Delete a team member"""
     try:
@@ -864,11 +824,9 @@ def delete_team(team_id):
 def get_team(team_id):
     """Get a specific team member"""
     try:
-        team = Team.query.get(team_id)
-        if not team:
-            return jsonify({'error': 'Team member not found'}), 404
-
-        return jsonify(team.to_dict())
+        return _detail_response(Team, team_id, 'Team member not found')
+    except FieldSelectionError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -877,22 +835,45 @@ def get_team(team_id):
 def get_careers():
     """Get all careers"""
     try:
-        careers = Career.query.all()
-        return jsonify([career.to_dict() for career in careers])
+        return _collection_response(Career.query, Career)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @api.route('/api/careers/active', methods=['GET'])
+@cached_response('careers')
 def get_active_careers():
     """Get active careers only"""
     try:
-        active_careers = Career.query.filter_by(is_active=True).all()
-        return jsonify([career.to_dict() for career in active_careers])
+        return _filtered_list_response(Career.query.filter_by(is_active=True), Career)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def _career_error(data):
+    """Validation message for a career payload, or None when it is valid"""
+    # Validate required fields
+    required_fields = ['title', 'company', 'location', 'type', 'department', 'description']
+    for field in required_fields:
+        if not data.get(field):
+            return f'{field} is required'
+
+    # Validate arrays
+    array_fields = ['requirements', 'responsibilities', 'benefits', 'skills_required']
+    for field in array_fields:
+        if field in data and not isinstance(data[field], list):
+            return f'{field} must be an array'
+
+    # Validate date format
+    if data.get('application_deadline'):
+        try:
+            from datetime import datetime
+            datetime.strptime(data['application_deadline'], '%Y-%m-%d')
+        except:
+            return 'application_deadline must be in YYYY-MM-DD format'
+    return None
+
 @api.route('/api/careers', methods=['POST'])
 @login_required
+@invalidates('careers')
 def create_career():
     """Create a new career"""
     try:
@@ -900,25 +881,9 @@ def create_career():
         if not data:
             return jsonify({'error': 'No data provided'}), 400
 
-        # Validate required fields
-        required_fields = ['title', 'company', 'location', 'type', 'department', 'description']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({'error': f'{field} is required'}), 400
-
-        # Validate arrays
-        array_fields = ['requirements', 'responsibilities', 'benefits', 'skills_required']
-        for field in array_fields:
-            if field in data and not isinstance(data[field], list):
-                return jsonify({'error': f'{field} must be an array'}), 400
-
-        # Validate date format
-        if data.get('application_deadline'):
-            try:
-                from datetime import datetime
-                datetime.strptime(data['application_deadline'], '%Y-%m-%d')
-            except:
-                return jsonify({'error': 'application_deadline must be in YYYY-MM-DD format'}), 400
+        error = _career_error(data)
+        if error:
+            return jsonify({'error': error}), 400
 
         career = Career.from_dict(data)
         db.session.add(career)
@@ -929,8 +894,45 @@ def create_career():
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+@api.route('/api/careers/bulk', methods=['POST'])
+@login_required
+@invalidates('careers')
+def bulk_create_careers():
+    """Create many careers in one transaction: {"items": [career, ...]}"""
+    try:
+        items, error = _bulk_list(request.get_json(silent=True), 'items')
+        if error:
+            return jsonify({'error': error}), 400
+
+        results, rows, row_indexes = [], [], []
+        for index, item in enumerate(items):
+            error = _career_error(item) if isinstance(item, dict) else 'item must be an object'
+            if error:
+                results.append({'index': index, 'success': False, 'error': error})
+            else:
+                rows.append(Career.columns_from_dict(item))
+                row_indexes.append(index)
+        if results and _bulk_atomic():
+            return _bulk_response(results + [
+                {'index': index, 'success': False, 'error': 'Not created: batch contains invalid items'}
+                for index in row_indexes
+            ])
+
+        if rows:
+            # One executemany INSERT ... RETURNING for the whole batch
+            ids = db.session.execute(
+                insert(Career).returning(Career.id, sort_by_parameter_order=True), rows
+            ).scalars().all()
+            db.session.commit()
+            results.extend({'index': index, 'success': True, 'id': new_id} for index, new_id in zip(row_indexes, ids))
+        return _bulk_response(results)
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
 @api.route('/api/careers/<int:career_id>', methods=['PUT'])
 @login_required
+@invalidates('careers')
 def update_career(career_id):
     """Update a career"""
     try:
@@ -942,25 +944,9 @@ def update_career(career_id):
         if not data:
             return jsonify({'error': 'No data provided'}), 400
 
-        # Validate required fields
-        required_fields = ['title', 'company', 'location', 'type', 'department', 'description']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({'error': f'{field} is required'}), 400
-
-        # Validate arrays
-        array_fields = ['requirements', 'responsibilities', 'benefits', 'skills_required']
-        for field in array_fields:
-            if field in data and not isinstance(data[field], list):
-                return jsonify({'error': f'{field} must be an array'}), 400
-
-        # Validate date format
-        if data.get('application_deadline'):
-            try:
-                from datetime import datetime
-                datetime.strptime(data['application_deadline'], '%Y-%m-%d')
-            except:
-                return jsonify({'error': 'application_deadline must be in YYYY-MM-DD format'}), 400
+        error = _career_error(data)
+        if error:
+            return jsonify({'error': error}), 400
 
         # Update fields
         career.title = data['title']
@@ -992,6 +978,7 @@ def update_career(career_id):
 
 @api.route('/api/careers/<int:career_id>', methods=['DELETE'])
 @login_required
+@invalidates('careers')
 def delete_career(career_id):
     """Delete a career"""
     try:
@@ -1010,11 +997,9 @@ def delete_career(career_id):
 def get_career(career_id):
     """Get a specific career"""
     try:
-        career = Career.query.get(career_id)
-        if not career:
-            return jsonify({'error': 'Career not found'}), 404
-
-        return jsonify(career.to_dict())
+        return _detail_response(Career, career_id, 'Career not found')
+    except FieldSelectionError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1025,11 +1010,10 @@ def get_questionnaires():
     """Get all questionnaires"""
     try:
         job_id = request.args.get('jobId')
+        query = Questionnaire.query
         if job_id:
-            questionnaires = Questionnaire.query.filter_by(job_id=job_id).order_by(Questionnaire.created_at.desc()).all()
-        else:
-            questionnaires = Questionnaire.query.order_by(Questionnaire.created_at.desc()).all()
-        return jsonify([questionnaire.to_dict() for questionnaire in questionnaires])
+            query = query.filter_by(job_id=job_id)
+        return _collection_response(query, Questionnaire, Questionnaire.created_at.desc())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1037,8 +1021,7 @@ def get_questionnaires():
 def get_active_questionnaires():
     """Get only active questionnaires"""
     try:
-        questionnaires = Questionnaire.query.filter_by(is_active=True).order_by(Questionnaire.created_at.desc()).all()
-        return jsonify([questionnaire.to_dict() for questionnaire in questionnaires])
+        return _filtered_list_response(Questionnaire.query.filter_by(is_active=True).order_by(Questionnaire.created_at.desc()), Questionnaire)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1051,110 +1034,11 @@ def create_questionnaire():
         if not data:
             return jsonify({'error': 'No data provided'}), 400
 
-        # Validate required fields
-        if not data.get('jobId') or not isinstance(data['jobId'], str) or data['jobId'].strip() == '':
-            return jsonify({'error': 'Job ID is required and must be a string'}), 400
-
-        if not data.get('title') or not isinstance(data['title'], str) or data['title'].strip() == '':
-            return jsonify({'error': 'Title is required and must be a string'}), 400
+        errors = Questionnaire.SCHEMA.errors(data)
+        if errors:
+            return _validation_error(errors)
 
-        if not data.get('description') or not isinstance(data['description'], str) or data['description'].strip() == '':
-            return jsonify({'error': 'Description is required and must be a string'}), 400
-
-        # Validate questions array
-        if not isinstance(data.get('questions', []), list) or len(data['questions']) == 0:
-            return jsonify({'error': 'At least one question is required'}), 400
-
-        # Validate each question
-        for i, question in enumerate(data['questions']):
-            if not isinstance(question, dict):
-                return jsonify({'error': f'Question {i+1} must be an object'}), 400
-
-            # Required question fields
-            if not question.get('id') or not isinstance(question['id'], str):
-                return jsonify({'error': f'Question {i+1} ID is required and must be a string'}), 400
-
-            if not question.get('type') or not isinstance(question['type'], str):
-                return jsonify({'error': f'Question {i+1} type is required and must be a string'}), 400
-
-            if not question.get('label') or not isinstance(question['label'], str):
-                return jsonify({'error': f'Question {i+1} label is required and must be a string'}), 400
-
-            # Validate question type
-            valid_types = ['text', 'textarea', 'select', 'radio', 'checkbox', 'file', 'email', 'phone', 'number', 'date']
-            if question['type'] not in valid_types:
-                return jsonify({'error': f'Question {i+1} type must be one of: {", ".join(valid_types)}'}), 400
-
-            # Validate required field
-            if not isinstance(question.get('required', False), bool):
-                return jsonify({'error': f'Question {i+1} required field must be a boolean'}), 400
-
-            # Validate order
-            if not isinstance(question.get('order', 0), int):
-                return jsonify({'error': f'Question {i+1} order must be an integer'}), 400
-
-            # Validate options for select/radio/checkbox types
-            if question['type'] in ['select', 'radio', 'checkbox']:
-                if not isinstance(question.get('options', []), list) or len(question['options']) == 0:
-                    return jsonify({'error': f'Question {i+1} ({question["type"]}) requires at least one option'}), 400
-                
-                # Validate each option
-                for j, option in enumerate(question['options']):
-                    if not isinstance(option, str) or option.strip() == '':
-                        return jsonify({'error': f'Question {i+1} option {j+1} must be a non-empty string'}), 400
-
-            # Validate validation object
-            if 'validation' in question:
-                if not isinstance(question['validation'], dict):
-                    return jsonify({'error': f'Question {i+1} validation must be an object'}), 400
-
-                validation = question['validation']
-
-                # Validate text input restrictions
-                if question['type'] in ['text', 'textarea', 'email']:
-                    if 'minLength' in validation and (not isinstance(validation['minLength'], int) or validation['minLength'] < 0):
-                        return jsonify({'error': f'Question {i+1} minLength must be a non-negative integer'}), 400
-                    
-                    if 'maxLength' in validation and (not isinstance(validation['maxLength'], int) or validation['maxLength'] <= 0):
-                        return jsonify({'error': f'Question {i+1} maxLength must be a positive integer'}), 400
-                    
-                    if 'minLength' in validation and 'maxLength' in validation and validation['minLength'] > validation['maxLength']:
-                        return jsonify({'error': f'Question {i+1} minLength cannot be greater than maxLength'}), 400
-
-                # Validate number input restrictions
-                if question['type'] == 'number':
-                    if 'min' in validation and not isinstance(validation['min'], (int, float)):
-                        return jsonify({'error': f'Question {i+1} min must be a number'}), 400
-                    
-                    if 'max' in validation and not isinstance(validation['max'], (int, float)):
-                        return jsonify({'error': f'Question {i+1} max must be a number'}), 400
-
-                # Validate file upload restrictions
-                if question['type'] == 'file':
-                    if 'allowedFileTypes' in validation:
-                        if not isinstance(validation['allowedFileTypes'], list) or len(validation['allowedFileTypes']) == 0:
-                            return jsonify({'error': f'Question {i+1} allowedFileTypes must be a non-empty array'}), 400
-                        
-                        for file_type in validation['allowedFileTypes']:
-                            if not isinstance(file_type, str) or file_type.strip() == '':
-                                return jsonify({'error': f'Question {i+1} allowedFileTypes must contain non-empty strings'}), 400
-                    
-                    if 'maxFileSize' in validation and (not isinstance(validation['maxFileSize'], int) or validation['maxFileSize'] <= 0 or validation['maxFileSize'] > 50 * 1024 * 1024):
-                        return jsonify({'error': f'Question {i+1} maxFileSize must be between 1 byte and 50MB'}), 400
-                    
-                    if 'maxFiles' in validation and (not isinstance(validation['maxFiles'], int) or validation['maxFiles'] <= 0 or validation['maxFiles'] > 10):
-                        return jsonify({'error': f'Question {i+1} maxFiles must be between 1 and 10'}), 400
-
-        # Set default validation values
-        for question in data['questions']:
-            if question['type'] in ['text', 'textarea', 'email'] and 'validation' not in question:
-                question['validation'] = {}
-                if question['type'] == 'text':
-                    question['validation']['maxLength'] = 255
-                elif question['type'] == 'textarea':
-                    question['validation']['maxLength'] = 2000
-                elif question['type'] == 'email':
-                    question['validation']['maxLength'] = 254
+        Questionnaire.apply_default_validation(data['questions'])
 
         questionnaire = Questionnaire.from_dict(data)
         db.session.add(questionnaire)
@@ -1178,110 +1062,12 @@ def update_questionnaire(questionnaire_id):
         if not data:
             return jsonify({'error': 'No data provided'}), 400
 
-        # Validate required fields
-        if not data.get('jobId') or not isinstance(data['jobId'], str) or data['jobId'].strip() == '':
-            return jsonify({'error': 'Job ID is required and must be a string'}), 400
-
-        if not data.get('title') or not isinstance(data['title'], str) or data['title'].strip() == '':
-            return jsonify({'error': 'Title is required and must be a string'}), 400
+        errors = Questionnaire.SCHEMA.errors(data, partial=True)
+        if errors:
+            return _validation_error(errors)
 
-        if not data.get('description') or not isinstance(data['description'], str) or data['description'].strip() == '':
-            return jsonify({'error': 'Description is required and must be a string'}), 400
-
-        # Validate questions array
-        if not isinstance(data.get('questions', []), list) or len(data['questions']) == 0:
-            return jsonify({'error': 'At least one question is required'}), 400
-
-        # Validate each question (same validation as create)
-        for i, question in enumerate(data['questions']):
-            if not isinstance(question, dict):
-                return jsonify({'error': f'Question {i+1} must be an object'}), 400
-
-            # Required question fields
-            if not question.get('id') or not isinstance(question['id'], str):
-                return jsonify({'error': f'Question {i+1} ID is required and must be a string'}), 400
-
-            if not question.get('type') or not isinstance(question['type'], str):
-                return jsonify({'error': f'Question {i+1} type is required and must be a string'}), 400
-
-            if not question.get('label') or not isinstance(question['label'], str):
-                return jsonify({'error': f'Question {i+1} label is required and must be a string'}), 400
-
-            # Validate question type
-            valid_types = ['text', 'textarea', 'select', 'radio', 'checkbox', 'file', 'email', 'phone', 'number', 'date']
-            if question['type'] not in valid_types:
-                return jsonify({'error': f'Question {i+1} type must be one of: {", ".join(valid_types)}'}), 400
-
-            # Validate required field
-            if not isinstance(question.get('required', False), bool):
-                return jsonify({'error': f'Question {i+1} required field must be a boolean'}), 400
-
-            # Validate order
-            if not isinstance(question.get('order', 0), int):
-                return jsonify({'error': f'Question {i+1} order must be an integer'}), 400
-
-            # Validate options for select/radio/checkbox types
-            if question['type'] in ['select', 'radio', 'checkbox']:
-                if not isinstance(question.get('options', []), list) or len(question['options']) == 0:
-                    return jsonify({'error': f'Question {i+1} ({question["type"]}) requires at least one option'}), 400
-                
-                # Validate each option
-                for j, option in enumerate(question['options']):
-                    if not isinstance(option, str) or option.strip() == '':
-                        return jsonify({'error': f'Question {i+1} option {j+1} must be a non-empty string'}), 400
-
-            # Validate validation object (same as create)
-            if 'validation' in question:
-                if not isinstance(question['validation'], dict):
-                    return jsonify({'error': f'Question {i+1} validation must be an object'}), 400
-
-                validation = question['validation']
-
-                # Validate text input restrictions
-                if question['type'] in ['text', 'textarea', 'email']:
-                    if 'minLength' in validation and (not isinstance(validation['minLength'], int) or validation['minLength'] < 0):
-                        return jsonify({'error': f'Question {i+1} minLength must be a non-negative integer'}), 400
-                    
-                    if 'maxLength' in validation and (not isinstance(validation['maxLength'], int) or validation['maxLength'] <= 0):
-                        return jsonify({'error': f'Question {i+1} maxLength must be a positive integer'}), 400
-                    
-                    if 'minLength' in validation and 'maxLength' in validation and validation['minLength'] > validation['maxLength']:
-                        return jsonify({'error': f'Question {i+1} minLength cannot be greater than maxLength'}), 400
-
-                # Validate number input restrictions
-                if question['type'] == 'number':
-                    if 'min' in validation and not isinstance(validation['min'], (int, float)):
-                        return jsonify({'error': f'Question {i+1} min must be a number'}), 400
-                    
-                    if 'max' in validation and not isinstance(validation['max'], (int, float)):
-                        return jsonify({'error': f'Question {i+1} max must be a number'}), 400
-
-                # Validate file upload restrictions
-                if question['type'] == 'file':
-                    if 'allowedFileTypes' in validation:
-                        if not isinstance(validation['allowedFileTypes'], list) or len(validation['allowedFileTypes']) == 0:
-                            return jsonify({'error': f'Question {i+1} allowedFileTypes must be a non-empty array'}), 400
-                        
-                        for file_type in validation['allowedFileTypes']:
-                            if not isinstance(file_type, str) or file_type.strip() == '':
-                                return jsonify({'error': f'Question {i+1} allowedFileTypes must contain non-empty strings'}), 400
-                    
-                    if 'maxFileSize' in validation and (not isinstance(validation['maxFileSize'], int) or validation['maxFileSize'] <= 0 or validation['maxFileSize'] > 50 * 1024 * 1024):
-                        return jsonify({'error': f'Question {i+1} maxFileSize must be between 1 byte and 50MB'}), 400
-                    
-                    if 'maxFiles' in validation and (not isinstance(validation['maxFiles'], int) or validation['maxFiles'] <= 0 or validation['maxFiles'] > 10):
-                        return jsonify({'error': f'Question {i+1} maxFiles must be between 1 and 10'}), 400
-
-        # Set default validation values
-        for question in data['questions']:
-            if question['type'] in ['text', 'textarea', 'email'] and 'validation' not in question:
-                question['validation'] = {}
-                if question['type'] == 'text':
-                    question['validation']['maxLength'] = 255
-                elif question['type'] == 'textarea':
-                    question['validation']['maxLength'] = 2000
-                elif question['type'] == 'email':
-                    question['validation']['maxLength'] = 254
+        if 'questions' in data:
+            Questionnaire.apply_default_validation(data['questions'])
 
         # Update questionnaire
         questionnaire.update_from_dict(data)
@@ -1312,11 +1098,9 @@ def delete_questionnaire(questionnaire_id):
 def get_questionnaire(questionnaire_id):
     """Get a specific questionnaire"""
     try:
-        questionnaire = Questionnaire.query.get(questionnaire_id)
-        if not questionnaire:
-            return jsonify({'error': 'Questionnaire not found'}), 404
-
-        return jsonify(questionnaire.to_dict())
+        return _detail_response(Questionnaire, questionnaire_id, 'Questionnaire not found')
+    except FieldSelectionError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1324,13 +1108,13 @@ def get_questionnaire(questionnaire_id):
 def get_contact_quotes():
     """Get all contact/project quotes"""
     try:
-        quotes = ContactQuote.query.order_by(ContactQuote.created_at.desc()).all()
-        return jsonify([q.to_dict() for q in quotes])
+        return _collection_response(ContactQuote.query, ContactQuote, ContactQuote.created_at.desc())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @api.route('/api/contact-quotes', methods=['POST'])
 @idempotent(ttl_seconds=600)
+@rate_limited('contact', email_field='email')
 def create_contact_quote():
     """Submit a new contact/project quote"""
     try:
@@ -1386,6 +1170,44 @@ def delete_contact_quote(quote_id):
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+@api.route('/api/contact-quotes/bulk', methods=['DELETE'])
+@login_required
+def bulk_delete_contact_quotes():
+    """Delete many quotes in one statement: {"ids": [...]}"""
+    try:
+        ids, error = _bulk_ids(request.get_json(silent=True))
+        if error:
+            return jsonify({'error': error}), 400
+        found = _existing_ids(ContactQuote, ids)
+        if found:
+            ContactQuote.query.filter(ContactQuote.id.in_(found)).delete(synchronize_session=False)
+            db.session.commit()
+        return _bulk_response([
+            {'index': index, 'id': quote_id, 'success': True} if quote_id in found
+            else {'index': index, 'id': quote_id, 'success': False, 'error': 'Quote not found'}
+            for index, quote_id in enumerate(ids)
+        ])
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/api/contact-quotes/export', methods=['GET'])
+@login_required
+def export_contact_quotes():
+    """Stream quotes as CSV or NDJSON (?format=), filtered by from and to"""
+    try:
+        fmt = parse_format(request.args)
+        query = filter_created_between(ContactQuote.query, ContactQuote, request.args).order_by(ContactQuote.id)
+    except ExportError as e:
+        return jsonify({'error': str(e)}), 400
+
+    fields = ('id', 'name', 'email', 'company', 'project_details', 'created_at')
+    records = (
+        dict(row._mapping, created_at=row.created_at.isoformat() if row.created_at else None)
+        for row in stream_rows(query.with_entities(*(getattr(ContactQuote, f) for f in fields)))
+    )
+    return export_response(fmt, 'contact-quotes', records, [(f, f) for f in fields])
+
 @api.route('/api/job-applications', methods=['GET'])
 def get_job_applications():
     try:
@@ -1396,13 +1218,13 @@ def get_job_applications():
             query = query.filter_by(job_id=job_id)
         if status:
             query = query.filter_by(status=status)
-        applications = query.order_by(JobApplication.created_at.desc()).all()
-        return jsonify([a.to_dict() for a in applications])
+        return _collection_response(query, JobApplication, JobApplication.created_at.desc())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @api.route('/api/job-applications', methods=['POST'])
 @idempotent(ttl_seconds=600)
+@rate_limited('jobapp', email_field='applicantEmail')
 def create_job_application():
     try:
         data = request.get_json()
@@ -1466,6 +1288,97 @@ def update_job_application(application_id):
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+@api.route('/api/job-applications/bulk', methods=['PATCH'])
+@login_required
+def bulk_update_job_applications():
+    """Update status/notes of many applications in one transaction.
+
+    Body is either {"items": [{"id", "status", "notes"}, ...]} or
+    {"ids": [...], "status": ..., "notes": ...} to apply one change to all.
+    """
+    try:
+        data = request.get_json(silent=True)
+        if isinstance(data, dict) and 'ids' in data and 'items' not in data:
+            ids, error = _bulk_ids(data)
+            if error:
+                return jsonify({'error': error}), 400
+            shared = {key: data[key] for key in ('status', 'notes') if key in data}
+            items = [dict(shared, id=application_id) for application_id in ids]
+        else:
+            items, error = _bulk_list(data, 'items')
+            if error:
+                return jsonify({'error': error}), 400
+
+        results, changes = [], []
+        for index, item in enumerate(items):
+            error = _application_change_error(item)
+            if error:
+                results.append({'index': index, 'id': item.get('id') if isinstance(item, dict) else None,
+                                'success': False, 'error': error})
+            else:
+                changes.append((index, item))
+
+        found = _existing_ids(JobApplication, [item['id'] for _, item in changes]) if changes else set()
+        rows = []
+        now = datetime.utcnow()
+        for index, item in changes:
+            if item['id'] not in found:
+                results.append({'index': index, 'id': item['id'], 'success': False, 'error': 'Application not found'})
+                continue
+            rows.append(dict({key: item[key] for key in ('status', 'notes') if key in item}, id=item['id'], updated_at=now))
+            results.append({'index': index, 'id': item['id'], 'success': True})
+        if _bulk_atomic() and len(rows) < len(items):
+            return _bulk_response([
+                r if not r['success'] else dict(r, success=False, error='Not updated: batch contains invalid items')
+                for r in results
+            ])
+
+        if rows:
+            # ORM bulk UPDATE by primary key: executemany, grouped by the keys each row sets
+            db.session.execute(update(JobApplication), rows)
+            db.session.commit()
+        return _bulk_response(results)
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+def _application_change_error(item):
+    """Validation message for one bulk application change, or None when it is valid"""
+    if not isinstance(item, dict):
+        return 'item must be an object'
+    if not isinstance(item.get('id'), int) or isinstance(item.get('id'), bool):
+        return 'id must be an integer'
+    if 'status' not in item and 'notes' not in item:
+        return 'status or notes is required'
+    if 'status' in item and (not isinstance(item['status'], str) or not item['status'].strip() or len(item['status']) > 50):
+        return 'status must be a non-empty string of at most 50 characters'
+    if 'notes' in item and item['notes'] is not None and not isinstance(item['notes'], str):
+        return 'notes must be a string'
+    return None
+
+@api.route('/api/job-applications/export', methods=['GET'])
+@login_required
+def export_job_applications():
+    """Stream applications as CSV or NDJSON (?format=), filtered by jobId, status, from and to"""
+    try:
+        fmt = parse_format(request.args)
+        query = JobApplication.query
+        if request.args.get('jobId'):
+            query = query.filter_by(job_id=request.args['jobId'])
+        if request.args.get('status'):
+            query = query.filter_by(status=request.args['status'])
+        query = filter_created_between(query, JobApplication, request.args).order_by(JobApplication.id)
+    except ExportError as e:
+        return jsonify({'error': str(e)}), 400
+
+    columns = None
+    if fmt == 'csv':
+        # The CSV header needs every question up front: one light pass over responses only
+        columns = application_columns(response_columns(stream_rows(query.with_entities(JobApplication.responses))))
+    rows = stream_rows(query.with_entities(*JobApplication.__table__.columns))
+    records = (flatten_application(row) for row in rows)
+    return export_response(fmt, 'job-applications', records, columns)
+
 @api.route('/api/job-applications/<int:application_id>', methods=['DELETE'])
 @login_required
 def delete_job_application(application_id):
@@ -1478,4 +1391,107 @@ def delete_job_application(application_id):
         return jsonify({'success': True, 'message': 'Application deleted successfully'})
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500
+
+# ==================== STATS ROUTES ====================
+
+# Dashboard aggregates change with every submission, so they are only cached briefly
+@api.route('/api/stats', methods=['GET'])
+@login_required
+@cached_response('stats', ttl='STATS_CACHE_TTL')
+def get_stats():
+    """All dashboard aggregates in one response (?days= for the daily series)"""
+    try:
+        days = parse_days(request.args)
+        return jsonify({
+            'applications': applications_by_job_and_status(),
+            'submissions_per_day': submissions_per_day(days),
+            'active_careers': active_careers_with_applicants(),
+        })
+    except StatsError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/api/stats/applications', methods=['GET'])
+@login_required
+@cached_response('stats', ttl='STATS_CACHE_TTL')
+def get_application_stats():
+    """Application counts by job and status"""
+    try:
+        return jsonify(applications_by_job_and_status())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/api/stats/submissions', methods=['GET'])
+@login_required
+@cached_response('stats', ttl='STATS_CACHE_TTL')
+def get_submission_stats():
+    """Applications and contact quotes per day for the last ?days= days (default 30)"""
+    try:
+        return jsonify(submissions_per_day(parse_days(request.args)))
+    except StatsError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/api/stats/careers', methods=['GET'])
+@login_required
+@cached_response('stats', ttl='STATS_CACHE_TTL')
+def get_career_stats():
+    """Active careers with their applicant counts"""
+    try:
+        return jsonify(active_careers_with_applicants())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# ==================== SEARCH ROUTES ====================
+
+@api.route('/api/search', methods=['GET'])
+def search_content():
+    """Full-text search across blogs, careers and projects"""
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({'error': 'q is required'}), 400
+        kinds = [k.strip() for k in request.args.get('type', ','.join(SEARCH_INDEXES)).split(',') if k.strip()]
+        unknown = [k for k in kinds if k not in SEARCH_INDEXES]
+        if unknown or not kinds:
+            return jsonify({'error': f'type must be one of: {", ".join(SEARCH_INDEXES)}'}), 400
+        limit = parse_limit(request.args)
+        cursor = request.args.get('cursor')
+        offset = decode_offset_cursor(cursor) if cursor else 0
+        hits, has_more = search(query, kinds, limit, offset)
+        next_cursor = encode_offset_cursor(offset + limit) if has_more else None
+        return jsonify({'items': hits, 'next_cursor': next_cursor})
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# ==================== BLOB ROUTES ====================
+
+BLOB_MAX_AGE = 365 * 24 * 60 * 60
+
+@api.route('/api/blobs/<string:digest>', methods=['GET'])
+def get_blob(digest):
+    """Stream a stored image by its SHA-256 digest"""
+    store = get_blob_store()
+    if not store.exists(digest):
+        return jsonify({'error': 'Blob not found'}), 404
+    # Anything outside the allow-list (stored before it existed) is only offered as a download
+    content_type = store.content_type(digest)
+    # Content-addressed, so the digest is a perfect ETag and the body never changes
+    response = send_file(
+        store.path(digest),
+        mimetype=content_type if content_type in BLOB_CONTENT_TYPES else 'application/octet-stream',
+        as_attachment=content_type not in BLOB_CONTENT_TYPES,
+        conditional=True,
+        etag=digest,
+        max_age=BLOB_MAX_AGE,
+    )
+    response.headers['Cache-Control'] = f'public, max-age={BLOB_MAX_AGE}, immutable'
+    # Served from the API origin: never let a browser treat a blob as a page
+    response.headers['X-Content-Type-Options'] = 'nosniff'
+    response.headers['Content-Security-Policy'] = "default-src 'none'"
+    return response
@@ -0,0 +1,144 @@
+import base64
+import binascii
+import hashlib
+import os
+import re
+import tempfile
+
+from flask import current_app
+from sqlalchemy import event, inspect
+
+BLOB_REF_PREFIX = 'blob:'
+BLOB_URL_PREFIX = '/api/blobs/'
+DIGEST_RE = re.compile(r'^[0-9a-f]{64}$')
+_DATA_URI_RE = re.compile(r'^data:(?P<mime>[\w.+-]+/[\w.+-]+)?(?P<params>(?:;[\w.+-]+=[\w.+-]+)*);base64,', re.IGNORECASE)
+
+# Blobs are served from the API origin, so only raster image types are stored:
+# HTML or SVG served from there could run script. Other data URIs stay inline
+BLOB_CONTENT_TYPES = frozenset({'image/png', 'image/jpeg', 'image/gif', 'image/webp'})
+
+# Image columns that hold base64 data URIs and are moved into the blob store.
+# Keyed by model class name so this module never has to import the models.
+BLOB_COLUMNS = {
+    'Project': ('hero_banner',),
+    'BlogPost': ('image', 'author_avatar'),
+    'Team': ('avatar',),
+    'Testimonial': ('avatar',),
+}
+
+
+class BlobStore:
+    """Content-addressed file store keyed by the SHA-256 of the blob bytes.
+
+    Blobs live at <root>/<aa>/<bb>/<digest> with the content type in a
+    <digest>.type sidecar. Writing the same bytes twice is a no-op.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, digest):
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def exists(self, digest):
+        return bool(DIGEST_RE.match(digest)) and os.path.exists(self.path(digest))
+
+    def content_type(self, digest):
+        try:
+            with open(self.path(digest) + '.type', 'r', encoding='ascii') as f:
+                return f.read().strip() or 'application/octet-stream'
+        except OSError:
+            return 'application/octet-stream'
+
+    def put(self, data, content_type):
+        """Store bytes and return their hex digest; content_type must be in BLOB_CONTENT_TYPES."""
+        if content_type not in BLOB_CONTENT_TYPES:
+            raise ValueError(f'Unsupported blob content type: {content_type}')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        if os.path.exists(path):
+            return digest
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        self._atomic_write(directory, path + '.type', content_type.encode('ascii', 'ignore'))
+        # The blob itself is written last so exists() never sees a blob without its type
+        self._atomic_write(directory, path, data)
+        return digest
+
+    @staticmethod
+    def _atomic_write(directory, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def get_blob_store():
+    """The store under BLOB_STORE_PATH, by default <instance>/blobs."""
+    root = current_app.config.get('BLOB_STORE_PATH') or os.path.join(current_app.instance_path, 'blobs')
+    return BlobStore(root)
+
+
+def parse_data_uri(value):
+    """Return (content_type, bytes) for a base64 data URI, or None for anything else."""
+    if not isinstance(value, str):
+        return None
+    match = _DATA_URI_RE.match(value)
+    if not match:
+        return None
+    try:
+        data = base64.b64decode(value[match.end():], validate=False)
+    except (binascii.Error, ValueError):
+        return None
+    return (match.group('mime') or 'application/octet-stream').lower(), data
+
+
+def externalize(value, store=None):
+    """Move a data URI into the blob store and return its blob: reference.
+
+    Values that are not data URIs of a BLOB_CONTENT_TYPES image (plain URLs,
+    existing references, SVG) are returned unchanged.
+    """
+    if isinstance(value, str) and value.startswith(BLOB_URL_PREFIX):
+        # A blob URL echoed back by a client (e.g. an unchanged image on edit)
+        digest = value[len(BLOB_URL_PREFIX):]
+        return BLOB_REF_PREFIX + digest if DIGEST_RE.match(digest) else value
+    parsed = parse_data_uri(value)
+    if parsed is None or parsed[0] not in BLOB_CONTENT_TYPES:
+        return value
+    content_type, data = parsed
+    digest = (store or get_blob_store()).put(data, content_type)
+    return BLOB_REF_PREFIX + digest
+
+
+def blob_url(value):
+    """Serialize a stored image column: blob references become /api/blobs/ URLs."""
+    if isinstance(value, str) and value.startswith(BLOB_REF_PREFIX):
+        return BLOB_URL_PREFIX + value[len(BLOB_REF_PREFIX):]
+    return value
+
+
+def _externalize_target(mapper, connection, target):
+    state = inspect(target)
+    for column in BLOB_COLUMNS.get(type(target).__name__, ()):
+        if state.has_identity and not state.attrs[column].history.has_changes():
+            continue
+        value = getattr(target, column)
+        stored = externalize(value)
+        if stored is not value:
+            setattr(target, column, stored)
+
+
+def register_blob_columns(*models):
+    """Externalize data URIs in BLOB_COLUMNS whenever these models are written."""
+    for model in models:
+        if model.__name__ not in BLOB_COLUMNS:
+            continue
+        for identifier in ('before_insert', 'before_update'):
+            if not event.contains(model, identifier, _externalize_target):
+                event.listen(model, identifier, _externalize_target)
@@ -0,0 +1,294 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, make_response, request
+
+from app.compression import accepted_encoding
+from app.conditional import not_modified
+from app.kvstore import TableStore
+
+# Every tag a cached_response() or invalidates() route depends on, filled in as
+# the routes are decorated; a cache bumps them all after an outage
+ROUTE_TAGS = set()
+
+
+class MemoryBackend:
+    """In-process LRU key/value store with per-entry TTL.
+
+    Each worker process has its own copy, so build_response_cache() keeps
+    the tag versions in the shared kv_store table instead (TableBackend);
+    otherwise an invalidation would only reach the process that made it.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def get_many(self, keys):
+        return [self.get(key) for key in keys]
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def incr(self, key):
+        with self._lock:
+            value, expires_at = self._data.get(key, (0, None))
+            self._data[key] = (int(value) + 1, expires_at)
+            self._data.move_to_end(key)
+
+
+class TableBackend:
+    """Tag versions on a TableStore (the kv_store table), shared by every worker on the node."""
+
+    def __init__(self, store=None):
+        self.store = store or TableStore()
+
+    def get_many(self, keys):
+        return self.store.mget(keys)
+
+    def incr(self, key):
+        self.store.incr(key)
+
+
+class RedisBackend:
+    """Key/value store on a LazyRedis; errors surface to the caller.
+
+    available mirrors the client's circuit breaker, and on_recover() hooks
+    are called when it closes again.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    @property
+    def available(self):
+        return self.client.available
+
+    def on_recover(self, hook):
+        self.client.on_recover(hook)
+
+    def get(self, key):
+        return self.client.call('get', key)
+
+    def get_many(self, keys):
+        return self.client.call('mget', keys)
+
+    def set(self, key, value, ttl=None):
+        if ttl:
+            self.client.call('setex', key, ttl, value)
+        else:
+            self.client.call('set', key, value)
+
+    def incr(self, key):
+        self.client.call('incr', key)
+
+
+class ResponseCache:
+    """Tag-invalidated cache of whole GET responses.
+
+    Entry keys embed the current version of every tag they depend on, so
+    invalidating a tag is a single counter bump and stale entries simply
+    stop being addressed (and age out through TTL/LRU).
+
+    Tag versions live in versions (default: the entry backend), which must
+    be shared by every worker so a bump made by one is seen by all.
+
+    A bump that cannot reach the backend (Redis down) would leave entries
+    under the old versions to be served again once it is back. So while the
+    backend is unavailable the cache is bypassed (with a warning logged), and
+    after any outage or failed bump every tag in ROUTE_TAGS is bumped before
+    the cache is used again.
+    """
+
+    def __init__(self, backend, default_ttl=300, prefix='rcache', versions=None):
+        self.backend = backend
+        self.versions = versions or backend
+        self.default_ttl = default_ttl
+        self.prefix = prefix
+        self._stale = False
+        if hasattr(backend, 'on_recover'):
+            backend.on_recover(self._recover)
+
+    def _recover(self):
+        """Bump every tag; True once done (the cache is safe to use again)."""
+        try:
+            for tag in list(ROUTE_TAGS):
+                self.versions.incr(self._tag_key(tag))
+        except Exception:
+            return False
+        self._stale = False
+        return True
+
+    def _bypass(self, reason):
+        if not self._stale:
+            current_app.logger.warning('Response cache disabled until its backend recovers: %s', reason)
+        self._stale = True
+
+    def _ready(self):
+        if not getattr(self.backend, 'available', True):
+            self._bypass('backend unavailable')
+            return False
+        return not self._stale or self._recover()
+
+    def _tag_key(self, tag):
+        return f'{self.prefix}:tag:{tag}'
+
+    def _entry_key(self, tags):
+        versions = self.versions.get_many([self._tag_key(tag) for tag in tags])
+        version = '.'.join(str(int(v or 0)) for v in versions)
+        target = hashlib.sha1(request.full_path.encode('utf-8')).hexdigest()
+        return f'{self.prefix}:{target}:{version}'
+
+    def invalidate(self, *tags):
+        if not self._ready():
+            return
+        try:
+            for tag in tags:
+                self.versions.incr(self._tag_key(tag))
+        except Exception as e:
+            self._bypass(f'invalidating {", ".join(tags)} failed: {e!r}')
+
+    def load(self, tags, encoding=None):
+        """Return (key, entry); entry is None on a miss or backend error.
+
+        With an encoding, the compressed variant stored under the same key is
+        preferred (fetched in the same round trip); header['encoding'] is set
+        when the body returned is compressed. The key is None too while the
+        cache is bypassed, so nothing gets stored.
+        """
+        if not self._ready():
+            return None, None
+        try:
+            key = self._entry_key(tags)
+            keys = [f'{key}:{encoding}', key] if encoding else [key]
+            raw = next((value for value in self.backend.get_many(keys) if value is not None), None)
+        except Exception as e:
+            self._bypass(f'lookup failed: {e!r}')
+            return None, None
+        if raw is None:
+            return key, None
+        try:
+            header, body = raw.split(b'\n', 1)
+            return key, (json.loads(header), body)
+        except Exception:
+            return key, None
+
+    def store(self, key, response, ttl=None, encoding=None):
+        """Store a response body; with encoding, as the compressed variant of key."""
+        header = {
+            'status': response.status_code,
+            'mimetype': response.mimetype,
+            'etag': response.get_etag()[0],
+        }
+        if encoding:
+            header['encoding'] = encoding
+            key = f'{key}:{encoding}'
+        raw = json.dumps(header, separators=(',', ':')).encode('utf-8') + b'\n' + response.get_data()
+        if not self._ready():
+            return
+        try:
+            self.backend.set(key, raw, ttl or self.default_ttl)
+        except Exception:
+            pass
+
+
+def build_response_cache(kind, redis_client=None, default_ttl=300, max_entries=512):
+    """Pick a backend: 'redis', 'memory' or 'none'; auto-selects Redis when a client is given.
+
+    redis_client is a LazyRedis; while its breaker is open the cache is
+    bypassed rather than served from a per-process copy, whose tag bumps
+    other workers would never see. The memory backend keeps entries per
+    process but reads tag versions from the kv_store table, so it stays
+    correct under several workers at the cost of one small query per hit.
+    """
+    kind = (kind or ('redis' if redis_client is not None else 'memory')).lower()
+    if kind == 'none':
+        return None
+    if kind == 'redis' and redis_client is not None:
+        return ResponseCache(RedisBackend(redis_client), default_ttl)
+    return ResponseCache(MemoryBackend(max_entries), default_ttl, versions=TableBackend())
+
+
+def _route_cache():
+    return current_app.extensions.get('response_cache')
+
+
+def cached_response(*tags, ttl=None):
+    """Serve a GET route from the app's response cache, keyed on its full path and query string.
+
+    ttl is in seconds, or the name of an app.config setting holding it;
+    None uses the cache's default.
+    """
+    ROUTE_TAGS.update(tags)
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache = _route_cache()
+            if cache is None:
+                return fn(*args, **kwargs)
+            seconds = current_app.config[ttl] if isinstance(ttl, str) else ttl
+            key, entry = cache.load(tags, accepted_encoding())
+            if entry is not None:
+                header, body = entry
+                if header.get('etag'):
+                    cached = not_modified(header['etag'])
+                    if cached is not None:
+                        return cached
+                response = make_response(body, header['status'])
+                response.mimetype = header['mimetype']
+                if header.get('etag'):
+                    response.set_etag(header['etag'], weak=True)
+                    response.headers['Cache-Control'] = 'no-cache'
+                if header.get('encoding'):
+                    response.headers['Content-Encoding'] = header['encoding']
+                    response.vary.add('Accept-Encoding')
+                else:
+                    # Lets compress_response() store the compressed body once
+                    response.cache_slot = (cache, key, seconds)
+                return response
+            response = make_response(fn(*args, **kwargs))
+            if key is not None and response.status_code == 200:
+                cache.store(key, response, seconds)
+                response.cache_slot = (cache, key, seconds)
+            return response
+        return wrapper
+    return decorator
+
+
+def invalidates(*tags):
+    """Invalidate tags in the app's response cache after a write handler returns a successful response."""
+    ROUTE_TAGS.update(tags)
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            response = make_response(fn(*args, **kwargs))
+            cache = _route_cache()
+            if cache is not None and response.status_code < 400:
+                cache.invalidate(*tags)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,92 @@
+"""Response compression (gzip, and Brotli when the brotli package is installed).
+
+init_compression(app) registers an after_request hook that compresses
+eligible responses for clients that accept it. Responses from
+cached_response() carry their cache slot, so the compressed body is
+stored next to the cached entry and later hits reuse it (see app/cache.py).
+
+Config: COMPRESS_ALGORITHMS (preference order, empty disables),
+COMPRESS_MIN_SIZE, COMPRESS_LEVEL (gzip 1-9), COMPRESS_BR_LEVEL (Brotli 0-11)
+and COMPRESS_MIMETYPES.
+"""
+
+import gzip
+
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+
+def _gzip(data, config):
+    # mtime=0 keeps the output identical for identical bodies
+    return gzip.compress(data, compresslevel=config['COMPRESS_LEVEL'], mtime=0)
+
+
+def _brotli(data, config):
+    return brotli.compress(data, quality=config['COMPRESS_BR_LEVEL'])
+
+
+COMPRESSORS = {'gzip': _gzip}
+if brotli is not None:
+    COMPRESSORS['br'] = _brotli
+
+
+def available_algorithms(config):
+    return [name for name in config.get('COMPRESS_ALGORITHMS', ()) if name in COMPRESSORS]
+
+
+def accepted_encoding():
+    """The configured encoding the client prefers (by q-value, then our order), or None."""
+    best, best_quality = None, 0
+    accept = request.accept_encodings
+    for name in available_algorithms(current_app.config):
+        quality = accept[name]
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+def compressible(response, config):
+    """True when the response type and status may be compressed at all."""
+    return (
+        response.status_code in (200, 201, 207)
+        and not response.direct_passthrough
+        and not response.is_streamed
+        and 'Content-Encoding' not in response.headers
+        and response.mimetype in config['COMPRESS_MIMETYPES']
+    )
+
+
+def compress_response(response):
+    config = current_app.config
+    if not compressible(response, config):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = accepted_encoding()
+    if encoding is None or response.content_length is None or response.content_length < config['COMPRESS_MIN_SIZE']:
+        return response
+    body = COMPRESSORS[encoding](response.get_data(), config)
+    if len(body) >= response.content_length:
+        return response
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        # A strong validator must differ per representation
+        response.set_etag(f'{etag}-{encoding}')
+    slot = getattr(response, 'cache_slot', None)
+    if slot is not None:
+        cache, key, ttl = slot
+        cache.store(key, response, ttl, encoding=encoding)
+    return response
+
+
+def init_compression(app):
+    if available_algorithms(app.config):
+        app.after_request(compress_response)
@@ -0,0 +1,58 @@
+import hashlib
+
+from flask import make_response, request
+from sqlalchemy import func
+from werkzeug.http import is_resource_modified
+
+from app import db
+
+
+def _version_column(model):
+    # ContactQuote has no updated_at; its rows are never edited in place
+    return getattr(model, 'updated_at', None) or model.created_at
+
+
+def _weak_etag(*parts):
+    # The query string is folded in so ?fields=, ?cursor= etc. get distinct tags
+    raw = '|'.join(str(part) for part in parts + (request.query_string.decode('latin-1'),))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:32]
+
+
+def collection_validators(query, model):
+    """ETag for a (filtered) collection from max(updated_at) and row count.
+
+    Runs one aggregate query over the same WHERE clause, so nothing is loaded
+    or serialized. No Last-Modified is derived: deleting a row does not move
+    max(updated_at), so If-Modified-Since alone could not detect it.
+    """
+    latest, count = query.order_by(None).with_entities(
+        func.max(_version_column(model)), func.count(model.id)
+    ).one()
+    return _weak_etag(model.__name__, count, latest.isoformat() if latest else ''), None
+
+
+def row_validators(model, ident):
+    """(etag, last_modified) for one row, or None when the row does not exist."""
+    row = db.session.query(model.id, _version_column(model)).filter(model.id == ident).first()
+    if row is None:
+        return None
+    updated_at = row[1]
+    return _weak_etag(model.__name__, ident, updated_at.isoformat() if updated_at else ''), updated_at
+
+
+def not_modified(etag, last_modified=None):
+    """A 304 response when the request's validators still match, else None."""
+    if is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        return None
+    return with_validators(make_response('', 304), etag, last_modified)
+
+
+def with_validators(response, etag, last_modified=None):
+    response = make_response(response)
+    if response.status_code in (200, 304):
+        response.set_etag(etag, weak=True)
+        if last_modified is not None:
+            response.last_modified = last_modified
+        # Clients may keep the body but must revalidate before reusing it
+        response.headers['Cache-Control'] = 'no-cache'
+    return response
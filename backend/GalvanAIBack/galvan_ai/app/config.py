@@ -0,0 +1,186 @@
+import os
+import tempfile
+
+
+def env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value not in (None, '') else default
+
+
+def env_float(name, default):
+    value = os.environ.get(name)
+    return float(value) if value not in (None, '') else default
+
+
+def env_flag(name, default):
+    value = os.environ.get(name)
+    if value in (None, ''):
+        return default
+    return value.lower() in ('1', 'true', 'yes', 'on')
+
+
+def database_url(default):
+    url = os.environ.get('DATABASE_URL') or default
+    # Heroku-style URLs use the scheme SQLAlchemy 1.4+ no longer accepts
+    if url.startswith('postgres://'):
+        url = 'postgresql://' + url[len('postgres://'):]
+    return url
+
+
+def engine_options(url):
+    """SQLALCHEMY_ENGINE_OPTIONS for the given database URL, tuned from the environment.
+
+    DB_POOL_SIZE / DB_MAX_OVERFLOW should be sized for the threads of one
+    worker process: every worker holds its own pool.
+    """
+    options = {
+        'pool_pre_ping': env_flag('DB_POOL_PRE_PING', True),
+        'pool_recycle': env_int('DB_POOL_RECYCLE', 1800),
+    }
+    if url.startswith('sqlite') and (':memory:' in url or url.rstrip('/') == 'sqlite:'):
+        # In-memory databases use a single static connection; no pool to size
+        return {}
+    options['pool_size'] = env_int('DB_POOL_SIZE', 5)
+    options['max_overflow'] = env_int('DB_MAX_OVERFLOW', 10)
+    if url.startswith('sqlite'):
+        return options
+
+    options['pool_timeout'] = env_int('DB_POOL_TIMEOUT', 30)
+    statement_timeout = env_int('DB_STATEMENT_TIMEOUT_MS', 15000)
+    if statement_timeout:
+        if url.startswith('postgresql'):
+            options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+        elif url.startswith('mysql'):
+            options['connect_args'] = {'init_command': f'SET SESSION max_execution_time={statement_timeout}'}
+    return options
+
+
+class Config:
+    SECRET_KEY = os.environ.get('SECRET_KEY', 'galvanai_secret_key')
+    SQLALCHEMY_DATABASE_URI = database_url('sqlite:///galvan_ai.db')
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SESSION_PERMANENT = False
+    REMEMBER_COOKIE_DURATION = 0
+    # Apply pending migrations at startup; production runs `flask db upgrade` on deploy instead
+    AUTO_MIGRATE = env_flag('AUTO_MIGRATE', True)
+    CORS_ORIGINS = os.environ.get('CORS_ORIGINS', 'http://localhost:3000,http://192.168.18.18:3000').split(',')
+    # Content-addressed image store (see app/blobstore.py); empty = <instance>/blobs
+    BLOB_STORE_PATH = os.environ.get('BLOB_STORE_PATH') or None
+    # JSON encoder behind jsonify(): auto (orjson if installed), orjson or stdlib
+    JSON_ENCODER = os.environ.get('JSON_ENCODER', 'auto')
+
+    # Response compression (see app/compression.py); br needs the brotli package
+    COMPRESS_ALGORITHMS = [a.strip() for a in os.environ.get('COMPRESS_ALGORITHMS', 'br,gzip').split(',') if a.strip()]
+    COMPRESS_MIN_SIZE = env_int('COMPRESS_MIN_SIZE', 1024)
+    COMPRESS_LEVEL = env_int('COMPRESS_LEVEL', 6)
+    COMPRESS_BR_LEVEL = env_int('COMPRESS_BR_LEVEL', 5)
+    COMPRESS_MIMETYPES = (
+        'application/json', 'application/x-ndjson', 'text/html', 'text/css', 'text/plain', 'text/csv',
+        'application/javascript',
+    )
+
+    # Prometheus metrics on /metrics (see app/metrics.py). Exposed only with a token (scrapes send
+    # 'Authorization: Bearer <token>') or with METRICS_PUBLIC=1 on an internal-only port
+    METRICS_ENABLED = env_flag('METRICS_ENABLED', True)
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+    METRICS_PUBLIC = env_flag('METRICS_PUBLIC', False)
+
+    # Redis behind the response cache, the idempotency/captcha state and the rate limits (see
+    # app/redis_client.py). Opt-in: an empty REDIS_HOST runs without it
+    REDIS_HOST = os.environ.get('REDIS_HOST', '')
+    REDIS_PORT = env_int('REDIS_PORT', 6379)
+    REDIS_DB = env_int('REDIS_DB', 1)
+    REDIS_SOCKET_TIMEOUT = env_float('REDIS_SOCKET_TIMEOUT', 0.25)  # connect and per-command, seconds
+    REDIS_MAX_CONNECTIONS = env_int('REDIS_MAX_CONNECTIONS', 32)
+    REDIS_BREAKER_THRESHOLD = env_int('REDIS_BREAKER_THRESHOLD', 3)
+    REDIS_BREAKER_COOLDOWN = env_float('REDIS_BREAKER_COOLDOWN', 15.0)
+
+    # Whole-response cache for public reads (see app/cache.py): memory, redis or none;
+    # empty = redis when REDIS_HOST is set, else memory
+    RESPONSE_CACHE_BACKEND = os.environ.get('RESPONSE_CACHE_BACKEND') or None
+    RESPONSE_CACHE_TTL = env_int('RESPONSE_CACHE_TTL', 300)
+    STATS_CACHE_TTL = env_int('STATS_CACHE_TTL', 30)
+
+    # Idempotency keys and captcha counters (see app/kvstore.py): redis, database, memory or none;
+    # empty = redis when REDIS_HOST is set, else the kv_store table
+    STATE_BACKEND = os.environ.get('STATE_BACKEND') or None
+    STATE_MEMORY_MAX_ENTRIES = env_int('STATE_MEMORY_MAX_ENTRIES', 10000)
+    # A reservation outlives a crashed worker by this long; keep it above WEB_TIMEOUT
+    IDEMPOTENCY_LOCK_SECONDS = env_int('IDEMPOTENCY_LOCK_SECONDS', 60)
+    # How long a duplicate waits for the in-flight original before answering 409. Each
+    # waiting duplicate holds a worker thread, so keep this short
+    IDEMPOTENCY_WAIT_SECONDS = env_float('IDEMPOTENCY_WAIT_SECONDS', 0.5)
+
+    # Reverse proxies in front of the app; their X-Forwarded-For/-Proto hops are trusted
+    # for the client address (rate limits, captcha) and scheme. 0 = none, use the socket peer.
+    # Set 1 when Flask is only reachable through the Next.js routes, which forward the visitor's
+    # address; with 0 every visitor shares the Next.js server's address and rate-limit bucket
+    TRUSTED_PROXY_HOPS = env_int('TRUSTED_PROXY_HOPS', 0)
+
+    # Token-bucket limits on the public submission routes (see app/ratelimit.py), as 'N/second|minute|hour|day'
+    # per client IP, per submitted email and across all clients; an empty value turns that limit off
+    RATE_LIMIT_ENABLED = env_flag('RATE_LIMIT_ENABLED', True)
+    RATE_LIMITS = {
+        'contact': {
+            'ip': os.environ.get('RATE_LIMIT_CONTACT_IP', '5/minute'),
+            'email': os.environ.get('RATE_LIMIT_CONTACT_EMAIL', '3/hour'),
+            'global': os.environ.get('RATE_LIMIT_CONTACT_GLOBAL', '60/minute'),
+        },
+        'jobapp': {
+            'ip': os.environ.get('RATE_LIMIT_JOBAPP_IP', '10/minute'),
+            'email': os.environ.get('RATE_LIMIT_JOBAPP_EMAIL', '10/hour'),
+            'global': os.environ.get('RATE_LIMIT_JOBAPP_GLOBAL', '120/minute'),
+        },
+    }
+
+    # Applied to every SQLite connection (see app/sqlite.py); empty values are skipped
+    SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_BUSY_TIMEOUT_MS = env_int('SQLITE_BUSY_TIMEOUT_MS', 5000)
+    SQLITE_CACHE_SIZE = env_int('SQLITE_CACHE_SIZE', -20000)  # negative = KiB, so ~20 MB
+    SQLITE_MMAP_SIZE = env_int('SQLITE_MMAP_SIZE', 128 * 1024 * 1024)
+    SQLITE_TEMP_STORE = os.environ.get('SQLITE_TEMP_STORE', 'MEMORY')
+    SQLITE_FOREIGN_KEYS = os.environ.get('SQLITE_FOREIGN_KEYS')
+
+
+class DevelopmentConfig(Config):
+    DEBUG = True
+    METRICS_PUBLIC = env_flag('METRICS_PUBLIC', True)
+
+
+class TestingConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL', 'sqlite://')
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+    # Never write test uploads into the real instance folder
+    BLOB_STORE_PATH = os.environ.get('TEST_BLOB_STORE_PATH') or os.path.join(tempfile.gettempdir(), 'galvan-ai-test-blobs')
+    # Self-contained: no Redis, state in the test database, responses cached in memory
+    REDIS_HOST = os.environ.get('TEST_REDIS_HOST', '')
+    RESPONSE_CACHE_BACKEND = 'memory'
+    STATE_BACKEND = 'database'
+
+
+class ProductionConfig(Config):
+    DEBUG = False
+    AUTO_MIGRATE = env_flag('AUTO_MIGRATE', False)
+    SESSION_COOKIE_SECURE = env_flag('SESSION_COOKIE_SECURE', True)
+    REMEMBER_COOKIE_SECURE = env_flag('SESSION_COOKIE_SECURE', True)
+
+
+CONFIGS = {
+    'development': DevelopmentConfig,
+    'testing': TestingConfig,
+    'production': ProductionConfig,
+}
+
+
+def get_config(name=None):
+    """Config class for name, or for APP_ENV (default 'development')."""
+    name = (name or os.environ.get('APP_ENV') or 'development').lower()
+    if name not in CONFIGS:
+        raise ValueError(f'Unknown APP_ENV: {name}')
+    config = CONFIGS[name]
+    if config is ProductionConfig and not os.environ.get('SECRET_KEY'):
+        raise RuntimeError('SECRET_KEY must be set when APP_ENV=production')
+    return config
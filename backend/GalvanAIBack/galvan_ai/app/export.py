@@ -0,0 +1,167 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+from flask import Response, stream_with_context
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+# Rows fetched per round trip while streaming
+YIELD_PER = 500
+
+RESUME_FIELDS = ('fileUrl', 'fileName', 'fileSize', 'fileType', 'storageType')
+
+# Spreadsheet apps evaluate cells starting with these as formulas
+_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+class ExportError(ValueError):
+    """Raised for an unknown ?format= or an unparseable ?from=/?to= date."""
+
+
+def parse_format(args):
+    fmt = (args.get('format') or 'csv').lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ExportError(f'format must be one of: {", ".join(EXPORT_FORMATS)}')
+    return fmt
+
+
+def _parse_datetime(value, name):
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ExportError(f'{name} must be an ISO date (YYYY-MM-DD) or datetime')
+
+
+def filter_created_between(query, model, args):
+    """Apply ?from= / ?to= on created_at; a date-only ?to= includes that whole day."""
+    if args.get('from'):
+        query = query.filter(model.created_at >= _parse_datetime(args['from'], 'from'))
+    if args.get('to'):
+        end = _parse_datetime(args['to'], 'to')
+        if len(args['to']) == 10:
+            query = query.filter(model.created_at < end + timedelta(days=1))
+        else:
+            query = query.filter(model.created_at <= end)
+    return query
+
+
+def stream_rows(query):
+    """Iterate plain rows in batches of YIELD_PER, never holding the full result."""
+    return query.yield_per(YIELD_PER)
+
+
+def _loads(value):
+    if value is None or not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value) if value else None
+    except ValueError:
+        return value
+
+
+def _answer_text(answer):
+    if isinstance(answer, list):
+        return '; '.join(_answer_text(a) for a in answer)
+    if isinstance(answer, dict):
+        # File uploads are exported as their URL
+        return str(answer.get('fileUrl') or json.dumps(answer))
+    return '' if answer is None else str(answer)
+
+
+def response_key(question_id):
+    """Column name for an answer, the same in CSV headers and NDJSON keys so exports join."""
+    return f'response:{question_id}'
+
+
+def response_columns(rows):
+    """Ordered questionIds over the responses column of rows (first pass for CSV)."""
+    columns = {}
+    for (raw,) in rows:
+        for response in _loads(raw) or []:
+            if isinstance(response, dict) and response.get('questionId') not in (None, ''):
+                columns.setdefault(str(response['questionId']), None)
+    return list(columns)
+
+
+APPLICATION_FIELDS = (
+    'id', 'job_id', 'job_title', 'applicant_name', 'applicant_email', 'applicant_phone', 'status',
+    'notes', 'cover_letter', 'questionnaire_id', 'created_at', 'updated_at',
+)
+
+
+def application_columns(responses):
+    """CSV [(key, header)] for job applications given response_columns() output."""
+    columns = [(field, field) for field in APPLICATION_FIELDS]
+    columns += [(f'resume_{field}', f'resume_{field}') for field in RESUME_FIELDS]
+    columns += [(response_key(question_id), response_key(question_id)) for question_id in responses]
+    return columns
+
+
+def flatten_application(row):
+    """One export record for a job application row, JSON fields spread into columns."""
+    record = {
+        'id': row.id,
+        'job_id': row.job_id,
+        'job_title': row.job_title,
+        'applicant_name': row.applicant_name,
+        'applicant_email': row.applicant_email,
+        'applicant_phone': row.applicant_phone,
+        'status': row.status,
+        'notes': row.notes,
+        'cover_letter': row.cover_letter,
+        'questionnaire_id': row.questionnaire_id,
+        'created_at': row.created_at.isoformat() if row.created_at else None,
+        'updated_at': row.updated_at.isoformat() if row.updated_at else None,
+    }
+    resume = _loads(row.resume)
+    if not isinstance(resume, dict):
+        resume = {'fileUrl': resume} if resume else {}
+    for field in RESUME_FIELDS:
+        record[f'resume_{field}'] = resume.get(field)
+    for response in _loads(row.responses) or []:
+        if isinstance(response, dict) and response.get('questionId') not in (None, ''):
+            record[response_key(response['questionId'])] = _answer_text(response.get('answer'))
+    return record
+
+
+def _csv_cell(value):
+    if value is None:
+        return ''
+    value = str(value)
+    return "'" + value if value.startswith(_FORMULA_PREFIXES) else value
+
+
+def csv_lines(columns, records):
+    """Yield a header line then one CSV line per record; columns is [(key, header)]."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    writer.writerow([header for _, header in columns])
+    yield flush()
+    for record in records:
+        writer.writerow([_csv_cell(record.get(key)) for key, _ in columns])
+        yield flush()
+
+
+def ndjson_lines(records):
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def export_response(fmt, filename, records, columns=None):
+    """Stream records as a download; records is a generator, so memory stays flat."""
+    body = csv_lines(columns, records) if fmt == 'csv' else ndjson_lines(records)
+    response = Response(stream_with_context(body), content_type=EXPORT_FORMATS[fmt])
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}.{fmt}"'
+    response.headers['Cache-Control'] = 'no-store'
+    return response
@@ -0,0 +1,137 @@
+"""JSON provider for the app: orjson when installed, the stdlib json module otherwise.
+
+Installed on the app in create_app(), so every jsonify() goes through it.
+JSON_ENCODER=auto|orjson|stdlib picks the encoder. Values wrapped in
+RawJSON are already JSON text; they are spliced into the output verbatim
+instead of being decoded and encoded again.
+"""
+
+import json
+import os
+import re
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class RawJSON:
+    """Trusted, already-valid JSON text to embed as-is, e.g. a stored list column."""
+
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+    def __repr__(self):
+        return f'RawJSON({self.text!r})'
+
+
+# Raw fragments are encoded as this marker plus an index, then swapped in.
+# The random token makes a clash with real data unlikely; _splice() detects one.
+_MARKER = f'\x1fraw{os.urandom(6).hex()}:'
+_MARKER_RE = re.compile(re.escape(json.dumps(_MARKER)[:-1]) + r'(\d+)"')
+_MARKER_BYTES_RE = re.compile(_MARKER_RE.pattern.encode('utf-8'))
+
+
+def _splice(text, fragments):
+    """Swap markers for fragments; None if the payload itself contained a marker."""
+    if isinstance(text, bytes):
+        text, count = _MARKER_BYTES_RE.subn(lambda m: fragments[int(m.group(1))].encode('utf-8'), text)
+    else:
+        text, count = _MARKER_RE.subn(lambda m: fragments[int(m.group(1))], text)
+    return text if count == len(fragments) else None
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """DefaultJSONProvider with a faster encoder and RawJSON passthrough.
+
+    Output matches the default provider: sorted keys, RFC 822 dates, and
+    indentation in debug mode. The one difference is that orjson writes
+    UTF-8 instead of \\u escapes. Calls that need options orjson lacks, and
+    values orjson rejects (such as integers over 64 bits), go through the
+    stdlib encoder.
+    """
+
+    ensure_ascii = False
+
+    def __init__(self, app):
+        super().__init__(app)
+        encoder = (app.config.get('JSON_ENCODER') or 'auto').lower()
+        if encoder == 'orjson' and orjson is None:
+            raise RuntimeError('JSON_ENCODER=orjson but orjson is not installed')
+        self.use_orjson = orjson is not None and encoder != 'stdlib'
+
+    def _encoder(self, fragments):
+        default = self.default
+
+        def encode(value):
+            if isinstance(value, RawJSON):
+                fragments.append(value.text)
+                return f'{_MARKER}{len(fragments) - 1}'
+            return default(value)
+        return encode
+
+    def _orjson_options(self, kwargs):
+        """orjson option flags for these json.dumps kwargs, or None if orjson cannot honour them."""
+        indent = kwargs.pop('indent', None)
+        kwargs.pop('separators', None)
+        sort_keys = kwargs.pop('sort_keys', self.sort_keys)
+        if kwargs.pop('ensure_ascii', self.ensure_ascii) or kwargs or indent not in (None, 2):
+            return None
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _dumps_bytes(self, obj, kwargs):
+        fragments = []
+        option = self._orjson_options(dict(kwargs)) if self.use_orjson else None
+        if option is not None:
+            try:
+                encoded = orjson.dumps(obj, default=self._encoder(fragments), option=option)
+                if not fragments:
+                    return encoded
+                spliced = _splice(encoded, fragments)
+                if spliced is not None:
+                    return spliced
+            except orjson.JSONEncodeError:
+                pass
+        return self._stdlib_dumps(obj, kwargs).encode('utf-8')
+
+    def _stdlib_dumps(self, obj, kwargs):
+        kwargs = dict(kwargs)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        if 'default' in kwargs:
+            return json.dumps(obj, **kwargs)
+        fragments = []
+        text = json.dumps(obj, default=self._encoder(fragments), **kwargs)
+        if not fragments:
+            return text
+        spliced = _splice(text, fragments)
+        if spliced is not None:
+            return spliced
+        # The payload itself contained a marker: decode the fragments instead (slow but exact)
+        return json.dumps(obj, default=self._decoding_default, **kwargs)
+
+    def _decoding_default(self, value):
+        return json.loads(value.text) if isinstance(value, RawJSON) else self.default(value)
+
+    def dumps(self, obj, **kwargs):
+        if self.use_orjson:
+            return self._dumps_bytes(obj, kwargs).decode('utf-8')
+        return self._stdlib_dumps(obj, kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            dump_args = {'indent': 2}
+        else:
+            dump_args = {'separators': (',', ':')}
+        return self._app.response_class(self._dumps_bytes(obj, dump_args) + b'\n', mimetype=self.mimetype)
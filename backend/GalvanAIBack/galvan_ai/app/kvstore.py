@@ -0,0 +1,260 @@
+"""Key/value stores for the idempotency and captcha state in app/api.py.
+
+Both speak the small part of the redis-py client API those helpers use
+(get, set, setex, delete, incr, expire and pipeline()), so they stand in for
+Redis when it is not available:
+
+    MemoryStore  per process, bounded LRU with TTLs; right for one worker
+    TableStore   a table in the app's database, shared by every worker on
+                 the node (created by migration 0008)
+
+Values come back as bytes, as they do from Redis.
+"""
+
+import abc
+import heapq
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import Column, Float, MetaData, String, Table, Text, delete, select, text
+
+from app import db
+from app.redis_client import Failover, Pipeline
+
+# Not on db.metadata: the table belongs to migration 0008, not to create_all()
+metadata = MetaData()
+state_table = Table(
+    'kv_store', metadata,
+    Column('key', String(255), primary_key=True),
+    Column('value', Text, nullable=False),
+    Column('expires_at', Float, nullable=True, index=True),  # epoch seconds, NULL = no expiry
+)
+
+
+def _encode(value):
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode('utf-8')
+
+
+class _Store(abc.ABC):
+    """The redis-py style calls, each a one-command batch; subclasses implement run_batch()."""
+
+    @abc.abstractmethod
+    def run_batch(self, commands):
+        """Run [(name, args)] atomically and return their results."""
+
+    def get(self, key):
+        return self.run_batch([('get', (key,))])[0]
+
+    def mget(self, keys):
+        return self.run_batch([('get', (key,)) for key in keys])
+
+    def set(self, key, value, ex=None, nx=False):
+        """True when written; None when nx is set and the key already exists, as in redis-py."""
+        return self.run_batch([('set', (key, value, ex, nx))])[0]
+
+    def setex(self, key, ttl, value):
+        return self.run_batch([('setex', (key, ttl, value))])[0]
+
+    def delete(self, *keys):
+        return self.run_batch([('delete', keys)])[0]
+
+    def incr(self, key):
+        return self.run_batch([('incr', (key,))])[0]
+
+    def expire(self, key, ttl):
+        return self.run_batch([('expire', (key, ttl))])[0]
+
+    def pipeline(self):
+        return Pipeline(self)
+
+
+class MemoryStore(_Store):
+    """In-process store with per-key TTLs, capped at max_entries.
+
+    When full, expired keys are dropped first and then the least recently
+    used ones, so memory stays bounded under a flood of distinct keys.
+    Expiry times are kept in a heap, so finding the expired keys costs
+    O(log n) each rather than a scan of every entry on each write.
+    """
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._expiries = []  # (expires_at, key); entries go stale when a key is rewritten or deleted
+        self._lock = threading.Lock()
+
+    def _live(self, key, now):
+        item = self._data.get(key)
+        if item is None:
+            return None
+        if item[1] is not None and item[1] <= now:
+            del self._data[key]
+            return None
+        return item
+
+    def _schedule(self, key, expires_at):
+        if expires_at is None:
+            return
+        heapq.heappush(self._expiries, (expires_at, key))
+        if len(self._expiries) > 2 * self.max_entries:
+            # Mostly stale entries by now: rebuild from the live ones
+            self._expiries = [(exp, k) for k, (_, exp) in self._data.items() if exp is not None]
+            heapq.heapify(self._expiries)
+
+    def _drop_expired(self, now):
+        while self._expiries and self._expiries[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiries)
+            item = self._data.get(key)
+            if item is not None and item[1] == expires_at:
+                del self._data[key]
+
+    def _put(self, key, value, expires_at):
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        self._schedule(key, expires_at)
+        if len(self._data) > self.max_entries:
+            self._drop_expired(time.monotonic())
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    # Each command assumes the lock is held, so pipelines run atomically
+    def _get(self, key):
+        item = self._live(key, time.monotonic())
+        if item is None:
+            return None
+        self._data.move_to_end(key)
+        return item[0]
+
+    def _set(self, key, value, ex=None, nx=False):
+        now = time.monotonic()
+        if nx and self._live(key, now) is not None:
+            return None
+        self._put(key, _encode(value), now + ex if ex else None)
+        return True
+
+    def _setex(self, key, ttl, value):
+        return self._set(key, value, ex=ttl)
+
+    def _delete(self, *keys):
+        return sum(self._data.pop(key, None) is not None for key in keys)
+
+    def _incr(self, key):
+        item = self._live(key, time.monotonic())
+        value = int(item[0]) + 1 if item else 1
+        self._put(key, _encode(value), item[1] if item else None)
+        return value
+
+    def _expire(self, key, ttl):
+        item = self._live(key, time.monotonic())
+        if item is None:
+            return False
+        expires_at = time.monotonic() + ttl
+        self._data[key] = (item[0], expires_at)
+        self._schedule(key, expires_at)
+        return True
+
+    def run_batch(self, commands):
+        with self._lock:
+            return [getattr(self, f'_{name}')(*args) for name, args in commands]
+
+
+class TableStore(_Store):
+    """Store on the kv_store table, shared across worker processes.
+
+    Every call (or pipeline) is one short transaction on its own connection,
+    independent of the request's session. Upserts use INSERT ... ON CONFLICT,
+    which SQLite (3.24+) and PostgreSQL both support. Expired rows are
+    ignored on read and purged every SWEEP_EVERY writes.
+    """
+
+    SWEEP_EVERY = 500
+
+    def __init__(self, engine=None):
+        self._engine = engine
+        self._writes = 0
+
+    @property
+    def engine(self):
+        return self._engine or db.engine
+
+    def _get(self, conn, key):
+        row = conn.execute(
+            select(state_table.c.value).where(
+                state_table.c.key == key,
+                (state_table.c.expires_at.is_(None)) | (state_table.c.expires_at > time.time()),
+            )
+        ).first()
+        return _encode(row[0]) if row else None
+
+    def _set(self, conn, key, value, ex=None, nx=False):
+        now = time.time()
+        sql = (
+            'INSERT INTO kv_store (key, value, expires_at) VALUES (:key, :value, :expires_at) '
+            'ON CONFLICT (key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at'
+        )
+        if nx:
+            # Only an expired row may be replaced; a live one leaves the upsert a no-op
+            sql += ' WHERE kv_store.expires_at IS NOT NULL AND kv_store.expires_at <= :now'
+        result = conn.execute(text(sql), {
+            'key': key, 'value': _encode(value).decode('utf-8'),
+            'expires_at': now + ex if ex else None, 'now': now,
+        })
+        return True if result.rowcount else None
+
+    def _setex(self, conn, key, ttl, value):
+        return self._set(conn, key, value, ex=ttl)
+
+    def _delete(self, conn, *keys):
+        return conn.execute(delete(state_table).where(state_table.c.key.in_(keys))).rowcount
+
+    def _incr(self, conn, key):
+        # An expired counter starts again from 1 without its old TTL, as in Redis
+        conn.execute(text(
+            "INSERT INTO kv_store (key, value, expires_at) VALUES (:key, '1', NULL) "
+            'ON CONFLICT (key) DO UPDATE SET '
+            "value = CASE WHEN kv_store.expires_at <= :now THEN '1' "
+            'ELSE CAST(CAST(kv_store.value AS INTEGER) + 1 AS VARCHAR(32)) END, '
+            'expires_at = CASE WHEN kv_store.expires_at <= :now THEN NULL ELSE kv_store.expires_at END'
+        ), {'key': key, 'now': time.time()})
+        return int(conn.execute(select(state_table.c.value).where(state_table.c.key == key)).scalar())
+
+    def _expire(self, conn, key, ttl):
+        now = time.time()
+        return conn.execute(
+            state_table.update()
+            .where(state_table.c.key == key,
+                   (state_table.c.expires_at.is_(None)) | (state_table.c.expires_at > now))
+            .values(expires_at=now + ttl)
+        ).rowcount > 0
+
+    def _sweep(self, conn):
+        conn.execute(delete(state_table).where(state_table.c.expires_at <= time.time()))
+
+    def run_batch(self, commands):
+        with self.engine.begin() as conn:
+            results = [getattr(self, f'_{name}')(conn, *args) for name, args in commands]
+            if any(name != 'get' for name, _ in commands):
+                self._writes += 1
+                if self._writes % self.SWEEP_EVERY == 0:
+                    self._sweep(conn)
+        return results
+
+
+def build_state_store(kind, redis_client=None, max_entries=10000):
+    """Pick a store: 'redis', 'database', 'memory' or 'none'.
+
+    The default is Redis when a client (a LazyRedis) is given, otherwise the
+    database table, which every worker on the node shares. Redis falls back
+    to the table while its circuit breaker is open.
+    """
+    kind = (kind or ('redis' if redis_client is not None else 'database')).lower()
+    if kind == 'none':
+        return None
+    if kind == 'redis' and redis_client is not None:
+        return Failover(redis_client, TableStore())
+    if kind == 'memory':
+        return MemoryStore(max_entries)
+    return TableStore()
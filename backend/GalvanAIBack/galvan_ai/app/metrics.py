@@ -0,0 +1,156 @@
+"""Prometheus metrics for requests and database queries, served on /metrics.
+
+Per endpoint (the Flask endpoint name, e.g. 'api.get_projects', so label
+cardinality stays bounded): request latency and response size histograms,
+a request counter by status, and the number and duration of SQL queries run
+while handling the request (from SQLAlchemy cursor events).
+
+Under a pre-fork server each worker writes its samples to files in
+PROMETHEUS_MULTIPROC_DIR and /metrics aggregates them (serve.py sets this
+up). prometheus_client reads that variable when it is first imported, so it
+is imported in init_metrics(), not at module load. Without prometheus_client
+installed, or with METRICS_ENABLED=0, nothing is registered.
+
+/metrics is only exposed with METRICS_TOKEN set (scrapes must send it as a
+bearer token) or with METRICS_PUBLIC=1, for a port reachable only from
+inside the network; otherwise metrics stay off.
+"""
+
+import hmac
+import importlib.util
+import os
+import time
+
+from flask import Response, current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+UNMATCHED = '<unmatched>'
+
+_metrics = None
+
+
+class _Metrics:
+    def __init__(self):
+        from prometheus_client import Counter, Gauge, Histogram
+
+        self.requests = Counter(
+            'http_requests_total', 'HTTP requests handled', ['method', 'endpoint', 'status'])
+        self.latency = Histogram(
+            'http_request_duration_seconds', 'Time spent handling a request',
+            ['method', 'endpoint'], buckets=LATENCY_BUCKETS)
+        self.response_size = Histogram(
+            'http_response_size_bytes', 'Response body size as sent (after compression)',
+            ['endpoint'], buckets=SIZE_BUCKETS)
+        self.in_progress = Gauge(
+            'http_requests_in_progress', 'Requests being handled', ['method'], multiprocess_mode='livesum')
+        self.db_queries = Histogram(
+            'http_request_db_queries', 'SQL queries run per request',
+            ['endpoint'], buckets=QUERY_COUNT_BUCKETS)
+        self.db_duration = Histogram(
+            'db_query_duration_seconds', 'Time spent in one SQL query',
+            ['endpoint'], buckets=QUERY_BUCKETS)
+
+
+def _endpoint():
+    return request.endpoint or UNMATCHED
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info['query_start'].pop()
+    if not has_request_context() or 'metrics_start' not in g:
+        # Startup, migrations and CLI commands are not request traffic
+        return
+    elapsed = time.perf_counter() - started
+    g.metrics_queries += 1
+    _metrics.db_duration.labels(_endpoint()).observe(elapsed)
+
+
+def _handle_error(exception_context):
+    # A failed query never reaches after_cursor_execute
+    conn = exception_context.connection
+    if conn is not None and conn.info.get('query_start'):
+        conn.info['query_start'].pop()
+
+
+def _before_request():
+    g.metrics_start = time.perf_counter()
+    g.metrics_queries = 0
+    _metrics.in_progress.labels(request.method).inc()
+
+
+def _after_request(response):
+    if 'metrics_start' not in g:
+        return response
+    elapsed = time.perf_counter() - g.pop('metrics_start')
+    endpoint = _endpoint()
+    _metrics.in_progress.labels(request.method).dec()
+    _metrics.requests.labels(request.method, endpoint, str(response.status_code)).inc()
+    _metrics.latency.labels(request.method, endpoint).observe(elapsed)
+    _metrics.db_queries.labels(endpoint).observe(g.metrics_queries)
+    if response.content_length is not None:
+        _metrics.response_size.labels(endpoint).observe(response.content_length)
+    return response
+
+
+def _teardown_request(exc):
+    # Keeps the in-progress gauge balanced if a later after_request hook raised
+    if 'metrics_start' in g:
+        g.pop('metrics_start')
+        _metrics.in_progress.labels(request.method).dec()
+
+
+def metrics_view():
+    from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest
+    from prometheus_client import multiprocess
+
+    token = current_app.config.get('METRICS_TOKEN')
+    if token:
+        supplied = request.headers.get('Authorization', '').removeprefix('Bearer ').strip()
+        if not hmac.compare_digest(supplied, token):
+            return Response('Unauthorized\n', 401, mimetype='text/plain')
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+
+
+def init_metrics(app):
+    """Register the request hooks and the /metrics route; False when metrics are off."""
+    global _metrics
+    if not app.config.get('METRICS_ENABLED'):
+        return False
+    if not app.config.get('METRICS_TOKEN') and not app.config.get('METRICS_PUBLIC'):
+        app.logger.info('Neither METRICS_TOKEN nor METRICS_PUBLIC is set; /metrics is disabled')
+        return False
+    if importlib.util.find_spec('prometheus_client') is None:
+        app.logger.info('prometheus_client is not installed; /metrics is disabled')
+        return False
+    if _metrics is None:
+        _metrics = _Metrics()
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
+    return True
+
+
+def mark_process_dead(pid):
+    """gunicorn child_exit hook: drop a dead worker's live gauge samples."""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,313 @@
+"""Versioned schema migrations.
+
+Each module in app/migrations/versions is one step, named NNNN_description.py
+and defining upgrade(ctx) and downgrade(ctx). Applied versions are recorded in
+the schema_migrations table. Run them with the CLI (see app/migrations/cli.py):
+
+    flask --app run db upgrade
+"""
+
+import importlib
+import pkgutil
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from sqlalchemy import inspect, text
+
+VERSION_TABLE = 'schema_migrations'
+BASE = 'base'
+
+
+class MigrationError(RuntimeError):
+    """Raised when migrations cannot be resolved or a step cannot run."""
+
+
+class Migration:
+    def __init__(self, module):
+        name = module.__name__.rsplit('.', 1)[-1]
+        self.revision, _, slug = name.partition('_')
+        self.module = module
+        self.description = (module.__doc__ or slug.replace('_', ' ')).strip().splitlines()[0]
+        # Steps with batched backfills commit as they go instead of running in one transaction
+        self.transactional = getattr(module, 'transactional', True)
+
+    def upgrade(self, ctx):
+        self.module.upgrade(ctx)
+
+    def downgrade(self, ctx):
+        self.module.downgrade(ctx)
+
+    def __repr__(self):
+        return f'<Migration {self.revision} {self.description}>'
+
+
+def load_migrations(package='app.migrations.versions'):
+    pkg = importlib.import_module(package)
+    migrations = [
+        Migration(importlib.import_module(f'{package}.{info.name}'))
+        for info in pkgutil.iter_modules(pkg.__path__)
+        if info.name[:1].isdigit()
+    ]
+    migrations.sort(key=lambda m: m.revision)
+    revisions = [m.revision for m in migrations]
+    if len(set(revisions)) != len(revisions):
+        raise MigrationError(f'Duplicate migration revisions in {package}: {revisions}')
+    return migrations
+
+
+class MigrationContext:
+    """What a migration step gets: an autocommit connection plus schema helpers.
+
+    Statements run outside a transaction unless wrapped in transaction();
+    the runner wraps whole transactional steps for you.
+    """
+
+    def __init__(self, conn, transactional=True, log=print):
+        self.conn = conn
+        self.transactional = transactional
+        self.log = log
+        self._in_transaction = False
+
+    @property
+    def dialect(self):
+        return self.conn.dialect.name
+
+    @contextmanager
+    def transaction(self):
+        if self._in_transaction:
+            yield
+            return
+        # BEGIN IMMEDIATE takes SQLite's write lock up front so two runners serialize
+        self.conn.exec_driver_sql('BEGIN IMMEDIATE' if self.dialect == 'sqlite' else 'BEGIN')
+        self._in_transaction = True
+        try:
+            yield
+        except Exception:
+            self.conn.exec_driver_sql('ROLLBACK')
+            raise
+        else:
+            self.conn.exec_driver_sql('COMMIT')
+        finally:
+            self._in_transaction = False
+
+    def execute(self, sql, params=None):
+        return self.conn.execute(text(sql) if isinstance(sql, str) else sql, params or {})
+
+    def has_table(self, table):
+        return inspect(self.conn).has_table(table)
+
+    def columns(self, table):
+        return {c['name']: c for c in inspect(self.conn).get_columns(table)}
+
+    def has_column(self, table, column):
+        return self.has_table(table) and column in self.columns(table)
+
+    def has_index(self, table, name):
+        return self.has_table(table) and any(ix['name'] == name for ix in inspect(self.conn).get_indexes(table))
+
+    def add_column(self, table, column, ddl):
+        if self.has_column(table, column):
+            return False
+        self.execute(f'ALTER TABLE {quote(table)} ADD COLUMN {quote(column)} {ddl}')
+        return True
+
+    def drop_column(self, table, column):
+        if not self.has_column(table, column):
+            return False
+        self.execute(f'ALTER TABLE {quote(table)} DROP COLUMN {quote(column)}')
+        return True
+
+    def create_index(self, name, table, columns, unique=False):
+        if self.has_index(table, name):
+            return False
+        cols = ', '.join(quote(c) for c in columns)
+        self.execute(f'CREATE {"UNIQUE " if unique else ""}INDEX {quote(name)} ON {quote(table)} ({cols})')
+        return True
+
+    def drop_index(self, table, name):
+        if not self.has_index(table, name):
+            return False
+        self.execute(f'DROP INDEX {quote(name)}')
+        return True
+
+    def batches(self, table, columns=('id',), where=None, params=None, batch_size=500):
+        """Yield lists of rows in id order, batch_size at a time (keyset on id)."""
+        cols = ', '.join(quote(c) for c in dict.fromkeys(('id',) + tuple(columns)))
+        condition = f' AND ({where})' if where else ''
+        last_id = 0
+        while True:
+            rows = self.execute(
+                f'SELECT {cols} FROM {quote(table)} WHERE id > :last_id{condition} '
+                f'ORDER BY id LIMIT :batch_size',
+                dict(params or {}, last_id=last_id, batch_size=batch_size),
+            ).mappings().all()
+            if not rows:
+                return
+            yield rows
+            last_id = rows[-1]['id']
+
+    def backfill(self, table, assignments, where, params=None, batch_size=500, pause=0.0):
+        """UPDATE table SET assignments WHERE where, batch_size rows per transaction.
+
+        Each batch commits on its own, so writers are never blocked for longer
+        than one batch and an interrupted backfill resumes where it stopped
+        (where must exclude rows that are already done). pause sleeps between
+        batches to leave room for live traffic. Returns the rows updated.
+        """
+        if self.transactional:
+            raise MigrationError('backfill() needs a migration with transactional = False')
+        updated = 0
+        for rows in self.batches(table, where=where, params=params, batch_size=batch_size):
+            with self.transaction():
+                result = self.execute(
+                    f'UPDATE {quote(table)} SET {assignments} '
+                    f'WHERE id >= :first_id AND id <= :last_id AND ({where})',
+                    dict(params or {}, first_id=rows[0]['id'], last_id=rows[-1]['id']),
+                )
+            updated += result.rowcount or 0
+            if pause:
+                time.sleep(pause)
+        return updated
+
+
+def quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+class Migrator:
+    def __init__(self, engine, migrations=None, log=print):
+        self.engine = engine
+        self.migrations = migrations if migrations is not None else load_migrations()
+        self.log = log
+
+    @contextmanager
+    def _connect(self):
+        with self.engine.connect() as conn:
+            # Transactions are explicit (MigrationContext.transaction), so DDL
+            # is transactional on SQLite too instead of pysqlite's implicit handling
+            yield conn.execution_options(isolation_level='AUTOCOMMIT')
+
+    def _ensure_version_table(self, conn):
+        conn.execute(text(
+            f'CREATE TABLE IF NOT EXISTS {VERSION_TABLE} ('
+            'version VARCHAR(32) PRIMARY KEY, description VARCHAR(255), applied_at DATETIME)'
+        ))
+
+    def _applied(self, conn):
+        if not inspect(conn).has_table(VERSION_TABLE):
+            return set()
+        return {row[0] for row in conn.execute(text(f'SELECT version FROM {VERSION_TABLE}'))}
+
+    def applied(self):
+        with self._connect() as conn:
+            return self._applied(conn)
+
+    def current(self):
+        applied = self.applied()
+        known = [m.revision for m in self.migrations if m.revision in applied]
+        return known[-1] if known else None
+
+    def pending(self):
+        applied = self.applied()
+        return [m for m in self.migrations if m.revision not in applied]
+
+    def _resolve(self, target):
+        if target in (None, 'head'):
+            return self.migrations[-1].revision if self.migrations else BASE
+        if target == BASE:
+            return BASE
+        for migration in self.migrations:
+            if migration.revision == target or migration.revision == target.zfill(len(migration.revision)):
+                return migration.revision
+        raise MigrationError(f'Unknown revision: {target}')
+
+    def _record(self, ctx, migration):
+        ctx.execute(
+            f'INSERT INTO {VERSION_TABLE} (version, description, applied_at) VALUES (:v, :d, :t)',
+            {'v': migration.revision, 'd': migration.description[:255], 't': datetime.utcnow()},
+        )
+
+    def upgrade(self, target=None):
+        """Apply pending migrations up to and including target (default: all)."""
+        target = self._resolve(target)
+        done = []
+        with self._connect() as conn:
+            self._ensure_version_table(conn)
+            for migration in self.migrations:
+                if target != BASE and migration.revision > target:
+                    break
+                ctx = MigrationContext(conn, migration.transactional, self.log)
+                if migration.transactional:
+                    with ctx.transaction():
+                        # Re-checked under the write lock in case another runner got here first
+                        if migration.revision in self._applied(conn):
+                            continue
+                        self.log(f'⬆️ {migration.revision} {migration.description}')
+                        migration.upgrade(ctx)
+                        self._record(ctx, migration)
+                else:
+                    if migration.revision in self._applied(conn):
+                        continue
+                    self.log(f'⬆️ {migration.revision} {migration.description}')
+                    migration.upgrade(ctx)
+                    with ctx.transaction():
+                        self._record(ctx, migration)
+                done.append(migration.revision)
+        return done
+
+    def downgrade(self, target):
+        """Revert applied migrations newer than target ('base' reverts everything)."""
+        target = self._resolve(target)
+        done = []
+        with self._connect() as conn:
+            applied = self._applied(conn)
+            for migration in reversed(self.migrations):
+                if target != BASE and migration.revision <= target:
+                    break
+                if migration.revision not in applied:
+                    continue
+                ctx = MigrationContext(conn, migration.transactional, self.log)
+                self.log(f'⬇️ {migration.revision} {migration.description}')
+                if migration.transactional:
+                    with ctx.transaction():
+                        migration.downgrade(ctx)
+                        ctx.execute(f'DELETE FROM {VERSION_TABLE} WHERE version = :v', {'v': migration.revision})
+                else:
+                    migration.downgrade(ctx)
+                    with ctx.transaction():
+                        ctx.execute(f'DELETE FROM {VERSION_TABLE} WHERE version = :v', {'v': migration.revision})
+                done.append(migration.revision)
+        return done
+
+    def stamp(self, target):
+        """Mark migrations up to target as applied without running them."""
+        target = self._resolve(target)
+        with self._connect() as conn:
+            self._ensure_version_table(conn)
+            ctx = MigrationContext(conn, True, self.log)
+            with ctx.transaction():
+                ctx.execute(f'DELETE FROM {VERSION_TABLE}')
+                for migration in self.migrations:
+                    if target == BASE or migration.revision > target:
+                        break
+                    self._record(ctx, migration)
+
+
+def check_migrations(app, engine):
+    """Startup hook: run pending migrations when AUTO_MIGRATE is set, otherwise only warn.
+
+    Costs one query when the schema is current, so workers boot without
+    reflecting or creating tables.
+    """
+    migrator = Migrator(engine, log=app.logger.info)
+    if app.config.get('AUTO_MIGRATE'):
+        migrator.upgrade()
+        return []
+    pending = migrator.pending()
+    if pending:
+        app.logger.warning(
+            'Database schema is behind by %d migration(s) (%s); run `flask --app run db upgrade`',
+            len(pending), ', '.join(m.revision for m in pending),
+        )
+    return pending
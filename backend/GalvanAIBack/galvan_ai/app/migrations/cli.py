@@ -0,0 +1,61 @@
+import click
+from flask.cli import AppGroup
+
+from app import db
+from app.migrations import BASE, MigrationError, Migrator
+
+db_cli = AppGroup('db', help='Versioned schema migrations.')
+
+
+def _migrator():
+    return Migrator(db.engine, log=click.echo)
+
+
+@db_cli.command('upgrade')
+@click.argument('target', default='head')
+def upgrade(target):
+    """Apply pending migrations up to TARGET (default: head)."""
+    try:
+        done = _migrator().upgrade(target)
+    except MigrationError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"✅ Applied {len(done)} migration(s)" if done else "✓ Database is up to date")
+
+
+@db_cli.command('downgrade')
+@click.argument('target')
+@click.confirmation_option(prompt='This reverts schema changes and may drop data. Continue?')
+def downgrade(target):
+    """Revert migrations newer than TARGET ('base' reverts everything)."""
+    try:
+        done = _migrator().downgrade(target)
+    except MigrationError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"✅ Reverted {len(done)} migration(s)")
+
+
+@db_cli.command('current')
+def current():
+    """Show the newest applied revision."""
+    click.echo(_migrator().current() or BASE)
+
+
+@db_cli.command('history')
+def history():
+    """List all migrations and whether they are applied."""
+    migrator = _migrator()
+    applied = migrator.applied()
+    for migration in migrator.migrations:
+        mark = '✓' if migration.revision in applied else ' '
+        click.echo(f"[{mark}] {migration.revision} {migration.description}")
+
+
+@db_cli.command('stamp')
+@click.argument('target')
+def stamp(target):
+    """Record migrations up to TARGET as applied without running them."""
+    try:
+        _migrator().stamp(target)
+    except MigrationError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"✓ Stamped {target}")
@@ -0,0 +1,13 @@
+"""Create the tables for all models"""
+
+from app import db
+# Imported for their side effect of registering the tables on db.metadata
+from app.models import blog, career, contact_quote, job_application, project, questionnaire, team, testimonial, user  # noqa: F401
+
+
+def upgrade(ctx):
+    db.metadata.create_all(ctx.conn, checkfirst=True)
+
+
+def downgrade(ctx):
+    db.metadata.drop_all(ctx.conn, checkfirst=True)
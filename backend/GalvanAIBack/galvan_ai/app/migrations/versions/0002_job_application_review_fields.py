@@ -0,0 +1,19 @@
+"""Add status, notes and updated_at to job applications"""
+
+transactional = False
+
+
+def upgrade(ctx):
+    with ctx.transaction():
+        ctx.add_column('job_applications', 'status', 'VARCHAR(50)')
+        ctx.add_column('job_applications', 'notes', 'TEXT')
+        ctx.add_column('job_applications', 'updated_at', 'DATETIME')
+    pending = ctx.backfill('job_applications', "status = 'pending'", 'status IS NULL')
+    stamped = ctx.backfill('job_applications', 'updated_at = created_at', 'updated_at IS NULL')
+    ctx.log(f'✓ {pending} application(s) set to pending, {stamped} given updated_at')
+
+
+def downgrade(ctx):
+    with ctx.transaction():
+        for column in ('updated_at', 'notes', 'status'):
+            ctx.drop_column('job_applications', column)
@@ -0,0 +1,27 @@
+"""Split team background_interests into background and interests"""
+
+transactional = False
+
+
+def upgrade(ctx):
+    with ctx.transaction():
+        ctx.add_column('team', 'background', 'TEXT')
+        ctx.add_column('team', 'interests', 'TEXT')
+    if ctx.has_column('team', 'background_interests'):
+        # Valid JSON arrays move over as-is, anything else becomes a one-element array
+        moved = ctx.backfill(
+            'team',
+            "interests = CASE WHEN json_valid(background_interests) THEN background_interests "
+            "ELSE json_array(background_interests) END",
+            'interests IS NULL AND background_interests IS NOT NULL',
+        )
+        ctx.log(f'✓ {moved} team member(s): background_interests -> interests')
+        with ctx.transaction():
+            ctx.drop_column('team', 'background_interests')
+    ctx.backfill('team', "background = '[]'", 'background IS NULL')
+    ctx.backfill('team', "interests = '[]'", 'interests IS NULL')
+
+
+def downgrade(ctx):
+    # The split is not reversible; background and interests are kept
+    pass
@@ -0,0 +1,99 @@
+"""Turn the JSON-in-Text list columns into native JSON columns"""
+
+import re
+
+from app.migrations import quote
+from app.models.blog import BlogPost
+from app.models.career import Career
+from app.models.job_application import JobApplication
+from app.models.project import Project
+from app.models.questionnaire import Questionnaire
+from app.models.team import Team
+from app.models.testimonial import Testimonial
+from app.models.types import JSONText
+
+MODELS = (Project, BlogPost, Testimonial, Team, Career, Questionnaire, JobApplication)
+
+
+def json_columns(model):
+    return [c.name for c in model.__table__.columns if isinstance(c.type, JSONText)]
+
+
+def normalize_invalid_json(ctx, table, columns):
+    fixed = 0
+    for column in columns:
+        col = quote(column)
+        result = ctx.execute(
+            f"UPDATE {quote(table)} SET {col} = json_array({col}) "
+            f"WHERE {col} IS NOT NULL AND json_valid({col}) = 0"
+        )
+        fixed += result.rowcount or 0
+    return fixed
+
+
+def rebuild_sqlite_table(ctx, table, columns, old_type, new_type):
+    """SQLite cannot ALTER a column type, so copy the rows into a rebuilt table.
+
+    The table is recreated from its own stored CREATE statement with only the
+    declared types of the given columns changed, so existing constraints and
+    indexes and triggers are kept exactly as they are in this database.
+    """
+    create_sql = ctx.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name", {'name': table}).scalar()
+    index_sql = [row[0] for row in ctx.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = :name AND sql IS NOT NULL", {'name': table})]
+    trigger_sql = [row[0] for row in ctx.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = :name", {'name': table})]
+    for column in columns:
+        pattern = r'((?:^|[\s,(])["`\[]?' + re.escape(column) + r'["`\]]?\s+)' + old_type + r'\b'
+        create_sql, count = re.subn(pattern, r'\1' + new_type, create_sql, count=1)
+        if not count:
+            raise RuntimeError(f"Could not find column {column} in {table} schema")
+
+    old_name = f"{table}__pre_json"
+    ctx.execute(f"ALTER TABLE {quote(table)} RENAME TO {quote(old_name)}")
+    ctx.execute(create_sql)
+    ctx.execute(f"INSERT INTO {quote(table)} SELECT * FROM {quote(old_name)}")
+    ctx.execute(f"DROP TABLE {quote(old_name)}")
+    for sql in index_sql + trigger_sql:
+        ctx.execute(sql)
+
+
+def declared_types(ctx, table):
+    return {name: str(column['type']).upper() for name, column in ctx.columns(table).items()}
+
+
+def upgrade(ctx):
+    for model in MODELS:
+        table = model.__table__.name
+        declared = declared_types(ctx, table)
+        pending = [c for c in json_columns(model) if c in declared and declared[c] not in ('JSON', 'JSONB')]
+        if not pending:
+            continue
+
+        if ctx.dialect == 'sqlite':
+            fixed = normalize_invalid_json(ctx, table, pending)
+            rebuild_sqlite_table(ctx, table, pending, 'TEXT', 'JSON')
+        else:
+            fixed = 0
+            for column in pending:
+                col = quote(column)
+                ctx.execute(
+                    f"ALTER TABLE {quote(table)} ALTER COLUMN {col} TYPE JSON USING "
+                    f"CASE WHEN {col} IS NULL THEN NULL ELSE {col}::json END"
+                )
+        ctx.log(f"✓ {table}: {', '.join(pending)} -> JSON ({fixed} invalid value(s) wrapped)")
+
+
+def downgrade(ctx):
+    for model in MODELS:
+        table = model.__table__.name
+        declared = declared_types(ctx, table)
+        columns = [c for c in json_columns(model) if declared.get(c) in ('JSON', 'JSONB')]
+        if not columns:
+            continue
+        if ctx.dialect == 'sqlite':
+            rebuild_sqlite_table(ctx, table, columns, 'JSON', 'TEXT')
+        else:
+            for column in columns:
+                ctx.execute(f"ALTER TABLE {quote(table)} ALTER COLUMN {quote(column)} TYPE TEXT")
@@ -0,0 +1,63 @@
+"""Move inline base64 images into the content-addressed blob store"""
+
+import base64
+
+from app.blobstore import BLOB_COLUMNS, BLOB_REF_PREFIX, externalize, get_blob_store
+from app.migrations import quote
+
+transactional = False
+
+# model name in BLOB_COLUMNS -> table
+TABLES = {'Project': 'project', 'BlogPost': 'blog_post', 'Team': 'team', 'Testimonial': 'testimonial'}
+BATCH_SIZE = 100
+
+
+def _rewrite(ctx, table, columns, convert, where):
+    changed = 0
+    for rows in ctx.batches(table, columns, where=where, batch_size=BATCH_SIZE):
+        updates = []
+        for row in rows:
+            values = {c: convert(row[c]) for c in columns}
+            values = {c: v for c, v in values.items() if v is not row[c]}
+            if values:
+                updates.append((row['id'], values))
+        # One short transaction per batch so live writers are never held up for long
+        with ctx.transaction():
+            for row_id, values in updates:
+                assignments = ', '.join(f'{quote(c)} = :{c}' for c in values)
+                ctx.execute(f'UPDATE {quote(table)} SET {assignments} WHERE id = :id', dict(values, id=row_id))
+        changed += sum(len(values) for _, values in updates)
+    return changed
+
+
+def upgrade(ctx):
+    store = get_blob_store()
+    total = 0
+    for name, table in TABLES.items():
+        columns = BLOB_COLUMNS[name]
+        where = ' OR '.join(f"{quote(c)} LIKE 'data:%'" for c in columns)
+        moved = _rewrite(ctx, table, columns, lambda value: externalize(value, store), where)
+        total += moved
+        ctx.log(f'✓ {table}: {moved} image(s) moved to {store.root}')
+    if total and ctx.dialect == 'sqlite':
+        # Reclaim the space the inline images took up
+        ctx.execute('VACUUM')
+
+
+def downgrade(ctx):
+    store = get_blob_store()
+
+    def inline(value):
+        if not isinstance(value, str) or not value.startswith(BLOB_REF_PREFIX):
+            return value
+        digest = value[len(BLOB_REF_PREFIX):]
+        if not store.exists(digest):
+            return value
+        with open(store.path(digest), 'rb') as f:
+            data = base64.b64encode(f.read()).decode('ascii')
+        return f'data:{store.content_type(digest)};base64,{data}'
+
+    for name, table in TABLES.items():
+        columns = BLOB_COLUMNS[name]
+        where = ' OR '.join(f"{quote(c)} LIKE '{BLOB_REF_PREFIX}%'" for c in columns)
+        _rewrite(ctx, table, columns, inline, where)
@@ -0,0 +1,33 @@
+"""Add the secondary indexes used by the API list routes"""
+
+# (index name, table, columns) - keep in sync with the models' __table_args__
+INDEXES = [
+    ('ix_project_created_at', 'project', ('created_at',)),
+    ('ix_project_best_created_at', 'project', ('best_project', 'created_at')),
+    ('ix_blog_created_at', 'blog_post', ('created_at',)),
+    ('ix_blog_featured_created_at', 'blog_post', ('featured', 'created_at')),
+    ('ix_testimonial_created_at', 'testimonial', ('created_at',)),
+    ('ix_testimonial_featured_created_at', 'testimonial', ('featured', 'created_at')),
+    ('ix_team_created_at', 'team', ('created_at',)),
+    ('ix_career_created_at', 'career', ('created_at',)),
+    ('ix_career_active_created_at', 'career', ('is_active', 'created_at')),
+    ('ix_questionnaire_created_at', 'questionnaires', ('created_at',)),
+    ('ix_questionnaire_job_created_at', 'questionnaires', ('job_id', 'created_at')),
+    ('ix_questionnaire_active_created_at', 'questionnaires', ('is_active', 'created_at')),
+    ('ix_jobapp_created_at', 'job_applications', ('created_at',)),
+    ('ix_jobapp_job_created_at', 'job_applications', ('job_id', 'created_at', 'id')),
+    ('ix_jobapp_job_status_created_at', 'job_applications', ('job_id', 'status', 'created_at')),
+    ('ix_jobapp_status_created_at', 'job_applications', ('status', 'created_at')),
+    ('ix_contact_created_at', 'contact_quotes', ('created_at',)),
+]
+
+
+def upgrade(ctx):
+    for name, table, columns in INDEXES:
+        if ctx.create_index(name, table, columns):
+            ctx.log(f'✓ {name} created')
+
+
+def downgrade(ctx):
+    for name, table, _ in reversed(INDEXES):
+        ctx.drop_index(table, name)
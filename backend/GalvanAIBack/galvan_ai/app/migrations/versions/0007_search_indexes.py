@@ -0,0 +1,12 @@
+"""Create the FTS5 indexes behind /api/search"""
+
+from app.search import create_search_indexes, drop_search_indexes
+
+
+def upgrade(ctx):
+    if not create_search_indexes(ctx.conn):
+        ctx.log('! FTS5 unavailable, /api/search will use LIKE matching')
+
+
+def downgrade(ctx):
+    drop_search_indexes(ctx.conn)
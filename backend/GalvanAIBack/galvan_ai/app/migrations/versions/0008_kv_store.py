@@ -0,0 +1,11 @@
+"""Create the kv_store table for idempotency keys and captcha counters without Redis"""
+
+from app.kvstore import state_table
+
+
+def upgrade(ctx):
+    state_table.create(ctx.conn, checkfirst=True)
+
+
+def downgrade(ctx):
+    state_table.drop(ctx.conn, checkfirst=True)
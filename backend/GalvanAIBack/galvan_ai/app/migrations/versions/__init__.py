@@ -0,0 +1,7 @@
+"""Migration steps, applied in revision order.
+
+0001 creates the schema from the current models, so on a fresh database the
+later steps find their changes already in place. Every step therefore checks
+before it alters (has_column, has_index, ...) and is safe to run on both fresh
+and long-lived databases.
+"""
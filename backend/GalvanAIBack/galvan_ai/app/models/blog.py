@@ -1,7 +1,15 @@
 from app import db
+from app.blobstore import blob_url
+from app.models.types import JSONText
+from app.models.serialization import SerializableMixin, isoformat, json_list
+from app.validation import Array, Boolean, Object, Schema, String
 from datetime import datetime
 
-class BlogPost(db.Model):
+class BlogPost(SerializableMixin, db.Model):
+    __table_args__ = (
+        db.Index('ix_blog_created_at', 'created_at'),
+        db.Index('ix_blog_featured_created_at', 'featured', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     excerpt = db.Column(db.Text, nullable=False)
@@ -13,43 +21,62 @@ class BlogPost(db.Model):
     publish_date = db.Column(db.String(50), nullable=False)
     category = db.Column(db.String(100), nullable=False)
     image = db.Column(db.Text, nullable=False)  # Store as base64 or URL
-    tags = db.Column(db.Text)  # Store as JSON string
+    tags = db.Column(JSONText)  # JSON array
     featured = db.Column(db.Boolean, default=False)
     intro = db.Column(db.Text, nullable=False)
-    key_concepts = db.Column(db.Text)  # Store as JSON string
+    key_concepts = db.Column(JSONText)  # JSON array
     implementation = db.Column(db.Text, nullable=False)
-    best_practices = db.Column(db.Text)  # Store as JSON string
+    best_practices = db.Column(JSONText)  # JSON array
     conclusion = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    def to_dict(self):
-        """Convert blog post to dictionary for JSON response"""
-        import json
-        return {
-            'id': self.id,
-            'title': self.title,
-            'excerpt': self.excerpt,
-            'author': {
-                'name': self.author_name,
-                'avatar': self.author_avatar,
-                'role': self.author_role,
-                'bio': self.author_bio
-            },
-            'readTime': self.read_time,
-            'publishDate': self.publish_date,
-            'category': self.category,
-            'image': self.image,
-            'tags': json.loads(self.tags) if self.tags else [],
-            'featured': self.featured,
-            'intro': self.intro,
-            'keyConcepts': json.loads(self.key_concepts) if self.key_concepts else [],
-            'implementation': self.implementation,
-            'bestPractices': json.loads(self.best_practices) if self.best_practices else [],
-            'conclusion': self.conclusion,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    SERIALIZATION = {
+        'id': 'id',
+        'title': 'title',
+        'excerpt': 'excerpt',
+        'author': {
+            'name': 'author_name',
+            'avatar': ('author_avatar', blob_url),
+            'role': 'author_role',
+            'bio': 'author_bio'
+        },
+        'readTime': 'read_time',
+        'publishDate': 'publish_date',
+        'category': 'category',
+        'image': ('image', blob_url),
+        'tags': ('tags', json_list),
+        'featured': 'featured',
+        'intro': 'intro',
+        'keyConcepts': ('key_concepts', json_list),
+        'implementation': 'implementation',
+        'bestPractices': ('best_practices', json_list),
+        'conclusion': 'conclusion',
+        'created_at': ('created_at', isoformat),
+        'updated_at': ('updated_at', isoformat)
+    }
+
+    SCHEMA = Schema({
+        'title': String(required=True),
+        'excerpt': String(required=True),
+        'author': Object({
+            'name': String(required=True),
+            'avatar': String(required=True),
+            'role': String(required=True),
+            'bio': String(required=True),
+        }, required=True),
+        'readTime': String(required=True),
+        'publishDate': String(required=True),
+        'category': String(required=True),
+        'image': String(required=True),
+        'tags': Array(),
+        'featured': Boolean(),
+        'intro': String(required=True),
+        'keyConcepts': Array(),
+        'implementation': String(required=True),
+        'bestPractices': Array(),
+        'conclusion': String(required=True),
+    })
 
     @staticmethod
     def from_dict(data):
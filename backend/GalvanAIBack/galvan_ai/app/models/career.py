@@ -1,7 +1,13 @@
 from app import db
+from app.models.types import JSONText
+from app.models.serialization import SerializableMixin, isoformat, json_list
 from datetime import datetime
 
-class Career(db.Model):
+class Career(SerializableMixin, db.Model):
+    __table_args__ = (
+        db.Index('ix_career_created_at', 'created_at'),
+        db.Index('ix_career_active_created_at', 'is_active', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     company = db.Column(db.String(200), nullable=False)
@@ -9,43 +15,45 @@ class Career(db.Model):
     type = db.Column(db.String(100), nullable=False)  # Full-time, Part-time, Contract, etc.
     department = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=False)
-    requirements = db.Column(db.Text)  # Store as JSON string
-    responsibilities = db.Column(db.Text)  # Store as JSON string
-    benefits = db.Column(db.Text)  # Store as JSON string
+    requirements = db.Column(JSONText)  # JSON array
+    responsibilities = db.Column(JSONText)  # JSON array
+    benefits = db.Column(JSONText)  # JSON array
     salary_range = db.Column(db.String(100))  # e.g., "$50,000 - $80,000"
     experience_level = db.Column(db.String(100))  # Entry, Mid, Senior, etc.
-    skills_required = db.Column(db.Text)  # Store as JSON string
+    skills_required = db.Column(JSONText)  # JSON array
     application_deadline = db.Column(db.Date)
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    def to_dict(self):
-        """Convert career to dictionary for JSON response"""
-        import json
-        return {
-            'id': self.id,
-            'title': self.title,
-            'company': self.company,
-            'location': self.location,
-            'type': self.type,
-            'department': self.department,
-            'description': self.description,
-            'requirements': json.loads(self.requirements) if self.requirements else [],
-            'responsibilities': json.loads(self.responsibilities) if self.responsibilities else [],
-            'benefits': json.loads(self.benefits) if self.benefits else [],
-            'salary_range': self.salary_range,
-            'experience_level': self.experience_level,
-            'skills_required': json.loads(self.skills_required) if self.skills_required else [],
-            'application_deadline': self.application_deadline.isoformat() if self.application_deadline else None,
-            'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    SERIALIZATION = {
+        'id': 'id',
+        'title': 'title',
+        'company': 'company',
+        'location': 'location',
+        'type': 'type',
+        'department': 'department',
+        'description': 'description',
+        'requirements': ('requirements', json_list),
+        'responsibilities': ('responsibilities', json_list),
+        'benefits': ('benefits', json_list),
+        'salary_range': 'salary_range',
+        'experience_level': 'experience_level',
+        'skills_required': ('skills_required', json_list),
+        'application_deadline': ('application_deadline', isoformat),
+        'is_active': 'is_active',
+        'created_at': ('created_at', isoformat),
+        'updated_at': ('updated_at', isoformat)
+    }
 
     @staticmethod
     def from_dict(data):
         """Create career from dictionary"""
+        return Career(**Career.columns_from_dict(data))
+
+    @staticmethod
+    def columns_from_dict(data):
+        """Column values for a career dictionary, shared by from_dict and bulk inserts"""
         import json
         from datetime import datetime
         
@@ -57,7 +65,7 @@ class Career(db.Model):
             except:
                 pass
 
-        return Career(
+        return dict(
             title=data['title'],
             company=data['company'],
             location=data['location'],
@@ -1,7 +1,8 @@
 from app import db
+from app.models.serialization import SerializableMixin, as_str, isoformat
 from datetime import datetime
 
-class ContactQuote(db.Model):
+class ContactQuote(SerializableMixin, db.Model):
     __tablename__ = 'contact_quotes'
     __table_args__ = (
         db.Index('ix_contact_created_at', 'created_at'),
@@ -13,15 +14,14 @@ class ContactQuote(db.Model):
     project_details = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
-    def to_dict(self):
-        return {
-            '_id': str(self.id),
-            'name': self.name,
-            'email': self.email,
-            'company': self.company,
-            'projectDetails': self.project_details,
-            'createdAt': self.created_at.isoformat() if self.created_at else None
-        }
+    SERIALIZATION = {
+        '_id': ('id', as_str),
+        'name': 'name',
+        'email': 'email',
+        'company': 'company',
+        'projectDetails': 'project_details',
+        'createdAt': ('created_at', isoformat)
+    }
 
     @staticmethod
     def from_dict(data):
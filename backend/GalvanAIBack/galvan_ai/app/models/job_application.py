@@ -1,11 +1,17 @@
 from app import db
 from datetime import datetime
+from app.models.types import JSONText
+from app.models.serialization import SerializableMixin, as_str, isoformat, json_list, json_value
 import json
 
-class JobApplication(db.Model):
+class JobApplication(SerializableMixin, db.Model):
     __tablename__ = 'job_applications'
     __table_args__ = (
         db.UniqueConstraint('applicant_email', 'job_id', name='uq_jobapp_email_job'),
+        db.Index('ix_jobapp_created_at', 'created_at'),
+        db.Index('ix_jobapp_job_created_at', 'job_id', 'created_at', 'id'),
+        db.Index('ix_jobapp_job_status_created_at', 'job_id', 'status', 'created_at'),
+        db.Index('ix_jobapp_status_created_at', 'status', 'created_at'),
     )
     id = db.Column(db.Integer, primary_key=True)
     job_id = db.Column(db.String(255), nullable=False)
@@ -14,31 +20,30 @@ class JobApplication(db.Model):
     applicant_email = db.Column(db.String(255), nullable=False)
     applicant_phone = db.Column(db.String(50), nullable=False)
     cover_letter = db.Column(db.Text, nullable=False)
-    resume = db.Column(db.Text, nullable=True)  # JSON string: fileUrl, fileName, fileSize, fileType, storageType
+    resume = db.Column(JSONText, nullable=True)  # JSON: fileUrl, fileName, fileSize, fileType, storageType
     questionnaire_id = db.Column(db.String(255), nullable=True)
-    responses = db.Column(db.Text, nullable=True)  # JSON string: list of {questionId, questionLabel, questionType, answer, fileUpload}
+    responses = db.Column(JSONText, nullable=True)  # JSON: list of {questionId, questionLabel, questionType, answer, fileUpload}
     status = db.Column(db.String(50), default='pending')  # pending, reviewed, shortlisted, rejected, hired
     notes = db.Column(db.Text, nullable=True)  # Admin notes about the application
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    def to_dict(self):
-        return {
-            '_id': str(self.id),
-            'jobId': self.job_id,
-            'jobTitle': self.job_title,
-            'applicantName': self.applicant_name,
-            'applicantEmail': self.applicant_email,
-            'applicantPhone': self.applicant_phone,
-            'coverLetter': self.cover_letter,
-            'resume': json.loads(self.resume) if self.resume else None,
-            'questionnaireId': self.questionnaire_id,
-            'responses': json.loads(self.responses) if self.responses else [],
-            'status': self.status,
-            'notes': self.notes,
-            'createdAt': self.created_at.isoformat() if self.created_at else None,
-            'updatedAt': self.updated_at.isoformat() if self.updated_at else None
-        }
+    SERIALIZATION = {
+        '_id': ('id', as_str),
+        'jobId': 'job_id',
+        'jobTitle': 'job_title',
+        'applicantName': 'applicant_name',
+        'applicantEmail': 'applicant_email',
+        'applicantPhone': 'applicant_phone',
+        'coverLetter': 'cover_letter',
+        'resume': ('resume', json_value),
+        'questionnaireId': 'questionnaire_id',
+        'responses': ('responses', json_list),
+        'status': 'status',
+        'notes': 'notes',
+        'createdAt': ('created_at', isoformat),
+        'updatedAt': ('updated_at', isoformat)
+    }
 
     @staticmethod
     def from_dict(data):
@@ -1,44 +1,74 @@
 from app import db
+from app.blobstore import blob_url
+from app.models.types import JSONText
+from app.models.serialization import SerializableMixin, isoformat, json_list
+from app.validation import Array, Boolean, Object, Schema, String
 from datetime import datetime
 
-class Project(db.Model):
+class Project(SerializableMixin, db.Model):
+    __table_args__ = (
+        db.Index('ix_project_created_at', 'created_at'),
+        db.Index('ix_project_best_created_at', 'best_project', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     hero_subtitle = db.Column(db.String(200), nullable=False)
     hero_description = db.Column(db.Text, nullable=False)
     hero_banner = db.Column(db.Text, nullable=False)  # Store as base64 or URL
-    gallery = db.Column(db.Text)  # Store as JSON string
-    features = db.Column(db.Text)  # Store as JSON string
-    team = db.Column(db.Text)  # Store as JSON string
-    timeline = db.Column(db.Text)  # Store as JSON string
-    testimonials = db.Column(db.Text)  # Store as JSON string
-    technologies = db.Column(db.Text)  # Store as JSON string
+    gallery = db.Column(JSONText)  # JSON array
+    features = db.Column(JSONText)  # JSON array
+    team = db.Column(JSONText)  # JSON array
+    timeline = db.Column(JSONText)  # JSON array
+    testimonials = db.Column(JSONText)  # JSON array
+    technologies = db.Column(JSONText)  # JSON array
     long_description = db.Column(db.Text, nullable=False)
     best_project = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    def to_dict(self):
-        """Convert project to dictionary for JSON response"""
-        import json
-        
-        return {
-            'id': self.id,
-            'hero': {
-                'subtitle': self.hero_subtitle,
-                'description': self.hero_description,
-                'banner': self.hero_banner
-            },
-            'gallery': json.loads(self.gallery) if self.gallery else [],
-            'features': json.loads(self.features) if self.features else [],
-            'team': json.loads(self.team) if self.team else [],
-            'timeline': json.loads(self.timeline) if self.timeline else [],
-            'testimonials': json.loads(self.testimonials) if self.testimonials else [],
-            'technologies': json.loads(self.technologies) if self.technologies else [],
-            'longDescription': self.long_description,
-            'bestProject': self.best_project,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    SERIALIZATION = {
+        'id': 'id',
+        'hero': {
+            'subtitle': 'hero_subtitle',
+            'description': 'hero_description',
+            'banner': ('hero_banner', blob_url)
+        },
+        'gallery': ('gallery', json_list),
+        'features': ('features', json_list),
+        'team': ('team', json_list),
+        'timeline': ('timeline', json_list),
+        'testimonials': ('testimonials', json_list),
+        'technologies': ('technologies', json_list),
+        'longDescription': 'long_description',
+        'bestProject': 'best_project',
+        'created_at': ('created_at', isoformat),
+        'updated_at': ('updated_at', isoformat)
+    }
+
+    SCHEMA = Schema({
+        'hero': Object({
+            'subtitle': String(required=True),
+            'description': String(required=True),
+            'banner': String(required=True),
+        }, required=True),
+        'longDescription': String(required=True),
+        'gallery': Array(String()),
+        'features': Array(),
+        'team': Array(Object({
+            'name': String(required=True),
+            'role': String(required=True),
+            'avatar': String(required=True),
+        }), item_label='Team member'),
+        'timeline': Array(Object({
+            'phase': String(required=True),
+            'date': String(required=True),
+        }), item_label='Timeline item'),
+        'testimonials': Array(Object({
+            'quote': String(required=True),
+            'author': String(required=True),
+        }), item_label='Testimonial'),
+        'technologies': Array(),
+        'bestProject': Boolean(),
+    })
 
     @staticmethod
     def from_dict(data):
@@ -1,29 +1,89 @@
 from app import db
 from datetime import datetime
+from app.models.types import JSONText
+from app.models.serialization import SerializableMixin, isoformat, json_list
+from app.validation import Array, Boolean, Integer, Number, Object, Schema, String
 import json
 
-class Questionnaire(db.Model):
+QUESTION_TYPES = ('text', 'textarea', 'select', 'radio', 'checkbox', 'file', 'email', 'phone', 'number', 'date')
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+
+# Applied when a text-like question is saved without its own validation
+DEFAULT_MAX_LENGTHS = {'text': 255, 'textarea': 2000, 'email': 254}
+
+_TEXT_VALIDATION = Object({
+    'minLength': Integer(label='minLength', min=0),
+    'maxLength': Integer(label='maxLength', min=1),
+}, checks=[(
+    lambda v: 'minLength' not in v or 'maxLength' not in v or v['minLength'] <= v['maxLength'],
+    'minLength', 'cannot be greater than maxLength',
+)])
+
+_CHOICE_FIELDS = {'options': Array(String(non_empty=True), required=True, min_items=1, item_label='option')}
+
+QUESTION = Object({
+    'id': String(required=True, label='ID'),
+    'type': String(required=True, choices=QUESTION_TYPES),
+    'label': String(required=True),
+    'required': Boolean(label='required field'),
+    'order': Integer(),
+    'validation': Object(),
+}, variants=('type', {
+    'text': {'validation': _TEXT_VALIDATION},
+    'textarea': {'validation': _TEXT_VALIDATION},
+    'email': {'validation': _TEXT_VALIDATION},
+    'number': {'validation': Object({'min': Number(), 'max': Number()})},
+    'file': {'validation': Object({
+        'allowedFileTypes': Array(String(non_empty=True), label='allowedFileTypes', min_items=1),
+        'maxFileSize': Integer(label='maxFileSize', min=1, max=MAX_UPLOAD_BYTES, message='must be between 1 byte and 50MB'),
+        'maxFiles': Integer(label='maxFiles', min=1, max=10),
+    })},
+    'select': _CHOICE_FIELDS,
+    'radio': _CHOICE_FIELDS,
+    'checkbox': _CHOICE_FIELDS,
+}))
+
+class Questionnaire(SerializableMixin, db.Model):
     __tablename__ = 'questionnaires'
+    __table_args__ = (
+        db.Index('ix_questionnaire_created_at', 'created_at'),
+        db.Index('ix_questionnaire_job_created_at', 'job_id', 'created_at'),
+        db.Index('ix_questionnaire_active_created_at', 'is_active', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     job_id = db.Column(db.String(255), nullable=False)
     title = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text, nullable=False)
-    questions = db.Column(db.Text, nullable=False)  # JSON string
+    questions = db.Column(JSONText, nullable=False)  # JSON array
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'jobId': self.job_id,
-            'title': self.title,
-            'description': self.description,
-            'questions': json.loads(self.questions) if self.questions else [],
-            'isActive': self.is_active,
-            'createdAt': self.created_at.isoformat() if self.created_at else None,
-            'updatedAt': self.updated_at.isoformat() if self.updated_at else None
-        }
+    SERIALIZATION = {
+        'id': 'id',
+        'jobId': 'job_id',
+        'title': 'title',
+        'description': 'description',
+        'questions': ('questions', json_list),
+        'isActive': 'is_active',
+        'createdAt': ('created_at', isoformat),
+        'updatedAt': ('updated_at', isoformat)
+    }
+
+    SCHEMA = Schema({
+        'jobId': String(required=True, label='Job ID'),
+        'title': String(required=True),
+        'description': String(required=True),
+        'questions': Array(QUESTION, required=True, min_items=1, item_label='Question'),
+        'isActive': Boolean(),
+    })
+
+    @staticmethod
+    def apply_default_validation(questions):
+        """Give text-like questions without validation their default maxLength"""
+        for question in questions:
+            if question['type'] in DEFAULT_MAX_LENGTHS and 'validation' not in question:
+                question['validation'] = {'maxLength': DEFAULT_MAX_LENGTHS[question['type']]}
 
     @staticmethod
     def from_dict(data):
@@ -0,0 +1,114 @@
+from sqlalchemy.orm import load_only
+
+from app.json_provider import RawJSON
+
+
+class FieldSelectionError(ValueError):
+    """Raised when a ?fields= selection names keys the model does not expose."""
+
+
+def isoformat(value):
+    return value.isoformat() if value else None
+
+
+# JSONText columns load as the stored text, validated when it was written
+# (see app/models/types.py), so it is passed to jsonify() as RawJSON and
+# spliced into the response instead of being decoded and encoded again.
+
+def json_list(value):
+    if isinstance(value, str):
+        return RawJSON(value) if value else []
+    return value or []
+
+
+def json_value(value):
+    if isinstance(value, str):
+        return RawJSON(value) if value else None
+    return value or None
+
+
+def as_str(value):
+    return str(value)
+
+
+class SerializableMixin:
+    """Declarative to_dict() with sparse fieldset support.
+
+    Subclasses define SERIALIZATION, mapping each output key to either a column
+    name, a (column, transform) pair, or a nested dict of the same for grouped
+    objects such as a blog post's author. The same spec drives both the JSON
+    shape and the columns loaded from the database.
+    """
+
+    SERIALIZATION = {}
+
+    @classmethod
+    def parse_fields(cls, raw):
+        """Parse 'title,author.name' into a selection tree, or None for all fields."""
+        if not raw:
+            return None
+        selection = {}
+        for path in raw.split(','):
+            path = path.strip()
+            if not path:
+                continue
+            spec = cls.SERIALIZATION
+            node = selection
+            parts = path.split('.')
+            for depth, part in enumerate(parts):
+                if not isinstance(spec, dict) or part not in spec:
+                    raise FieldSelectionError(f'Unknown field: {path}')
+                spec = spec[part]
+                if depth == len(parts) - 1:
+                    node[part] = True
+                elif node.get(part) is not True:
+                    node = node.setdefault(part, {})
+                else:
+                    break
+        return selection or None
+
+    @classmethod
+    def selected_columns(cls, selection):
+        """Column names read when serializing the given selection."""
+        columns = set()
+
+        def walk(spec, sel):
+            for key, entry in spec.items():
+                if sel is not None and key not in sel:
+                    continue
+                sub = None if sel is None or sel[key] is True else sel[key]
+                if isinstance(entry, dict):
+                    walk(entry, sub)
+                else:
+                    columns.add(entry if isinstance(entry, str) else entry[0])
+
+        walk(cls.SERIALIZATION, selection)
+        return columns
+
+    @classmethod
+    def load_options(cls, selection):
+        """Query options that restrict the SELECT to the columns a selection needs."""
+        if selection is None:
+            return []
+        # id and created_at are always loaded so keyset cursors can be built
+        columns = cls.selected_columns(selection) | {'id', 'created_at'}
+        return [load_only(*(getattr(cls, name) for name in sorted(columns)))]
+
+    def to_dict(self, fields=None):
+        """Convert the row to a dictionary for JSON response, limited to fields if given."""
+        return self._serialize(self.SERIALIZATION, fields)
+
+    def _serialize(self, spec, selection):
+        data = {}
+        for key, entry in spec.items():
+            if selection is not None and key not in selection:
+                continue
+            if isinstance(entry, dict):
+                sub = None if selection is None or selection[key] is True else selection[key]
+                data[key] = self._serialize(entry, sub)
+            elif isinstance(entry, str):
+                data[key] = getattr(self, entry)
+            else:
+                column, transform = entry
+                data[key] = transform(getattr(self, column))
+        return data
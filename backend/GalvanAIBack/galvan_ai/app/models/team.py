@@ -1,7 +1,13 @@
 from app import db
+from app.blobstore import blob_url
+from app.models.types import JSONText
+from app.models.serialization import SerializableMixin, isoformat, json_list
 from datetime import datetime
 
-class Team(db.Model):
+class Team(SerializableMixin, db.Model):
+    __table_args__ = (
+        db.Index('ix_team_created_at', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     role = db.Column(db.String(100), nullable=False)
@@ -14,46 +20,43 @@ class Team(db.Model):
     website = db.Column(db.String(200))  # Optional field
     department = db.Column(db.String(100), nullable=False)
     position = db.Column(db.String(100), nullable=False)
-    skills = db.Column(db.Text)  # Store as JSON string
-    background = db.Column(db.Text)  # Store as JSON string
-    interests = db.Column(db.Text)  # Store as JSON string
-    awards = db.Column(db.Text)  # Store as JSON string
-    certifications = db.Column(db.Text)  # Store as JSON string
+    skills = db.Column(JSONText)  # JSON array
+    background = db.Column(JSONText)  # JSON array
+    interests = db.Column(JSONText)  # JSON array
+    awards = db.Column(JSONText)  # JSON array
+    certifications = db.Column(JSONText)  # JSON array
     location = db.Column(db.String(200))  # Optional field
-    languages = db.Column(db.Text)  # Store as JSON string
+    languages = db.Column(JSONText)  # JSON array
     fun_fact = db.Column(db.Text)  # Optional field
     quote = db.Column(db.Text)  # Optional field
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    def to_dict(self):
-        """Convert team member to dictionary for JSON response"""
-        import json
-        return {
-            'id': self.id,
-            'name': self.name,
-            'role': self.role,
-            'avatar': self.avatar,
-            'bio': self.bio,
-            'email': self.email,
-            'linkedin': self.linkedin,
-            'github': self.github,
-            'twitter': self.twitter,
-            'website': self.website,
-            'department': self.department,
-            'position': self.position,
-            'skills': json.loads(self.skills) if self.skills else [],
-            'background': json.loads(self.background) if self.background else [],
-            'interests': json.loads(self.interests) if self.interests else [],
-            'awards': json.loads(self.awards) if self.awards else [],
-            'certifications': json.loads(self.certifications) if self.certifications else [],
-            'location': self.location,
-            'languages': json.loads(self.languages) if self.languages else [],
-            'fun_fact': self.fun_fact,
-            'quote': self.quote,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    SERIALIZATION = {
+        'id': 'id',
+        'name': 'name',
+        'role': 'role',
+        'avatar': ('avatar', blob_url),
+        'bio': 'bio',
+        'email': 'email',
+        'linkedin': 'linkedin',
+        'github': 'github',
+        'twitter': 'twitter',
+        'website': 'website',
+        'department': 'department',
+        'position': 'position',
+        'skills': ('skills', json_list),
+        'background': ('background', json_list),
+        'interests': ('interests', json_list),
+        'awards': ('awards', json_list),
+        'certifications': ('certifications', json_list),
+        'location': 'location',
+        'languages': ('languages', json_list),
+        'fun_fact': 'fun_fact',
+        'quote': 'quote',
+        'created_at': ('created_at', isoformat),
+        'updated_at': ('updated_at', isoformat)
+    }
 
     @staticmethod
     def from_dict(data):
@@ -1,7 +1,14 @@
 from app import db
+from app.blobstore import blob_url
+from app.models.types import JSONText
+from app.models.serialization import SerializableMixin, isoformat, json_list
 from datetime import datetime
 
-class Testimonial(db.Model):
+class Testimonial(SerializableMixin, db.Model):
+    __table_args__ = (
+        db.Index('ix_testimonial_created_at', 'created_at'),
+        db.Index('ix_testimonial_featured_created_at', 'featured', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     role = db.Column(db.String(100), nullable=False)
@@ -12,28 +19,25 @@ class Testimonial(db.Model):
     long_content = db.Column(db.Text)  # Optional field
     rating = db.Column(db.Integer, nullable=False)
     featured = db.Column(db.Boolean, default=False)
-    tags = db.Column(db.Text)  # Store as JSON string
+    tags = db.Column(JSONText)  # JSON array
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    def to_dict(self):
-        """Convert testimonial to dictionary for JSON response"""
-        import json
-        return {
-            'id': self.id,
-            'name': self.name,
-            'role': self.role,
-            'company': self.company,
-            'avatar': self.avatar,
-            'title': self.title,
-            'content': self.content,
-            'longContent': self.long_content,
-            'rating': self.rating,
-            'featured': self.featured,
-            'tags': json.loads(self.tags) if self.tags else [],
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    SERIALIZATION = {
+        'id': 'id',
+        'name': 'name',
+        'role': 'role',
+        'company': 'company',
+        'avatar': ('avatar', blob_url),
+        'title': 'title',
+        'content': 'content',
+        'longContent': 'long_content',
+        'rating': 'rating',
+        'featured': 'featured',
+        'tags': ('tags', json_list),
+        'created_at': ('created_at', isoformat),
+        'updated_at': ('updated_at', isoformat)
+    }
 
     @staticmethod
     def from_dict(data):
@@ -0,0 +1,35 @@
+import json
+
+from sqlalchemy.types import JSON, TypeDecorator
+
+
+def _reject_constant(name):
+    raise ValueError(f'{name} is not valid JSON')
+
+
+class JSONText(TypeDecorator):
+    """Native JSON column whose values are read back as raw JSON text.
+
+    The DDL type is JSON (SQLite JSON1 / Postgres json), so JSON path filters
+    such as Project.technologies[0].as_string() are pushed down to SQL. Loading
+    skips json.loads, and the serializer embeds the text in responses verbatim
+    (RawJSON), so only strictly valid JSON may be stored: on write, Python
+    lists/dicts are encoded and strings are treated as already-encoded JSON
+    and validated, with NaN and Infinity rejected in both cases.
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        def process(value):
+            if value is None:
+                return None
+            if isinstance(value, str):
+                json.loads(value, parse_constant=_reject_constant)
+                return value
+            return json.dumps(value, allow_nan=False)
+        return process
+
+    def result_processor(self, dialect, coltype):
+        return None
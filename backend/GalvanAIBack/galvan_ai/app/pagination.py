@@ -0,0 +1,95 @@
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class PaginationError(ValueError):
+    """Raised when limit/cursor query parameters are malformed."""
+
+
+def encode_cursor(created_at, row_id) -> str:
+    """Encode a (created_at, id) keyset position as an opaque URL-safe token."""
+    payload = json.dumps([created_at.isoformat() if created_at else None, row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str):
+    """Decode a cursor produced by encode_cursor back into (created_at, id)."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if not isinstance(row_id, int):
+            raise ValueError('cursor id must be an integer')
+        return (datetime.fromisoformat(created_at) if created_at else None), row_id
+    except Exception:
+        raise PaginationError('Invalid cursor')
+
+
+def encode_offset_cursor(offset: int) -> str:
+    """Opaque cursor for result sets without a stable keyset, such as ranked search."""
+    return base64.urlsafe_b64encode(json.dumps({'o': offset}).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_offset_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        offset = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))['o']
+        if not isinstance(offset, int) or offset < 0:
+            raise ValueError('cursor offset must be a non-negative integer')
+        return offset
+    except Exception:
+        raise PaginationError('Invalid cursor')
+
+
+def wants_pagination(args) -> bool:
+    """Paginated responses are the default; ?paginate=false restores the legacy full list."""
+    return args.get('paginate', 'true').lower() not in ('false', '0', 'no')
+
+
+def parse_limit(args) -> int:
+    raw = args.get('limit')
+    if raw is None or raw == '':
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise PaginationError('limit must be an integer')
+    if limit < 1:
+        raise PaginationError('limit must be a positive integer')
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def keyset_query(query, model, cursor, limit):
+    """Order query on (created_at desc, id desc) and restrict it to the page after cursor."""
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        if created_at is None:
+            # Rows without a timestamp sort last; continue among them by id only
+            query = query.filter(model.created_at.is_(None), model.id < row_id)
+        else:
+            query = query.filter(or_(
+                model.created_at < created_at,
+                and_(model.created_at == created_at, model.id < row_id),
+                model.created_at.is_(None),
+            ))
+    return query.order_by(model.created_at.desc().nullslast(), model.id.desc()).limit(limit + 1)
+
+
+def paginate_query(query, model, args):
+    """Apply keyset pagination on (created_at desc, id desc) to a query.
+
+    Returns (rows, next_cursor). next_cursor is None on the last page.
+    """
+    limit = parse_limit(args)
+    rows = keyset_query(query, model, args.get('cursor'), limit).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return rows, next_cursor
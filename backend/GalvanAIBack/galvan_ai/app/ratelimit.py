@@ -0,0 +1,159 @@
+"""Token-bucket rate limiting for the public submission routes.
+
+A limit such as '5/minute' is a bucket holding up to 5 tokens that refills
+at 5 per minute, so short bursts pass and a sustained flood is held to the
+rate. One request checks several buckets at once (per IP, per email and
+global) and only takes a token from each when all of them have one, so a
+refused request never uses up another bucket's allowance.
+
+With Redis the check is a Lua script, atomic across every worker. While
+Redis is unavailable (see app/redis_client.py) each process limits on its
+own, in memory.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from app.redis_client import RedisUnavailable, redis
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+
+class RateLimitError(ValueError):
+    """Raised for a limit string that does not parse."""
+
+
+@lru_cache(maxsize=64)
+def parse_rate(text):
+    """'5/minute' -> (5, 60); '100/10minute' is also accepted. None or '' -> None (no limit)."""
+    if not text:
+        return None
+    try:
+        count, per = text.strip().lower().split('/')
+        count = int(count)
+        digits = per.rstrip('abcdefghijklmnopqrstuvwxyz')
+        unit = per[len(digits):].rstrip('s')
+        seconds = PERIODS[unit] * (int(digits) if digits else 1)
+    except (ValueError, KeyError):
+        raise RateLimitError(f'Invalid rate limit: {text!r} (expected e.g. 5/minute)')
+    if count < 1:
+        raise RateLimitError(f'Invalid rate limit: {text!r} (count must be positive)')
+    return count, seconds
+
+
+def check_rate_limits(rate_limits):
+    """Parse every limit in a RATE_LIMITS mapping; raises RateLimitError naming the bad one."""
+    for route, scopes in rate_limits.items():
+        for scope, text in scopes.items():
+            try:
+                parse_rate(text)
+            except RateLimitError as e:
+                raise RateLimitError(f'RATE_LIMITS[{route!r}][{scope!r}]: {e}') from None
+
+
+# KEYS: one hash per bucket; ARGV: now (ms), then capacity and refill per ms for each key.
+# Returns 0 when a token was taken from every bucket, else the milliseconds to wait.
+TOKEN_BUCKET_LUA = """
+local now = tonumber(ARGV[1])
+local tokens, wait = {}, 0
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local rate = tonumber(ARGV[i * 2 + 1])
+    local state = redis.call('HMGET', key, 't', 'ts')
+    local t = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    t = math.min(capacity, t + math.max(0, now - ts) * rate)
+    tokens[i] = t
+    if t < 1 then
+        wait = math.max(wait, math.ceil((1 - t) / rate))
+    end
+end
+if wait > 0 then
+    return wait
+end
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local rate = tonumber(ARGV[i * 2 + 1])
+    redis.call('HSET', key, 't', tokens[i] - 1, 'ts', now)
+    redis.call('PEXPIRE', key, math.ceil(capacity / rate))
+end
+return 0
+"""
+TOKEN_BUCKET_SHA = hashlib.sha1(TOKEN_BUCKET_LUA.encode('utf-8')).hexdigest()
+
+
+class MemoryBuckets:
+    """The token-bucket script's logic over an in-process LRU of buckets.
+
+    Full buckets carry no information, so evicting the least recently used
+    ones once max_entries is reached only forgets clients that went quiet.
+    """
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, now_ms, limits):
+        """limits: [(key, capacity, refill per ms)]. Returns 0 or the milliseconds to wait."""
+        with self._lock:
+            levels, wait = [], 0
+            for key, capacity, rate in limits:
+                tokens, updated = self._buckets.get(key, (capacity, now_ms))
+                tokens = min(capacity, tokens + max(0, now_ms - updated) * rate)
+                levels.append(tokens)
+                if tokens < 1:
+                    wait = max(wait, math.ceil((1 - tokens) / rate))
+            if wait:
+                return wait
+            for (key, _, _), tokens in zip(limits, levels):
+                self._buckets[key] = (tokens - 1, now_ms)
+                self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_entries:
+                self._buckets.popitem(last=False)
+            return 0
+
+
+class RateLimiter:
+    """Checks a request against several token buckets at once.
+
+    redis_client is a LazyRedis or None; the in-process buckets are used
+    without it and whenever its circuit breaker is open.
+    """
+
+    def __init__(self, redis_client=None, prefix='rl', max_entries=10000):
+        self.redis = redis_client
+        self.prefix = prefix
+        self.local = MemoryBuckets(max_entries)
+
+    def _run_script(self, keys, args):
+        try:
+            return self.redis.call('evalsha', TOKEN_BUCKET_SHA, len(keys), *keys, *args)
+        except redis.exceptions.NoScriptError:
+            # First use on this server, or after SCRIPT FLUSH: EVAL caches it for next time
+            return self.redis.call('eval', TOKEN_BUCKET_LUA, len(keys), *keys, *args)
+
+    def hit(self, limits):
+        """Take a token for [(bucket, (count, seconds))]; returns 0 if allowed, else seconds to wait."""
+        if not limits:
+            return 0
+        now_ms = int(time.time() * 1000)
+        buckets = [(f'{self.prefix}:{bucket}', count, count / (seconds * 1000.0))
+                   for bucket, (count, seconds) in limits]
+        wait_ms = None
+        if self.redis is not None and self.redis.available:
+            keys = [key for key, _, _ in buckets]
+            args = [now_ms]
+            for _, capacity, rate in buckets:
+                args += [capacity, repr(rate)]
+            try:
+                wait_ms = int(self._run_script(keys, args))
+            except (RedisUnavailable, redis.RedisError):
+                wait_ms = None
+        if wait_ms is None:
+            wait_ms = self.local.take(now_ms, buckets)
+        return math.ceil(wait_ms / 1000) if wait_ms else 0
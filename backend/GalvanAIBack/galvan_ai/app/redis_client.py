@@ -0,0 +1,251 @@
+"""Shared Redis access for the response cache and the idempotency/captcha state.
+
+Nothing connects at import. LazyRedis builds one connection pool per
+process on first use and puts a circuit breaker in front of it: after
+REDIS_BREAKER_THRESHOLD consecutive connection failures or timeouts it
+opens and stops calling Redis for REDIS_BREAKER_COOLDOWN seconds. After
+that it is half-open: one trial call is let through at a time, and a
+failed trial opens it for another cooldown. A background thread pings
+Redis the whole time it is not closed, and the first ping or call that
+succeeds closes it again. Failover
+sends calls to a local store (app/kvstore.py) while the breaker is open,
+so requests never wait on a Redis that is down; the response cache is
+bypassed instead (app/cache.py).
+
+Settings (app/config.py): REDIS_HOST (empty disables Redis), REDIS_PORT,
+REDIS_DB, REDIS_SOCKET_TIMEOUT (connect and per-command),
+REDIS_MAX_CONNECTIONS, REDIS_BREAKER_THRESHOLD and REDIS_BREAKER_COOLDOWN.
+"""
+
+import threading
+import time
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+class Pipeline:
+    """Queues commands and runs them together on execute(), like a redis-py pipeline."""
+
+    def __init__(self, store):
+        self.store = store
+        self.commands = []
+
+    def _queue(self, name, *args):
+        self.commands.append((name, args))
+        return self
+
+    def setex(self, key, ttl, value):
+        return self._queue('setex', key, ttl, value)
+
+    def delete(self, *keys):
+        return self._queue('delete', *keys)
+
+    def incr(self, key):
+        return self._queue('incr', key)
+
+    def expire(self, key, ttl):
+        return self._queue('expire', key, ttl)
+
+    def execute(self):
+        commands, self.commands = self.commands, []
+        return self.store.run_batch(commands)
+
+
+class RedisUnavailable(RuntimeError):
+    """Raised instead of calling Redis while the circuit breaker is open."""
+
+
+class LazyRedis:
+    """redis-py calls through a lazily created pool and a circuit breaker."""
+
+    def __init__(self, host, port=6379, db=0, socket_timeout=0.25, max_connections=32,
+                 failure_threshold=3, cooldown=15.0):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.socket_timeout = socket_timeout
+        self.max_connections = max_connections
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._client = None
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._open_until = 0.0  # 0 = closed
+        self._trial_in_flight = False
+        self._probe = None
+        self._recovery_hooks = []
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    # redis-py pools notice a fork and reconnect in the child on their own
+                    pool = redis.ConnectionPool(
+                        host=self.host, port=self.port, db=self.db,
+                        socket_timeout=self.socket_timeout, socket_connect_timeout=self.socket_timeout,
+                        max_connections=self.max_connections,
+                    )
+                    self._client = redis.Redis(connection_pool=pool)
+        return self._client
+
+    @property
+    def available(self):
+        """False while the breaker is open, and while half-open once a trial call is under way."""
+        return not self._trial_in_flight and time.monotonic() >= self._open_until
+
+    def _enter(self):
+        """Let a call through; True when it is the half-open breaker's one trial call."""
+        if not self._open_until:
+            return False
+        with self._lock:
+            if not self._open_until:
+                return False  # closed by the probe meanwhile
+            if self._trial_in_flight or time.monotonic() < self._open_until:
+                raise RedisUnavailable(f'Redis at {self.host}:{self.port} is unavailable')
+            self._trial_in_flight = True
+            return True
+
+    def _failed(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures < self.failure_threshold:
+                return
+            self._open_until = time.monotonic() + self.cooldown
+            if self._probe is None or not self._probe.is_alive():
+                self._probe = threading.Thread(target=self._run_probe, name='redis-probe', daemon=True)
+                self._probe.start()
+
+    def _succeeded(self):
+        if self._failures:
+            with self._lock:
+                recovered = self._open_until > 0
+                self._failures = 0
+                self._open_until = 0.0
+            if recovered:
+                for hook in self._recovery_hooks:
+                    try:
+                        hook()
+                    except Exception:
+                        pass
+
+    def on_recover(self, hook):
+        """Call hook() each time the breaker closes again after an outage."""
+        self._recovery_hooks.append(hook)
+
+    def _run_probe(self):
+        # Until Redis answers: the breaker reopening after a failed trial must not stop the probe
+        while self._open_until:
+            time.sleep(min(1.0, self.cooldown))
+            try:
+                self.client.ping()
+            except redis.RedisError:
+                continue
+            self._succeeded()
+
+    def _guarded(self, operation):
+        trial = self._enter()
+        try:
+            result = operation()
+            self._succeeded()
+            return result
+        except (redis.ConnectionError, redis.TimeoutError):
+            self._failed()
+            raise
+        except redis.RedisError:
+            # An error reply (e.g. NOSCRIPT) still means Redis is reachable
+            self._succeeded()
+            raise
+        finally:
+            # Cleared only after the breaker has closed or reopened, so no second trial slips in
+            if trial:
+                self._trial_in_flight = False
+
+    def call(self, name, *args, **kwargs):
+        return self._guarded(lambda: getattr(self.client, name)(*args, **kwargs))
+
+    def execute_pipeline(self, commands):
+        """Run [(name, args)] in one MULTI/EXEC round trip."""
+        def run():
+            pipe = self.client.pipeline()
+            for name, args in commands:
+                getattr(pipe, name)(*args)
+            return pipe.execute()
+        return self._guarded(run)
+
+
+class Failover:
+    """redis-py style client: Redis while its breaker is closed, the fallback store otherwise.
+
+    A call that fails on Redis is retried on the fallback, so callers see
+    the degraded store rather than the error. The two stores do not share
+    keys; state written during an outage stays local to the fallback.
+    """
+
+    def __init__(self, primary, fallback):
+        self.primary = primary
+        self.fallback = fallback
+
+    def _call(self, name, *args, **kwargs):
+        if self.primary.available:
+            try:
+                return self.primary.call(name, *args, **kwargs)
+            except (RedisUnavailable, redis.ConnectionError, redis.TimeoutError):
+                pass
+        return getattr(self.fallback, name)(*args, **kwargs)
+
+    def get(self, key):
+        return self._call('get', key)
+
+    def mget(self, keys):
+        return self._call('mget', keys)
+
+    def set(self, key, value, ex=None, nx=False):
+        return self._call('set', key, value, ex=ex, nx=nx)
+
+    def setex(self, key, ttl, value):
+        return self._call('setex', key, ttl, value)
+
+    def delete(self, *keys):
+        return self._call('delete', *keys)
+
+    def incr(self, key):
+        return self._call('incr', key)
+
+    def expire(self, key, ttl):
+        return self._call('expire', key, ttl)
+
+    def pipeline(self):
+        return Pipeline(self)
+
+    def run_batch(self, commands):
+        if self.primary.available:
+            try:
+                return self.primary.execute_pipeline(commands)
+            except (RedisUnavailable, redis.ConnectionError, redis.TimeoutError):
+                pass
+        return self.fallback.run_batch(commands)
+
+
+def redis_from_config(config):
+    """LazyRedis for the REDIS_* settings in config (app.config), or None without redis-py or REDIS_HOST.
+
+    Redis is opt-in: with a default host, a deployment without a Redis server
+    would spend its first requests tripping the breaker and then run the
+    response cache bypassed for good.
+    """
+    host = config.get('REDIS_HOST')
+    if redis is None or not host:
+        return None
+    return LazyRedis(
+        host,
+        port=config['REDIS_PORT'],
+        db=config['REDIS_DB'],
+        socket_timeout=config['REDIS_SOCKET_TIMEOUT'],
+        max_connections=config['REDIS_MAX_CONNECTIONS'],
+        failure_threshold=config['REDIS_BREAKER_THRESHOLD'],
+        cooldown=config['REDIS_BREAKER_COOLDOWN'],
+    )
@@ -0,0 +1,216 @@
+import html
+import re
+from datetime import datetime
+
+from flask import current_app
+from sqlalchemy import Text, and_, or_, text, type_coerce
+from sqlalchemy.orm import load_only
+
+from app import db
+from app.models.blog import BlogPost
+from app.models.career import Career
+from app.models.project import Project
+from app.utils import build_like_pattern
+
+SNIPPET_OPEN = '<mark>'
+SNIPPET_CLOSE = '</mark>'
+SNIPPET_TOKENS = 12
+# snippet() marks matches with control characters that html.escape() leaves alone,
+# so the stored text is escaped first and the markers become <mark> afterwards
+_MATCH_OPEN = '\x02'
+_MATCH_CLOSE = '\x03'
+
+# type -> (model, column used as the result title, indexed columns)
+SEARCH_INDEXES = {
+    'blogs': (BlogPost, 'title', ('title', 'excerpt', 'intro', 'implementation', 'conclusion', 'tags')),
+    'careers': (Career, 'title', ('title', 'description', 'skills_required')),
+    'projects': (Project, 'hero_subtitle', ('hero_subtitle', 'hero_description', 'long_description', 'features', 'technologies')),
+}
+
+
+def _fts_table(model):
+    return f'{model.__tablename__}_fts'
+
+
+def fts5_available(conn):
+    try:
+        conn.execute(text('CREATE VIRTUAL TABLE IF NOT EXISTS temp._fts5_probe USING fts5(x)'))
+        conn.execute(text('DROP TABLE IF EXISTS temp._fts5_probe'))
+        return True
+    except Exception:
+        return False
+
+
+def _trigger_sql(table, fts, columns):
+    cols = ', '.join(columns)
+    new = ', '.join(f'new.{c}' for c in columns)
+    old = ', '.join(f'old.{c}' for c in columns)
+    delete = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old});"
+    insert = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new});"
+    return {
+        f'{fts}_ai': f'CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END',
+        f'{fts}_ad': f'CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN {delete} END',
+        f'{fts}_au': f'CREATE TRIGGER {fts}_au AFTER UPDATE ON {table} BEGIN {delete} {insert} END',
+    }
+
+
+def create_search_indexes(conn):
+    """Create FTS5 tables and sync triggers when the database supports them.
+
+    The FTS tables are external-content indexes over the model tables, kept
+    in sync by triggers. Missing triggers (e.g. after a table rebuild) are
+    recreated and the index is rebuilt from the content table.
+    Returns False when FTS5 is unavailable and /api/search uses LIKE instead.
+    """
+    if conn.dialect.name != 'sqlite' or not fts5_available(conn):
+        return False
+    existing = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'trigger'"))}
+    for model, _, columns in SEARCH_INDEXES.values():
+        table, fts = model.__tablename__, _fts_table(model)
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"{', '.join(columns)}, content='{table}', content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+        ))
+        triggers = _trigger_sql(table, fts, columns)
+        if not set(triggers) <= existing:
+            for name, sql in triggers.items():
+                conn.execute(text(f'DROP TRIGGER IF EXISTS {name}'))
+                conn.execute(text(sql))
+            conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+    return True
+
+
+def drop_search_indexes(conn):
+    if conn.dialect.name != 'sqlite':
+        return
+    for model, _, columns in SEARCH_INDEXES.values():
+        fts = _fts_table(model)
+        for name in _trigger_sql(model.__tablename__, fts, columns):
+            conn.execute(text(f'DROP TRIGGER IF EXISTS {name}'))
+        conn.execute(text(f'DROP TABLE IF EXISTS {fts}'))
+
+
+def search_indexes_ready(conn):
+    if conn.dialect.name != 'sqlite':
+        return False
+    names = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')"))}
+    return all(
+        {_fts_table(model)} | set(_trigger_sql(model.__tablename__, _fts_table(model), columns)) <= names
+        for model, _, columns in SEARCH_INDEXES.values()
+    )
+
+
+def _use_fts():
+    # Checked once per process on first search rather than at startup
+    if 'fts5' not in current_app.extensions:
+        with db.engine.connect() as conn:
+            current_app.extensions['fts5'] = search_indexes_ready(conn)
+    return current_app.extensions['fts5']
+
+
+def search_terms(query):
+    return re.findall(r'\w+', query or '', re.UNICODE)
+
+
+def _fts_match(terms):
+    # Every term is quoted so FTS5 operators in user input are treated as text;
+    # the last term is a prefix match for search-as-you-type
+    quoted = ['"' + term.replace('"', '""') + '"' for term in terms]
+    quoted[-1] += '*'
+    return ' '.join(quoted)
+
+
+def _highlight(snippet):
+    """Escape a snippet()'s stored text for HTML, then turn its match markers into <mark> tags."""
+    if snippet is None:
+        return None
+    return html.escape(snippet).replace(_MATCH_OPEN, SNIPPET_OPEN).replace(_MATCH_CLOSE, SNIPPET_CLOSE)
+
+
+def _titles(model, title_column, ids):
+    if not ids:
+        return {}
+    rows = (model.query.options(load_only(model.id, getattr(model, title_column)))
+            .filter(model.id.in_(ids)).all())
+    return {row.id: getattr(row, title_column) for row in rows}
+
+
+def _with_titles(hits):
+    by_type = {}
+    for hit in hits:
+        by_type.setdefault(hit['type'], []).append(hit['id'])
+    titles = {}
+    for kind, ids in by_type.items():
+        model, title_column, _ = SEARCH_INDEXES[kind]
+        titles[kind] = _titles(model, title_column, ids)
+    for hit in hits:
+        hit['title'] = titles[hit['type']].get(hit['id'])
+    return hits
+
+
+def search_fts(terms, kinds, limit, offset):
+    """BM25-ranked search over the FTS5 indexes. Returns (hits, has_more)."""
+    selects = []
+    for kind in kinds:
+        fts = _fts_table(SEARCH_INDEXES[kind][0])
+        selects.append(
+            f"SELECT '{kind}' AS type, rowid AS id, bm25({fts}) AS score, "
+            f"snippet({fts}, -1, :open, :close, '…', {SNIPPET_TOKENS}) AS snippet "
+            f"FROM {fts} WHERE {fts} MATCH :match"
+        )
+    sql = ' UNION ALL '.join(selects) + ' ORDER BY score LIMIT :limit OFFSET :offset'
+    rows = db.session.execute(text(sql), {
+        'match': _fts_match(terms), 'open': _MATCH_OPEN, 'close': _MATCH_CLOSE,
+        'limit': limit + 1, 'offset': offset,
+    }).all()
+    hits = [
+        # bm25() is lower-is-better; flip it so clients can sort descending
+        {'type': row.type, 'id': row.id, 'score': round(-row.score, 4), 'snippet': _highlight(row.snippet)}
+        for row in rows[:limit]
+    ]
+    return _with_titles(hits), len(rows) > limit
+
+
+def _like_snippet(value, term, radius=60):
+    position = value.lower().find(term.lower())
+    if position < 0:
+        return None
+    start, end = max(0, position - radius), min(len(value), position + len(term) + radius)
+    # Stored text may hold user-authored HTML; only the <mark> tags are markup
+    return (('…' if start else '') + html.escape(value[start:position]) + SNIPPET_OPEN
+            + html.escape(value[position:position + len(term)]) + SNIPPET_CLOSE
+            + html.escape(value[position + len(term):end]) + ('…' if end < len(value) else ''))
+
+
+def search_like(terms, kinds, limit, offset):
+    """Fallback when FTS5 is unavailable: escaped LIKE over the same columns, newest first."""
+    candidates = []
+    for kind in kinds:
+        model, title_column, columns = SEARCH_INDEXES[kind]
+        conditions = [
+            # JSON columns are matched on their stored text
+            or_(*(type_coerce(getattr(model, c), Text).ilike(build_like_pattern(term), escape='\\') for c in columns))
+            for term in terms
+        ]
+        rows = (model.query
+                .options(load_only(model.id, model.created_at, *(getattr(model, c) for c in columns)))
+                .filter(and_(*conditions))
+                .order_by(model.created_at.desc(), model.id.desc())
+                .limit(offset + limit + 1)
+                .all())
+        for row in rows:
+            snippet = next(filter(None, (_like_snippet(str(getattr(row, c) or ''), terms[0]) for c in columns)), None)
+            candidates.append((row.created_at, {'type': kind, 'id': row.id, 'score': None, 'snippet': snippet}))
+    # Undated rows sort last; id breaks ties as in each query's ORDER BY
+    candidates.sort(key=lambda item: (item[0] or datetime.min, item[1]['id']), reverse=True)
+    page = [hit for _, hit in candidates[offset:offset + limit + 1]]
+    return _with_titles(page[:limit]), len(page) > limit
+
+
+def search(query, kinds, limit, offset):
+    terms = search_terms(query)
+    if not terms:
+        return [], False
+    if _use_fts():
+        return search_fts(terms, kinds, limit, offset)
+    return search_like(terms, kinds, limit, offset)
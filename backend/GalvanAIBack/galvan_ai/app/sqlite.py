@@ -0,0 +1,66 @@
+from sqlalchemy import event, text
+
+# PRAGMA name -> config key holding its value
+PRAGMA_SETTINGS = (
+    ('journal_mode', 'SQLITE_JOURNAL_MODE'),
+    ('synchronous', 'SQLITE_SYNCHRONOUS'),
+    ('busy_timeout', 'SQLITE_BUSY_TIMEOUT_MS'),
+    ('cache_size', 'SQLITE_CACHE_SIZE'),
+    ('mmap_size', 'SQLITE_MMAP_SIZE'),
+    ('temp_store', 'SQLITE_TEMP_STORE'),
+    ('foreign_keys', 'SQLITE_FOREIGN_KEYS'),
+)
+
+# PRAGMA synchronous / temp_store read back as integers
+_SYNCHRONOUS = {0: 'OFF', 1: 'NORMAL', 2: 'FULL', 3: 'EXTRA'}
+_TEMP_STORE = {0: 'DEFAULT', 1: 'FILE', 2: 'MEMORY'}
+
+
+def configured_pragmas(config):
+    return {name: config[key] for name, key in PRAGMA_SETTINGS if config.get(key) not in (None, '')}
+
+
+def install_pragmas(engine, pragmas):
+    """Apply pragmas to every new DBAPI connection the engine opens."""
+
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name} = {value}')
+        finally:
+            cursor.close()
+
+
+def effective_pragmas(engine):
+    with engine.connect() as conn:
+        values = {name: conn.execute(text(f'PRAGMA {name}')).scalar() for name, _ in PRAGMA_SETTINGS}
+    values['synchronous'] = _SYNCHRONOUS.get(values['synchronous'], values['synchronous'])
+    values['temp_store'] = _TEMP_STORE.get(values['temp_store'], values['temp_store'])
+    return values
+
+
+def configure_sqlite(app, engine):
+    """Install the SQLITE_* pragmas on a SQLite engine and log what actually took effect.
+
+    journal_mode=WAL lets readers proceed while a writer commits, so bursts of
+    job applications / contact quotes wait on busy_timeout instead of failing
+    with "database is locked". WAL is silently refused on some filesystems
+    (and by in-memory databases), so the effective mode is checked here.
+    """
+    if engine.dialect.name != 'sqlite':
+        return None
+    pragmas = configured_pragmas(app.config)
+    install_pragmas(engine, pragmas)
+    # Connections opened before the listener existed would miss the pragmas
+    engine.dispose()
+
+    effective = effective_pragmas(engine)
+    app.extensions['sqlite_pragmas'] = effective
+    app.logger.info('SQLite pragmas: %s', ', '.join(f'{k}={v}' for k, v in effective.items()))
+    wanted = str(pragmas.get('journal_mode', '')).lower()
+    in_memory = engine.url.database in (None, '', ':memory:')
+    if wanted and not in_memory and str(effective['journal_mode']).lower() != wanted:
+        app.logger.warning('SQLite journal_mode is %s, expected %s', effective['journal_mode'], wanted)
+    return effective
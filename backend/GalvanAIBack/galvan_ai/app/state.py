@@ -0,0 +1,31 @@
+"""Per-app shared state: the Redis client and what is built on it.
+
+init_state() builds these from app.config and keeps them on app.extensions,
+so every app (and every test) gets its own:
+
+    redis_client    LazyRedis, or None without REDIS_HOST (app/redis_client.py)
+    response_cache  ResponseCache for public reads, or None (app/cache.py)
+    state_store     idempotency keys and captcha counters, or None (app/kvstore.py)
+    rate_limiter    token buckets for the public submission routes (app/ratelimit.py)
+
+Nothing connects here; Redis is only reached on first use.
+"""
+
+from app.cache import build_response_cache
+from app.kvstore import build_state_store
+from app.ratelimit import RateLimiter
+from app.redis_client import redis_from_config
+
+
+def init_state(app):
+    config = app.config
+    client = redis_from_config(config)
+    app.extensions['redis_client'] = client
+    app.extensions['response_cache'] = build_response_cache(
+        config['RESPONSE_CACHE_BACKEND'], client, default_ttl=config['RESPONSE_CACHE_TTL'],
+    )
+    # Without Redis this is the kv_store table, shared by every worker on the node
+    app.extensions['state_store'] = build_state_store(
+        config['STATE_BACKEND'], client, max_entries=config['STATE_MEMORY_MAX_ENTRIES'],
+    )
+    app.extensions['rate_limiter'] = RateLimiter(client)
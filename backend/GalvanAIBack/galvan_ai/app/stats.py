@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import String, cast, func
+
+from app import db
+from app.models.career import Career
+from app.models.contact_quote import ContactQuote
+from app.models.job_application import JobApplication
+
+DEFAULT_DAYS = 30
+MAX_DAYS = 365
+
+
+class StatsError(ValueError):
+    """Raised for an invalid ?days= value."""
+
+
+def parse_days(args):
+    raw = args.get('days')
+    if raw in (None, ''):
+        return DEFAULT_DAYS
+    try:
+        days = int(raw)
+    except ValueError:
+        raise StatsError('days must be an integer')
+    if days < 1 or days > MAX_DAYS:
+        raise StatsError(f'days must be between 1 and {MAX_DAYS}')
+    return days
+
+
+def applications_by_job_and_status():
+    """Counts per (job_id, status), grouped in SQL on the (job_id, status, created_at) index."""
+    rows = (db.session.query(JobApplication.job_id, JobApplication.status, func.count(JobApplication.id))
+            .group_by(JobApplication.job_id, JobApplication.status)
+            .order_by(JobApplication.job_id, JobApplication.status)
+            .all())
+    # Rows from before the status column existed count as pending, like the admin UI shows them
+    by_job_status = {}
+    for job_id, status, count in rows:
+        key = (job_id, status or 'pending')
+        by_job_status[key] = by_job_status.get(key, 0) + count
+    by_status = {}
+    for (_, status), count in by_job_status.items():
+        by_status[status] = by_status.get(status, 0) + count
+    return {
+        'total': sum(by_status.values()),
+        'by_status': by_status,
+        'by_job_status': [
+            {'jobId': job_id, 'status': status, 'count': count}
+            for (job_id, status), count in sorted(by_job_status.items())
+        ],
+    }
+
+
+def _daily_counts(model, since):
+    day = func.date(model.created_at)
+    rows = (db.session.query(day, func.count(model.id))
+            .filter(model.created_at >= since)
+            .group_by(day)
+            .all())
+    return {str(d): count for d, count in rows}
+
+
+def submissions_per_day(days):
+    """Applications and contact quotes per calendar day (UTC) for the last `days` days, zero-filled."""
+    today = datetime.utcnow().date()
+    start = today - timedelta(days=days - 1)
+    since = datetime.combine(start, datetime.min.time())
+    applications = _daily_counts(JobApplication, since)
+    quotes = _daily_counts(ContactQuote, since)
+    series = []
+    for offset in range(days):
+        date = (start + timedelta(days=offset)).isoformat()
+        series.append({'date': date, 'applications': applications.get(date, 0), 'quotes': quotes.get(date, 0)})
+    return series
+
+
+def active_careers_with_applicants():
+    """Active careers with their applicant count, from one grouped LEFT JOIN."""
+    applicants = func.count(JobApplication.id)
+    rows = (db.session.query(Career.id, Career.title, Career.department, applicants)
+            # job_applications.job_id holds the career id as text
+            .outerjoin(JobApplication, JobApplication.job_id == cast(Career.id, String))
+            .filter(Career.is_active.is_(True))
+            .group_by(Career.id, Career.title, Career.department)
+            .order_by(applicants.desc(), Career.id)
+            .all())
+    return [
+        {'id': career_id, 'title': title, 'department': department, 'applicants': count}
+        for career_id, title, department, count in rows
+    ]
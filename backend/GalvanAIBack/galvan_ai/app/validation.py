@@ -0,0 +1,289 @@
+"""Declarative request validation.
+
+Models declare a SCHEMA built from the field types below, the same way they
+declare SERIALIZATION. Schema compiles the tree into plain closures once, at
+import, so validating a request only walks the payload. One schema checks
+both creates (every required field must be present) and partial updates
+(only the keys that were sent), and every problem is reported, not just
+the first one.
+"""
+
+import abc
+import re
+
+# Cap on errors reported for one payload
+MAX_ERRORS = 50
+
+
+def _humanize(key):
+    return re.sub(r'(?<=[a-z0-9])([A-Z])', r' \1', key).lower()
+
+
+class Field(abc.ABC):
+    """Base for field types. message replaces the default problem text."""
+
+    expect = 'must be a value'
+
+    def __init__(self, label=None, required=False, message=None):
+        self.label = label
+        self.required = required
+        if message:
+            self.expect = message
+
+    @abc.abstractmethod
+    def compile(self, partial=False):
+        """Return check(value) -> None, or a list of (path, label, problem)."""
+
+
+class String(Field):
+    expect = 'must be a string'
+
+    def __init__(self, label=None, required=False, message=None, non_empty=None, choices=None, max_length=None):
+        super().__init__(label, required, message)
+        # Required strings may not be blank, like the checks this replaced
+        self.non_empty = required if non_empty is None else non_empty
+        self.choices = tuple(choices) if choices else None
+        self.max_length = max_length
+
+    def is_plain(self):
+        return not (self.non_empty or self.choices or self.max_length is not None)
+
+    def compile(self, partial=False):
+        expect = self.expect
+        not_a_string = [((), '', expect)]
+        non_empty = self.non_empty
+        empty = [((), '', f'is required and {expect}' if self.required else 'must be a non-empty string')]
+        choices = frozenset(self.choices) if self.choices else None
+        not_a_choice = [((), '', f'must be one of: {", ".join(self.choices or ())}')]
+        max_length = self.max_length
+        too_long = [((), '', f'must be at most {max_length} characters')]
+
+        def check(value):
+            if not isinstance(value, str):
+                return not_a_string
+            if non_empty and not value.strip():
+                return empty
+            if choices is not None and value not in choices:
+                return not_a_choice
+            if max_length is not None and len(value) > max_length:
+                return too_long
+            return None
+        return check
+
+
+class Boolean(Field):
+    expect = 'must be a boolean'
+
+    def compile(self, partial=False):
+        problem = [((), '', self.expect)]
+
+        def check(value):
+            return None if value is True or value is False else problem
+        return check
+
+
+class Integer(Field):
+    def __init__(self, label=None, required=False, message=None, min=None, max=None):
+        super().__init__(label, required, message)
+        self.min = min
+        self.max = max
+        if not message:
+            if min is not None and max is not None:
+                self.expect = f'must be an integer between {min} and {max}'
+            elif min == 0:
+                self.expect = 'must be a non-negative integer'
+            elif min == 1:
+                self.expect = 'must be a positive integer'
+            elif min is not None:
+                self.expect = f'must be an integer of at least {min}'
+            elif max is not None:
+                self.expect = f'must be an integer of at most {max}'
+            else:
+                self.expect = 'must be an integer'
+
+    def compile(self, partial=False):
+        problem = [((), '', self.expect)]
+        low, high = self.min, self.max
+
+        def check(value):
+            # bool is an int subclass but never a valid integer here
+            if type(value) is not int:
+                return problem
+            if low is not None and value < low:
+                return problem
+            if high is not None and value > high:
+                return problem
+            return None
+        return check
+
+
+class Number(Field):
+    expect = 'must be a number'
+
+    def compile(self, partial=False):
+        problem = [((), '', self.expect)]
+
+        def check(value):
+            return None if type(value) in (int, float) else problem
+        return check
+
+
+class Array(Field):
+    """A list, optionally with every item checked against `items`.
+
+    Item errors are labelled '<item_label> <n>' ('Team member 2 name ...')
+    when item_label is set, otherwise '<label> item <n>'. Items are always
+    checked in full: a partial update replaces the whole list.
+    """
+
+    expect = 'must be an array'
+
+    def __init__(self, items=None, label=None, required=False, message=None, min_items=0, item_label=None):
+        super().__init__(label, required, message)
+        self.items = items
+        self.min_items = min_items
+        self.item_label = item_label
+
+    def compile(self, partial=False):
+        expect = [((), '', self.expect)]
+        min_items = self.min_items
+        too_short = [((), '', 'must have at least one item' if min_items == 1
+                      else f'must have at least {min_items} items')]
+        item_check = self.items.compile(partial=False) if self.items is not None else None
+        # Lists of unconstrained strings are checked in one pass without per-item calls
+        plain = str if type(self.items) is String and self.items.is_plain() else None
+        item_label = self.item_label or 'item'
+
+        def check(value):
+            if not isinstance(value, list):
+                return expect
+            if len(value) < min_items:
+                return too_short
+            if item_check is None:
+                return None
+            if plain is not None and all(type(item) is plain for item in value):
+                return None
+            errors = None
+            for index, item in enumerate(value):
+                found = item_check(item)
+                if found:
+                    if errors is None:
+                        errors = []
+                    prefix = f'{item_label} {index + 1}'
+                    for path, label, problem in found:
+                        errors.append(((index,) + path, f'{prefix} {label}' if label else prefix, problem))
+                    # Only MAX_ERRORS are reported, so a list that is wrong throughout stops early
+                    if len(errors) >= MAX_ERRORS:
+                        break
+            return errors
+        return check
+
+
+class Object(Field):
+    """A dict with known fields; unknown keys are ignored.
+
+    variants=(key, {value: {field: Field}}) adds or overrides fields when
+    value[key] equals value, e.g. per question type. checks is a list of
+    (predicate, field, problem) run once the fields themselves are valid;
+    predicate(value) returns True when the object is consistent.
+    """
+
+    expect = 'must be an object'
+
+    def __init__(self, fields=None, label=None, required=False, message=None, variants=None, checks=()):
+        super().__init__(label, required, message)
+        self.fields = fields or {}
+        self.variants = variants
+        self.checks = list(checks)
+
+    def _entries(self, fields, partial):
+        entries = []
+        for key, field in fields.items():
+            label = field.label or _humanize(key)
+            # An item_label replaces the list's own label in item errors
+            anchored = isinstance(field, Array) and field.item_label is not None
+            missing = [((key,), label, f'is required and {field.expect}')] if field.required and not partial else None
+            entries.append((key, label, anchored, missing, field.compile(partial)))
+        return entries
+
+    def compile(self, partial=False):
+        expect = [((), '', self.expect)]
+        base = self._entries(self.fields, partial)
+        variant_key, by_variant = None, {}
+        if self.variants:
+            variant_key, variants = self.variants
+            by_variant = {
+                tag: self._entries(dict(self.fields, **extra), partial)
+                for tag, extra in variants.items()
+            }
+        labels = {key: label for key, label, _, _, _ in base}
+        checks = [
+            (predicate, [((field,), labels.get(field) or _humanize(field), problem)])
+            for predicate, field, problem in self.checks
+        ]
+
+        def check(value):
+            if not isinstance(value, dict):
+                return expect
+            entries = base
+            if variant_key is not None:
+                tag = value.get(variant_key)
+                if isinstance(tag, str):
+                    entries = by_variant.get(tag, base)
+            errors = None
+            for key, label, anchored, missing, field_check in entries:
+                if key not in value:
+                    if missing:
+                        if errors is None:
+                            errors = []
+                        errors.extend(missing)
+                    continue
+                found = field_check(value[key])
+                if found:
+                    if errors is None:
+                        errors = []
+                    for path, sub_label, problem in found:
+                        if not sub_label:
+                            sub_label = label
+                        elif not (anchored and path):
+                            sub_label = f'{label} {sub_label}'
+                        errors.append(((key,) + path, sub_label, problem))
+            if errors is None:
+                for predicate, problem in checks:
+                    if not predicate(value):
+                        if errors is None:
+                            errors = []
+                        errors.extend(problem)
+            return errors
+        return check
+
+
+def _field_path(path):
+    out = ''
+    for part in path:
+        out += f'[{part}]' if isinstance(part, int) else (f'.{part}' if out else part)
+    return out
+
+
+class Schema:
+    """A compiled request schema: Schema({'title': String(required=True), ...}).
+
+    errors(data) checks a create payload; errors(data, partial=True) an
+    update, where missing keys are left alone but sent keys are held to the
+    same rules. Both return [{'field': 'team[0].name', 'message': ...}].
+    """
+
+    def __init__(self, fields, **options):
+        self.root = Object(fields, **options)
+        self._full = self.root.compile(partial=False)
+        self._partial = self.root.compile(partial=True)
+
+    def errors(self, data, partial=False, limit=MAX_ERRORS):
+        found = (self._partial if partial else self._full)(data)
+        if not found:
+            return []
+        errors = []
+        for path, label, problem in found[:limit]:
+            message = f'{label or "request body"} {problem}'
+            errors.append({'field': _field_path(path), 'message': message[0].upper() + message[1:]})
+        return errors
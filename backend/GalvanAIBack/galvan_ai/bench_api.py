@@ -0,0 +1,526 @@
+#!/usr/bin/env python3
+"""
+Load-test the API against a freshly seeded, throwaway database.
+Seeds a temporary SQLite database with synthetic careers, questionnaires,
+job applications, blog posts and projects (the generate_* functions in the
+add_sample_* scripts), then drives each route:
+
+    client  in-process with the Flask test client, one request at a time
+    http    over HTTP against serve.py (gunicorn), from --concurrency
+            keep-alive connections
+
+and reports p50/p95/p99 latency and requests/s per route, with memory as
+the process-wide RSS peak so far and how much a route raised it. Results
+can be saved as a JSON baseline; a later run with --baseline fails (exit 1)
+when a route's p95 or throughput is more than --tolerance worse.
+
+    python bench_api.py --applications 100000 --save-baseline bench_baseline.json
+    python bench_api.py --applications 100000 --baseline bench_baseline.json
+    python bench_api.py --mode http --concurrency 32 --routes projects,job-applications
+"""
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+BENCH_USER = ('bench', 'bench-password')
+SEED_BATCH_SIZE = 5000
+WARMUP_REQUESTS = 5
+
+# (name, method, path); {placeholders} are filled in after seeding. Every run is logged in.
+ROUTES = [
+    ('GET /api/projects', 'GET', '/api/projects'),
+    ('GET /api/projects (page 2)', 'GET', '/api/projects?cursor={project_cursor}'),
+    ('GET /api/projects/best', 'GET', '/api/projects/best'),
+    ('GET /api/projects/<id>', 'GET', '/api/projects/{project_id}'),
+    ('GET /api/blog-posts', 'GET', '/api/blog-posts'),
+    ('GET /api/blog-posts/featured', 'GET', '/api/blog-posts/featured'),
+    ('GET /api/blog-posts/<id>', 'GET', '/api/blog-posts/{blog_id}'),
+    ('GET /api/careers', 'GET', '/api/careers'),
+    ('GET /api/careers/active', 'GET', '/api/careers/active'),
+    ('GET /api/questionnaires?jobId=', 'GET', '/api/questionnaires?jobId={job_id}'),
+    ('GET /api/job-applications', 'GET', '/api/job-applications'),
+    ('GET /api/job-applications (page 2)', 'GET', '/api/job-applications?cursor={application_cursor}'),
+    ('GET /api/job-applications?status=', 'GET', '/api/job-applications?status=shortlisted'),
+    ('GET /api/job-applications?jobId=', 'GET', '/api/job-applications?jobId={job_id}'),
+    ('GET /api/search?q=', 'GET', '/api/search?q=data'),
+    ('GET /api/stats', 'GET', '/api/stats'),
+    ('POST /api/contact-quotes', 'POST', '/api/contact-quotes'),
+]
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the API against a seeded temporary database.")
+    parser.add_argument('--mode', choices=('client', 'http', 'both'), default='both')
+    parser.add_argument('--requests', type=int, default=200, help="requests per route (default 200)")
+    parser.add_argument('--concurrency', type=int, default=8, help="HTTP connections in http mode (default 8)")
+    parser.add_argument('--workers', type=int, default=2, help="gunicorn workers in http mode (default 2)")
+    parser.add_argument('--applications', type=int, default=10000, help="job applications to seed (1k-1M)")
+    parser.add_argument('--careers', type=int, default=50)
+    parser.add_argument('--projects', type=int, default=500)
+    parser.add_argument('--project-size', type=int, default=50, help="gallery and timeline items per project")
+    parser.add_argument('--blogs', type=int, default=500)
+    parser.add_argument('--blog-paragraphs', type=int, default=20, help="how many times long blog text repeats")
+    parser.add_argument('--routes', help="only routes whose name contains one of these comma-separated words")
+    parser.add_argument('--no-cache', action='store_true', help="run with RESPONSE_CACHE_BACKEND=none")
+    parser.add_argument('--accept-encoding', default='br, gzip', help="Accept-Encoding sent with every request")
+    parser.add_argument('--save-baseline', metavar='PATH', help="write the results as a JSON baseline")
+    parser.add_argument('--baseline', metavar='PATH', help="compare against a saved baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown vs the baseline (default 0.25)")
+    parser.add_argument('--keep', action='store_true', help="keep the temporary database directory")
+    return parser.parse_args(argv)
+
+def configure_environment(args, workdir):
+    """Environment for both the in-process app and the serve.py subprocess.
+
+    app.config and app.api read it at import time, so this runs before the
+    app package is imported.
+    """
+    os.environ.update({
+        'APP_ENV': 'production',
+        'SECRET_KEY': 'bench-secret-key',
+        'DATABASE_URL': f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        'AUTO_MIGRATE': '1',
+        'SESSION_COOKIE_SECURE': '0',
+        # Every request comes from one IP; the limiter would turn the POST route into a 429 benchmark
+        'RATE_LIMIT_ENABLED': '0',
+    })
+    # serve.py gives the gunicorn workers a fresh metrics directory of their own
+    os.environ.pop('PROMETHEUS_MULTIPROC_DIR', None)
+    if args.no_cache:
+        os.environ['RESPONSE_CACHE_BACKEND'] = 'none'
+
+# ==================== SEEDING ====================
+
+def _columns(instance, created_at):
+    """Column values of an unsaved model instance, for a Core bulk insert."""
+    row = {c.key: getattr(instance, c.key) for c in instance.__table__.columns if c.key != 'id'}
+    row['created_at'] = row['updated_at'] = created_at
+    return row
+
+def _bulk_insert(label, model, rows, total):
+    """Insert rows in batches, with created_at one minute apart going back from now."""
+    from sqlalchemy import insert
+    from app import db
+
+    started = time.perf_counter()
+    now = datetime.utcnow()
+    batch = []
+    for n, instance in enumerate(rows):
+        batch.append(_columns(instance, now - timedelta(minutes=n)))
+        if len(batch) == SEED_BATCH_SIZE:
+            db.session.execute(insert(model.__table__), batch)
+            db.session.commit()
+            batch = []
+            print(f"\r   {label}: {n + 1}/{total}", end='', flush=True)
+    if batch:
+        db.session.execute(insert(model.__table__), batch)
+        db.session.commit()
+    print(f"\r   {label}: {total} in {time.perf_counter() - started:.1f}s")
+
+def seed(args):
+    from werkzeug.security import generate_password_hash
+    from app import db
+    from app.models.blog import BlogPost
+    from app.models.career import Career
+    from app.models.job_application import JobApplication
+    from app.models.project import Project
+    from app.models.questionnaire import Questionnaire
+    from app.models.user import User
+    from add_sample_blogs import generate_blogs
+    from add_sample_careers import generate_careers
+    from add_sample_job_applications import generate_job_applications
+    from add_sample_projects import generate_projects
+    from add_sample_questionnaires import generate_questionnaires
+
+    print("🌱 Seeding synthetic data...")
+    db.session.add(User(username=BENCH_USER[0], password=generate_password_hash(BENCH_USER[1])))
+    db.session.commit()
+
+    _bulk_insert('careers', Career,
+                 (Career.from_dict(c) for c in generate_careers(args.careers)), args.careers)
+    jobs = db.session.query(Career.id, Career.title).order_by(Career.id).all()
+    _bulk_insert('questionnaires', Questionnaire,
+                 (Questionnaire.from_dict(q) for q in generate_questionnaires([job_id for job_id, _ in jobs])),
+                 len(jobs))
+    questionnaires = {
+        q.job_id: (q.id, json.loads(q.questions)) for q in Questionnaire.query.all()
+    }
+    _bulk_insert('job applications', JobApplication,
+                 (JobApplication.from_dict(a) for a in generate_job_applications(args.applications, jobs, questionnaires)),
+                 args.applications)
+    _bulk_insert('projects', Project,
+                 (Project.from_dict(p) for p in generate_projects(args.projects, args.project_size, args.project_size)),
+                 args.projects)
+    _bulk_insert('blog posts', BlogPost,
+                 (BlogPost.from_dict(b) for b in generate_blogs(args.blogs, args.blog_paragraphs)),
+                 args.blogs)
+    db.session.execute(db.text('ANALYZE'))
+    db.session.commit()
+
+def route_params(client):
+    """Values for the {placeholders} in ROUTES, read from the seeded data."""
+    from app.models.blog import BlogPost
+    from app.models.career import Career
+    from app.models.project import Project
+
+    def next_cursor(path):
+        return client.get(path).get_json().get('next_cursor') or ''
+
+    return {
+        'project_id': Project.query.order_by(Project.id).first().id,
+        'blog_id': BlogPost.query.order_by(BlogPost.id).first().id,
+        'job_id': Career.query.order_by(Career.id).first().id,
+        'project_cursor': next_cursor('/api/projects'),
+        'application_cursor': next_cursor('/api/job-applications'),
+    }
+
+def contact_quote_body():
+    return json.dumps({
+        'name': 'Load Test',
+        'email': f'load-{uuid.uuid4().hex[:12]}@example.com',
+        'company': 'Bench Co',
+        'projectDetails': 'Synthetic quote request submitted by bench_api.py.',
+    })
+
+# ==================== MEASUREMENT ====================
+
+def _rss_bytes(pid):
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+def _process_tree(pid):
+    """pid and all its descendants, from /proc (Linux only)."""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    tree, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        tree.append(current)
+        stack.extend(children.get(current, ()))
+    return tree
+
+class RSSSampler:
+    """Resident memory of a process tree while a route runs, sampled every 10 ms.
+
+    Freed memory is rarely returned to the OS, so peak is the process-wide
+    high-water mark so far, not the route's own footprint: every route after
+    the heaviest one reports about the same peak. growth (peak minus the
+    RSS when the route started) is what can be attributed to the route.
+    Without /proc both come from getrusage's ru_maxrss.
+    """
+
+    def __init__(self, pid, tree=False):
+        self.pid = pid
+        self.tree = tree
+        self.start = None
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample(self):
+        pids = _process_tree(self.pid) if self.tree else [self.pid]
+        rss = sum(_rss_bytes(pid) for pid in pids)
+        if self.start is None:
+            self.start = rss
+        self.peak = max(self.peak, rss)
+
+    @property
+    def growth(self):
+        return max(0, self.peak - self.start) if self.start is not None else None
+
+    @staticmethod
+    def _maxrss():
+        import resource
+        scale = 1 if sys.platform == 'darwin' else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+    def _run(self):
+        while not self._stop.wait(0.01):
+            self.sample()
+
+    def __enter__(self):
+        if os.path.exists('/proc'):
+            self.sample()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        elif self.pid == os.getpid():
+            self.start = self._maxrss()
+        return self
+
+    def __exit__(self, *exc):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self.sample()
+        elif self.pid == os.getpid():
+            self.peak = self._maxrss()
+
+def percentile(ordered, pct):
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def summarize(latencies, errors, elapsed, rss):
+    ordered = sorted(latencies)
+    return {
+        'requests': len(ordered),
+        'errors': errors,
+        'p50_ms': round(percentile(ordered, 50) * 1000, 3),
+        'p95_ms': round(percentile(ordered, 95) * 1000, 3),
+        'p99_ms': round(percentile(ordered, 99) * 1000, 3),
+        'rps': round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        # Process-wide high-water mark so far (see RSSSampler), and this route's share of it
+        'process_peak_rss_mb': round(rss.peak / (1024 * 1024), 1) if rss.peak else None,
+        'rss_growth_mb': round(rss.growth / (1024 * 1024), 1) if rss.peak and rss.growth is not None else None,
+    }
+
+# ==================== TEST CLIENT MODE ====================
+
+def run_client(app, routes, params, args):
+    print(f"\n🧪 Flask test client: {args.requests} requests per route")
+    client = app.test_client()
+    login = client.post('/login', data={'username': BENCH_USER[0], 'password': BENCH_USER[1]})
+    if login.status_code != 302:
+        print("❌ Could not log in as the bench user")
+    headers = {'Accept-Encoding': args.accept_encoding}
+
+    def send(method, path):
+        if method != 'POST':
+            return client.open(path, method=method, headers=headers)
+        return client.open(path, method=method, data=contact_quote_body(), content_type='application/json',
+                           headers=dict(headers, **{'Idempotency-Key': uuid.uuid4().hex}))
+
+    results = {}
+    for name, method, path in routes:
+        path = path.format(**params)
+        # Untimed: the first requests fill caches and prepared statements
+        for _ in range(WARMUP_REQUESTS):
+            send(method, path).get_data()
+        latencies, errors = [], 0
+        with RSSSampler(os.getpid()) as rss:
+            started = time.perf_counter()
+            for _ in range(args.requests):
+                t0 = time.perf_counter()
+                response = send(method, path)
+                response.get_data()
+                latencies.append(time.perf_counter() - t0)
+                if response.status_code >= 400:
+                    errors += 1
+            elapsed = time.perf_counter() - started
+        results[name] = summarize(latencies, errors, elapsed, rss)
+        report(name, results[name])
+    return results
+
+# ==================== HTTP MODE ====================
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_server(args, port):
+    env = dict(os.environ, BIND=f'127.0.0.1:{port}', WEB_CONCURRENCY=str(args.workers),
+               WEB_MAX_REQUESTS='0', WEB_SERVER='gunicorn')
+    here = os.path.dirname(os.path.abspath(__file__))
+    server = subprocess.Popen([sys.executable, os.path.join(here, 'serve.py')], cwd=here, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"serve.py exited: {server.stderr.read().decode(errors='replace')[-2000:]}")
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            conn.request('GET', '/api/careers/active')
+            if conn.getresponse().status == 200:
+                conn.close()
+                return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("serve.py did not start within 30s")
+
+def http_login(port):
+    """Session cookie for the bench user."""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    body = f'username={BENCH_USER[0]}&password={BENCH_USER[1]}'
+    conn.request('POST', '/login', body, {'Content-Type': 'application/x-www-form-urlencoded'})
+    response = conn.getresponse()
+    response.read()
+    cookie = response.getheader('Set-Cookie') or ''
+    conn.close()
+    return cookie.split(';', 1)[0]
+
+def _http_worker(port, method, path, count, headers):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    latencies, errors = [], 0
+    started = None
+    for n in range(count + WARMUP_REQUESTS):
+        if n == WARMUP_REQUESTS:
+            started = time.perf_counter()
+        body = contact_quote_body() if method == 'POST' else None
+        request_headers = headers
+        if body is not None:
+            request_headers = dict(headers, **{'Content-Type': 'application/json', 'Idempotency-Key': uuid.uuid4().hex})
+        t0 = time.perf_counter()
+        try:
+            conn.request(method, path, body, request_headers)
+            response = conn.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            status = 599
+        if n < WARMUP_REQUESTS:
+            continue
+        latencies.append(time.perf_counter() - t0)
+        if status >= 400:
+            errors += 1
+    conn.close()
+    return latencies, errors, started, time.perf_counter()
+
+def run_http(routes, params, args):
+    port = _free_port()
+    print(f"\n🌐 HTTP via serve.py: {args.workers} worker(s), {args.concurrency} connections, "
+          f"{args.requests} requests per route")
+    server = start_server(args, port)
+    try:
+        headers = {'Accept-Encoding': args.accept_encoding, 'Cookie': http_login(port)}
+        shares = [args.requests // args.concurrency + (1 if i < args.requests % args.concurrency else 0)
+                  for i in range(args.concurrency)]
+        results = {}
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            for name, method, path in routes:
+                path = path.format(**params)
+                with RSSSampler(server.pid, tree=True) as rss:
+                    futures = [pool.submit(_http_worker, port, method, path, count, headers)
+                               for count in shares if count]
+                    latencies, errors, spans = [], 0, []
+                    for future in futures:
+                        worker_latencies, worker_errors, started, finished = future.result()
+                        latencies.extend(worker_latencies)
+                        errors += worker_errors
+                        spans.append((started, finished))
+                    # Throughput over the timed part only, from the first timed request to the last
+                    elapsed = max(end for _, end in spans) - min(start for start, _ in spans)
+                results[name] = summarize(latencies, errors, elapsed, rss)
+                report(name, results[name])
+        return results
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+# ==================== REPORTING ====================
+
+def report(name, result):
+    rss = (f"process peak {result['process_peak_rss_mb']:>7.1f} MB (+{result['rss_growth_mb']:.1f})"
+           if result['process_peak_rss_mb'] else 'process peak n/a')
+    errors = f"  ❌ {result['errors']} error(s)" if result['errors'] else ''
+    print(f"  {name:<40} p50 {result['p50_ms']:>8.2f}  p95 {result['p95_ms']:>8.2f}  "
+          f"p99 {result['p99_ms']:>8.2f} ms  {result['rps']:>8.1f} req/s  {rss}{errors}")
+
+def compare(results, baseline, tolerance):
+    """Print routes that got slower than the baseline; True when none did."""
+    print(f"\n📊 Compared with baseline (tolerance {tolerance:.0%})")
+    if baseline.get('dataset') != results['dataset']:
+        print("⚠️ The baseline was recorded with a different dataset; numbers may not be comparable")
+    ok = True
+    for mode, routes in results['modes'].items():
+        for name, result in routes.items():
+            before = baseline.get('modes', {}).get(mode, {}).get(name)
+            if before is None:
+                continue
+            problems = []
+            if result['p95_ms'] > before['p95_ms'] * (1 + tolerance):
+                problems.append(f"p95 {before['p95_ms']:.2f} → {result['p95_ms']:.2f} ms")
+            if result['rps'] < before['rps'] / (1 + tolerance):
+                problems.append(f"{before['rps']:.1f} → {result['rps']:.1f} req/s")
+            if result['errors'] > before['errors']:
+                problems.append(f"errors {before['errors']} → {result['errors']}")
+            if problems:
+                ok = False
+                print(f"❌ [{mode}] {name}: {'; '.join(problems)}")
+    print("🎉 No regressions" if ok else "❌ Some routes regressed")
+    return ok
+
+def main(argv=None):
+    args = parse_args(argv)
+    workdir = tempfile.mkdtemp(prefix='galvan-bench-')
+    configure_environment(args, workdir)
+    from app import create_app
+
+    try:
+        app = create_app()
+        with app.app_context():
+            seed(args)
+            params = route_params(app.test_client())
+
+            routes = ROUTES
+            if args.routes:
+                words = [w.strip() for w in args.routes.split(',') if w.strip()]
+                routes = [route for route in ROUTES if any(word in route[0] for word in words)]
+
+            results = {
+                'recorded_at': datetime.utcnow().isoformat(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'dataset': {
+                    'applications': args.applications, 'careers': args.careers,
+                    'projects': args.projects, 'project_size': args.project_size,
+                    'blogs': args.blogs, 'blog_paragraphs': args.blog_paragraphs,
+                    'cache': not args.no_cache,
+                },
+                'requests_per_route': args.requests,
+                'concurrency': args.concurrency,
+                'modes': {},
+            }
+            if args.mode in ('client', 'both'):
+                results['modes']['client'] = run_client(app, routes, params, args)
+        # The app context is closed so the server is the only writer for POST routes
+        if args.mode in ('http', 'both'):
+            results['modes']['http'] = run_http(routes, params, args)
+
+        if args.save_baseline:
+            with open(args.save_baseline, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"\n💾 Baseline saved to {args.save_baseline}")
+        if args.baseline:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+            return 0 if compare(results, baseline, args.tolerance) else 1
+        return 0
+    finally:
+        if args.keep:
+            print(f"📁 Database kept in {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark request validation (app/validation.py) per request.
+Builds project payloads with growing galleries, teams and timelines plus a
+large questionnaire, and reports the time to validate each one, both valid
+and with every item invalid (the worst case: all errors are collected).
+
+    python bench_validation.py
+"""
+
+import timeit
+
+from app.models.blog import BlogPost
+from app.models.project import Project
+from app.models.questionnaire import Questionnaire
+
+SIZES = (10, 100, 1000, 10000)
+
+def project_payload(size):
+    return {
+        'hero': {'subtitle': 'Subtitle', 'description': 'Description', 'banner': 'https://example.com/banner.png'},
+        'longDescription': 'Long description ' * 20,
+        'gallery': [f'https://example.com/gallery/{i}.png' for i in range(size)],
+        'features': [f'Feature {i}' for i in range(min(size, 50))],
+        'team': [{'name': f'Member {i}', 'role': 'Engineer', 'avatar': f'https://example.com/a/{i}.png'}
+                 for i in range(size // 10 or 1)],
+        'timeline': [{'phase': f'Phase {i}', 'date': '2024-01-01'} for i in range(size)],
+        'testimonials': [{'quote': 'Great work', 'author': f'Client {i}'} for i in range(size // 10 or 1)],
+        'technologies': ['Python', 'React'],
+        'bestProject': False,
+    }
+
+def broken_project_payload(size):
+    data = project_payload(size)
+    data['gallery'] = list(range(size))
+    data['timeline'] = [{'phase': ''} for _ in range(size)]
+    return data
+
+def questionnaire_payload(size):
+    types = ('text', 'select', 'file', 'number', 'textarea')
+    questions = []
+    for i in range(size):
+        kind = types[i % len(types)]
+        question = {'id': f'q{i}', 'type': kind, 'label': f'Question {i}', 'required': True, 'order': i}
+        if kind == 'select':
+            question['options'] = ['A', 'B', 'C']
+        elif kind == 'file':
+            question['validation'] = {'allowedFileTypes': ['pdf', 'docx'], 'maxFileSize': 5 * 1024 * 1024, 'maxFiles': 1}
+        elif kind in ('text', 'textarea'):
+            question['validation'] = {'minLength': 1, 'maxLength': 500}
+        questions.append(question)
+    return {'jobId': '1', 'title': 'Application', 'description': 'Questions', 'questions': questions}
+
+def blog_payload():
+    return {
+        'title': 'Title', 'excerpt': 'Excerpt',
+        'author': {'name': 'Author', 'avatar': 'https://example.com/a.png', 'role': 'Writer', 'bio': 'Bio'},
+        'readTime': '5 min', 'publishDate': '2024-01-01', 'category': 'AI', 'image': 'https://example.com/i.png',
+        'tags': ['ai'], 'featured': False, 'intro': 'Intro', 'keyConcepts': [], 'implementation': 'Impl',
+        'bestPractices': [], 'conclusion': 'Conclusion',
+    }
+
+def measure(schema, payload, partial=False):
+    """Best-of-3 microseconds per validation, plus the error count."""
+    errors = schema.errors(payload, partial=partial)
+    timer = timeit.Timer(lambda: schema.errors(payload, partial=partial))
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=3, number=number))
+    return best / number * 1e6, len(errors)
+
+def report(label, schema, payload, partial=False):
+    micros, errors = measure(schema, payload, partial)
+    status = '✓' if not errors else f'❌ {errors} error(s)'
+    print(f"  {label:<42} {micros:>10.1f} µs  {status}")
+
+def main():
+    print("⏱️ Validation cost per request")
+    print("=" * 64)
+    print("📁 Projects (gallery/timeline items = size)")
+    for size in SIZES:
+        report(f'create, size {size}', Project.SCHEMA, project_payload(size))
+    for size in SIZES:
+        report(f'update (partial), size {size}', Project.SCHEMA,
+               {'gallery': project_payload(size)['gallery']}, partial=True)
+    for size in SIZES:
+        report(f'create, size {size}, every item invalid', Project.SCHEMA, broken_project_payload(size))
+
+    print("📋 Questionnaires")
+    for size in (10, 100, 1000):
+        report(f'create, {size} questions', Questionnaire.SCHEMA, questionnaire_payload(size))
+
+    print("📝 Blog posts")
+    report('create', BlogPost.SCHEMA, blog_payload())
+    report('update (partial), title only', BlogPost.SCHEMA, {'title': 'New title'}, partial=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Check that the list routes in app/api.py are answered from an index.
+Runs EXPLAIN QUERY PLAN on the same queries the routes build and reports
+full table scans and temporary sorts. Exits non-zero if any route scans a
+table or sorts in memory: a keyset page sorted in a temp B-tree reads every
+matching row, however small the page.
+"""
+
+import sys
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.dialects import sqlite
+
+from app import create_app, db
+from app.models.project import Project
+from app.models.blog import BlogPost
+from app.models.testimonial import Testimonial
+from app.models.team import Team
+from app.models.career import Career
+from app.models.questionnaire import Questionnaire
+from app.models.job_application import JobApplication
+from app.models.contact_quote import ContactQuote
+from app.pagination import DEFAULT_PAGE_SIZE, encode_cursor, keyset_query
+
+def route_queries():
+    """(label, query) pairs mirroring the list routes, first page and a later page."""
+    cursor = encode_cursor(datetime(2024, 1, 1), 100)
+    collections = [
+        ('GET /api/projects', Project, Project.query),
+        ('GET /api/blog-posts', BlogPost, BlogPost.query),
+        ('GET /api/testimonials', Testimonial, Testimonial.query),
+        ('GET /api/teams', Team, Team.query),
+        ('GET /api/careers', Career, Career.query),
+        ('GET /api/questionnaires', Questionnaire, Questionnaire.query),
+        ('GET /api/questionnaires?jobId=', Questionnaire, Questionnaire.query.filter_by(job_id='1')),
+        ('GET /api/job-applications', JobApplication, JobApplication.query),
+        ('GET /api/job-applications?jobId=', JobApplication, JobApplication.query.filter_by(job_id='1')),
+        ('GET /api/job-applications?jobId=&status=', JobApplication,
+         JobApplication.query.filter_by(job_id='1').filter_by(status='pending')),
+        ('GET /api/job-applications?status=', JobApplication, JobApplication.query.filter_by(status='pending')),
+        ('GET /api/contact-quotes', ContactQuote, ContactQuote.query),
+    ]
+    for label, model, query in collections:
+        yield label, keyset_query(query, model, None, DEFAULT_PAGE_SIZE)
+        yield label + ' (cursor)', keyset_query(query, model, cursor, DEFAULT_PAGE_SIZE)
+
+    yield 'GET /api/projects/best', Project.query.filter_by(best_project=True).order_by(Project.created_at.desc())
+    yield 'GET /api/blog-posts/featured', BlogPost.query.filter_by(featured=True).order_by(BlogPost.created_at.desc())
+    yield 'GET /api/testimonials/featured', Testimonial.query.filter_by(featured=True).order_by(Testimonial.created_at.desc())
+    yield 'GET /api/careers/active', Career.query.filter_by(is_active=True)
+    yield 'GET /api/questionnaires/active', Questionnaire.query.filter_by(is_active=True).order_by(Questionnaire.created_at.desc())
+
+def explain(query):
+    compiled = query.statement.compile(dialect=sqlite.dialect(paramstyle='named'))
+    params = {k: (str(v) if isinstance(v, datetime) else v) for k, v in compiled.params.items()}
+    rows = db.session.execute(text('EXPLAIN QUERY PLAN ' + str(compiled)), params).all()
+    return [row[-1] for row in rows]
+
+def plan_issue(plan):
+    """'scan' for a full table scan, 'sort' for a temp B-tree sort, else None."""
+    if any(step.startswith('SCAN') and 'USING' not in step for step in plan):
+        return 'scan'
+    if any('TEMP B-TREE' in step for step in plan):
+        return 'sort'
+    return None
+
+def check_query_plans():
+    app = create_app()
+    with app.app_context():
+        if db.engine.dialect.name != 'sqlite':
+            print("❌ EXPLAIN QUERY PLAN check only supports SQLite")
+            return False
+
+        print("🔍 Query plans for list routes")
+        print("=" * 50)
+        ok = True
+        for label, query in route_queries():
+            plan = explain(query)
+            issue = plan_issue(plan)
+            if issue == 'scan':
+                print(f"❌ {label}: {'; '.join(plan)}")
+            elif issue == 'sort':
+                print(f"❌ {label}: index used, sorted in memory: {'; '.join(plan)}")
+            else:
+                print(f"✓ {label}: {'; '.join(plan)}")
+            ok = ok and issue is None
+
+        print()
+        print("🎉 Every route uses an index" if ok else "❌ Some routes scan or sort a whole table; run `flask --app run db upgrade`")
+        return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if check_query_plans() else 1)
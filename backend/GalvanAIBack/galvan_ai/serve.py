@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Production entry point. run.py starts the single-process Werkzeug debug server;
+this serves the same create_app() under a pre-fork gunicorn master, or under
+waitress on platforms without fork (Windows).
+
+All settings come from the environment:
+
+    BIND                 address to listen on (default 0.0.0.0:$PORT, PORT defaults to 5000)
+    WEB_CONCURRENCY      worker processes (default 2 * CPUs + 1)
+    WEB_THREADS          threads per worker (default 4)
+    WEB_TIMEOUT          seconds before a silent worker is killed and restarted (default 30)
+    WEB_GRACEFUL_TIMEOUT seconds in-flight requests get on reload/shutdown (default 30)
+    WEB_KEEPALIVE        keep-alive seconds for idle client connections (default 5)
+    WEB_MAX_REQUESTS     recycle a worker after this many requests, 0 = never (default 1000)
+    WEB_PRELOAD          load the app in the master so workers share its memory (default 1)
+    WEB_PIDFILE          pid file for `kill -HUP $(cat ...)` graceful reloads
+    WEB_SERVER           force 'gunicorn' or 'waitress'
+    PROMETHEUS_MULTIPROC_DIR  where gunicorn workers write /metrics samples
+                         (default: a fresh temporary directory per master)
+
+APP_ENV defaults to 'production' here (see app/config.py for the database,
+pool and secret settings). Production does not migrate at startup: run
+`flask --app run db upgrade` on deploy, before starting or reloading.
+
+Graceful reload: SIGHUP to the gunicorn master starts fresh workers and lets
+the old ones finish their current requests first. The master imports the
+code and reads the environment once, before forking (with or without
+WEB_PRELOAD), so a HUP only recycles workers on the same code and settings.
+To deploy new code or config, restart the master, or for zero downtime send
+it SIGUSR2 (it re-executes itself alongside the old one) and then SIGTERM
+the old master once the new workers are up.
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+
+from app import create_app, db
+from app.config import env_flag, env_int
+from app.metrics import mark_process_dead
+
+
+def server_options():
+    return {
+        'bind': os.environ.get('BIND') or f"0.0.0.0:{env_int('PORT', 5000)}",
+        'workers': env_int('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1),
+        'threads': env_int('WEB_THREADS', 4),
+        'timeout': env_int('WEB_TIMEOUT', 30),
+        'graceful_timeout': env_int('WEB_GRACEFUL_TIMEOUT', 30),
+        'keepalive': env_int('WEB_KEEPALIVE', 5),
+        'max_requests': env_int('WEB_MAX_REQUESTS', 1000),
+        # Spread recycling out so workers do not all restart at once
+        'max_requests_jitter': env_int('WEB_MAX_REQUESTS', 1000) // 10,
+        'preload_app': env_flag('WEB_PRELOAD', True),
+        'pidfile': os.environ.get('WEB_PIDFILE') or None,
+        'accesslog': '-',
+        'errorlog': '-',
+    }
+
+
+def post_fork(server, worker):
+    # With preload the master opened database connections while creating the
+    # app; a forked worker must never reuse those sockets, so drop the inherited
+    # pool (without closing the master's connections) and let it reconnect.
+    if not server.cfg.preload_app:
+        return
+    with worker.app.wsgi().app_context():
+        db.engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    mark_process_dead(worker.pid)
+
+
+def prepare_metrics_dir():
+    """Give the workers a shared, empty directory for multi-process metrics."""
+    path = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if not path:
+        os.environ['PROMETHEUS_MULTIPROC_DIR'] = tempfile.mkdtemp(prefix='galvan-metrics-')
+        return
+    # Samples left by a previous server would be added to the new totals
+    os.makedirs(path, exist_ok=True)
+    for name in os.listdir(path):
+        if name.endswith('.db'):
+            os.remove(os.path.join(path, name))
+
+
+def serve_gunicorn(options):
+    from gunicorn.app.base import BaseApplication
+
+    class GalvanApplication(BaseApplication):
+        def __init__(self, options):
+            self.options = options
+            self.application = None
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                if value is not None and key in self.cfg.settings:
+                    self.cfg.set(key, value)
+            self.cfg.set('post_fork', post_fork)
+            self.cfg.set('child_exit', child_exit)
+
+        def load(self):
+            if self.application is None:
+                self.application = create_app()
+            return self.application
+
+        def wsgi(self):
+            return self.load()
+
+    GalvanApplication(options).run()
+
+
+def serve_waitress(options):
+    from waitress import serve
+
+    # waitress is single-process: the thread pool is the whole worker budget
+    serve(
+        create_app(),
+        listen=options['bind'],
+        threads=max(options['threads'] * options['workers'], 1),
+        channel_timeout=options['timeout'],
+        ident='galvan-ai',
+    )
+
+
+def main():
+    os.environ.setdefault('APP_ENV', 'production')
+    options = server_options()
+    server = os.environ.get('WEB_SERVER') or ('waitress' if os.name == 'nt' else 'gunicorn')
+    print(f"🚀 Serving Galvan AI on {options['bind']} with {server} "
+          f"({options['workers']} workers x {options['threads']} threads, timeout {options['timeout']}s)")
+    if server == 'waitress':
+        serve_waitress(options)
+    elif server == 'gunicorn':
+        prepare_metrics_dir()
+        serve_gunicorn(options)
+    else:
+        print(f"❌ Unknown WEB_SERVER: {server}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,7 @@ BASE_URL = "http://localhost:5000"
 def test_get_projects():
     """Test getting all projects"""
     try:
-        response = requests.get(f"{BASE_URL}/api/projects")
+        response = requests.get(f"{BASE_URL}/api/projects", params={"paginate": "false"})
         print(f"GET /api/projects - Status: {response.status_code}")
         if response.status_code == 200:
             projects = response.json()
@@ -136,7 +136,7 @@ def test_file_upload():
     
     try:
         # Get the submitted application
-        get_response = requests.get(f"{api_url}/api/job-applications", timeout=10)
+        get_response = requests.get(f"{api_url}/api/job-applications", params={"paginate": "false"}, timeout=10)
         
         if get_response.status_code == 200:
             applications = get_response.json()
@@ -0,0 +1,76 @@
+import pytest
+from werkzeug.security import generate_password_hash
+
+from app import create_app, db
+
+TEST_USER = ('tester', 'tester-password')
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app('testing')
+    app.config['BLOB_STORE_PATH'] = str(tmp_path / 'blobs')
+    with app.app_context():
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_client(app):
+    from app.models.user import User
+    db.session.add(User(username=TEST_USER[0], password=generate_password_hash(TEST_USER[1])))
+    db.session.commit()
+    client = app.test_client()
+    response = client.post('/login', data={'username': TEST_USER[0], 'password': TEST_USER[1]})
+    assert response.status_code == 302
+    return client
+
+
+@pytest.fixture
+def blog_payload():
+    """A valid POST /api/blog-posts body."""
+    return {
+        'title': 'Scaling Flask', 'excerpt': 'Notes on a busy API',
+        'author': {'name': 'Ada', 'avatar': 'https://example.com/ada.png', 'role': 'Engineer', 'bio': 'Writes code'},
+        'readTime': '5 min', 'publishDate': '2026-01-01', 'category': 'Engineering',
+        'image': 'https://example.com/cover.png', 'tags': ['flask', 'sqlite'], 'featured': True,
+        'intro': 'Intro', 'keyConcepts': ['caching'], 'implementation': 'Details', 'bestPractices': ['measure'],
+        'conclusion': 'Done',
+    }
+
+
+@pytest.fixture
+def make_application():
+    """Insert a job application; keyword arguments override its columns."""
+    from app.models.job_application import JobApplication
+
+    def make(**columns):
+        application = JobApplication(**dict({
+            'job_id': '1', 'job_title': 'Engineer', 'applicant_name': 'Ada',
+            'applicant_email': f'ada{JobApplication.query.count()}@example.com', 'applicant_phone': '555-0100',
+            'cover_letter': 'Hello', 'responses': [],
+        }, **columns))
+        db.session.add(application)
+        db.session.commit()
+        return application
+    return make
+
+
+@pytest.fixture
+def make_quote():
+    """Insert a contact quote; keyword arguments override its columns."""
+    from app.models.contact_quote import ContactQuote
+
+    def make(**columns):
+        quote = ContactQuote(**dict({
+            'name': 'Ada', 'email': 'ada@example.com', 'company': 'Engines Ltd', 'project_details': 'An engine',
+        }, **columns))
+        db.session.add(quote)
+        db.session.commit()
+        return quote
+    return make
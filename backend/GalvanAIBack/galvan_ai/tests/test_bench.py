@@ -0,0 +1,102 @@
+import os
+
+import pytest
+
+import bench_api
+from bench_api import RSSSampler, compare, percentile, summarize
+
+
+class FixedRSS:
+    peak = 64 * 1024 * 1024
+    growth = 2 * 1024 * 1024
+
+
+def test_percentile():
+    ordered = [i / 1000 for i in range(1, 101)]
+    assert percentile(ordered, 50) == 0.05
+    assert percentile(ordered, 95) == 0.095
+    assert percentile(ordered, 99) == 0.099
+    assert percentile([0.2], 99) == 0.2
+    assert percentile([], 50) == 0.0
+
+
+def test_summarize():
+    result = summarize([0.003, 0.001, 0.002, 0.004], 1, 0.5, FixedRSS())
+    assert result == {
+        'requests': 4, 'errors': 1,
+        'p50_ms': 2.0, 'p95_ms': 4.0, 'p99_ms': 4.0,
+        'rps': 8.0,
+        'process_peak_rss_mb': 64.0, 'rss_growth_mb': 2.0,
+    }
+
+
+def test_summarize_without_memory_or_time():
+    class NoRSS:
+        peak = 0
+        growth = None
+
+    result = summarize([], 0, 0, NoRSS())
+    assert result['rps'] == 0.0
+    assert result['p95_ms'] == 0.0
+    assert result['process_peak_rss_mb'] is None
+    assert result['rss_growth_mb'] is None
+
+
+@pytest.mark.skipif(not os.path.exists('/proc'), reason='samples /proc')
+def test_rss_sampler_records_peak_and_growth():
+    with RSSSampler(os.getpid()) as rss:
+        ballast = bytearray(32 * 1024 * 1024)
+        rss.sample()
+    del ballast
+    assert rss.start > 0
+    assert rss.peak >= rss.start
+    assert rss.growth >= 16 * 1024 * 1024
+
+
+def test_rss_sampler_includes_the_process_tree(monkeypatch):
+    monkeypatch.setattr(bench_api, '_process_tree', lambda pid: [pid, pid + 1])
+    monkeypatch.setattr(bench_api, '_rss_bytes', lambda pid: 100)
+    rss = RSSSampler(1, tree=True)
+    rss.sample()
+    assert rss.start == rss.peak == 200
+    assert rss.growth == 0
+
+
+def _results(p95, rps, errors=0):
+    return {'dataset': {'applications': 10}, 'modes': {'client': {'GET /api/projects': {
+        'p95_ms': p95, 'rps': rps, 'errors': errors}}}}
+
+
+def test_compare_within_tolerance():
+    assert compare(_results(11.0, 95.0), _results(10.0, 100.0), 0.25)
+
+
+@pytest.mark.parametrize('current', [_results(13.0, 100.0), _results(10.0, 70.0), _results(10.0, 100.0, errors=1)])
+def test_compare_flags_regressions(current):
+    assert not compare(current, _results(10.0, 100.0), 0.25)
+
+
+def test_compare_ignores_routes_missing_from_the_baseline():
+    baseline = {'dataset': {'applications': 10}, 'modes': {}}
+    assert compare(_results(100.0, 1.0), baseline, 0.25)
+
+
+def test_seeded_routes_answer(app, capsys):
+    args = bench_api.parse_args(['--applications', '20', '--careers', '3', '--projects', '3', '--project-size', '2',
+                                 '--blogs', '3', '--blog-paragraphs', '1', '--requests', '3'])
+    # As configure_environment() does: every request comes from one IP
+    app.config['RATE_LIMIT_ENABLED'] = False
+    bench_api.seed(args)
+
+    from app.models.career import Career
+    from app.models.job_application import JobApplication
+    assert Career.query.count() == 3
+    assert JobApplication.query.count() == 20
+
+    params = bench_api.route_params(app.test_client())
+    assert params['project_id'] and params['blog_id'] and params['job_id']
+
+    results = bench_api.run_client(app, bench_api.ROUTES, params, args)
+    assert set(results) == {name for name, _, _ in bench_api.ROUTES}
+    assert {name: result['errors'] for name, result in results.items() if result['errors']} == {}
+    assert all(result['requests'] == 3 for result in results.values())
@@ -0,0 +1,98 @@
+import base64
+import hashlib
+import os
+
+import pytest
+
+from app import db
+from app.blobstore import BLOB_REF_PREFIX, BlobStore, blob_url, externalize, get_blob_store
+from app.models.blog import BlogPost
+
+PNG = b'\x89PNG\r\n\x1a\n' + bytes(range(64))
+PNG_DIGEST = hashlib.sha256(PNG).hexdigest()
+
+
+def data_uri(content_type, data):
+    return f'data:{content_type};base64,{base64.b64encode(data).decode("ascii")}'
+
+
+def test_externalize_stores_raster_images_once(app):
+    store = get_blob_store()
+    ref = externalize(data_uri('image/png', PNG))
+    assert ref == BLOB_REF_PREFIX + PNG_DIGEST
+    assert externalize(data_uri('image/png', PNG)) == ref
+    assert store.exists(PNG_DIGEST)
+    assert store.content_type(PNG_DIGEST) == 'image/png'
+    with open(store.path(PNG_DIGEST), 'rb') as f:
+        assert f.read() == PNG
+
+
+@pytest.mark.parametrize('value', [
+    data_uri('image/svg+xml', b'<svg onload="alert(1)"/>'),
+    data_uri('text/html', b'<script>alert(1)</script>'),
+    'https://example.com/a.png',
+    'not a data uri',
+])
+def test_externalize_leaves_everything_else_inline(app, value):
+    assert externalize(value) == value
+
+
+def test_put_rejects_other_content_types(tmp_path):
+    with pytest.raises(ValueError):
+        BlobStore(str(tmp_path)).put(b'<svg/>', 'image/svg+xml')
+
+
+def test_blob_urls_round_trip():
+    ref = BLOB_REF_PREFIX + PNG_DIGEST
+    assert blob_url(ref) == f'/api/blobs/{PNG_DIGEST}'
+    assert externalize(blob_url(ref)) == ref
+    assert blob_url('https://example.com/a.png') == 'https://example.com/a.png'
+
+
+def test_written_images_are_served_as_blobs(auth_client, blog_payload):
+    blog_payload['image'] = data_uri('image/png', PNG)
+    post_id = auth_client.post('/api/blog-posts', json=blog_payload).get_json()['id']
+    assert db.session.get(BlogPost, post_id).image == BLOB_REF_PREFIX + PNG_DIGEST
+    url = auth_client.get(f'/api/blog-posts/{post_id}').get_json()['image']
+    assert url == f'/api/blobs/{PNG_DIGEST}'
+
+    response = auth_client.get(url)
+    assert response.status_code == 200
+    assert response.data == PNG
+    assert response.mimetype == 'image/png'
+    assert response.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+    assert response.headers['X-Content-Type-Options'] == 'nosniff'
+    assert response.headers['Content-Security-Policy'] == "default-src 'none'"
+    assert response.get_etag() == (PNG_DIGEST, False)
+
+
+def test_blobs_answer_conditional_and_range_requests(app, client):
+    get_blob_store().put(PNG, 'image/png')
+    url = f'/api/blobs/{PNG_DIGEST}'
+    assert client.get(url, headers={'If-None-Match': f'"{PNG_DIGEST}"'}).status_code == 304
+    partial = client.get(url, headers={'Range': 'bytes=0-7'})
+    assert partial.status_code == 206
+    assert partial.data == PNG[:8]
+    assert partial.headers['Content-Range'] == f'bytes 0-7/{len(PNG)}'
+
+
+def test_other_stored_types_are_only_downloads(app, client):
+    store = get_blob_store()
+    html = b'<script>alert(1)</script>'
+    digest = hashlib.sha256(html).hexdigest()
+    # As left by a version without the allow-list
+    os.makedirs(os.path.dirname(store.path(digest)))
+    with open(store.path(digest), 'wb') as f:
+        f.write(html)
+    with open(store.path(digest) + '.type', 'w') as f:
+        f.write('text/html')
+    response = client.get(f'/api/blobs/{digest}')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/octet-stream'
+    assert response.headers['Content-Disposition'].startswith('attachment')
+    assert response.headers['X-Content-Type-Options'] == 'nosniff'
+
+
+def test_unknown_digests_are_404(client):
+    assert client.get('/api/blobs/' + '0' * 64).status_code == 404
+    assert client.get('/api/blobs/not-a-digest').status_code == 404
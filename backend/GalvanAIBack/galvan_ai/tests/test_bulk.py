@@ -0,0 +1,81 @@
+from app import db
+from app.models.career import Career
+from app.models.contact_quote import ContactQuote
+from app.models.job_application import JobApplication
+
+CAREER = {
+    'title': 'Engineer', 'company': 'Galvan AI', 'location': 'Remote', 'type': 'Full-time',
+    'department': 'Engineering', 'description': 'Build things',
+}
+
+
+def statuses():
+    return {a.id: a.status for a in JobApplication.query.order_by(JobApplication.id)}
+
+
+def test_bulk_create_reports_each_item(auth_client):
+    items = [CAREER, dict(CAREER, title=''), 'not an object', dict(CAREER, title='Second')]
+    response = auth_client.post('/api/careers/bulk', json={'items': items})
+    assert response.status_code == 207
+    body = response.get_json()
+    assert (body['succeeded'], body['failed'], body['success']) == (2, 2, False)
+    assert [(r['index'], r['success']) for r in body['results']] == [(0, True), (1, False), (2, False), (3, True)]
+    assert body['results'][1]['error'] == 'title is required'
+    assert [c.title for c in Career.query.order_by(Career.id)] == ['Engineer', 'Second']
+    assert [r['id'] for r in body['results'] if r['success']] == [c.id for c in Career.query.order_by(Career.id)]
+
+
+def test_bulk_create_all_valid_is_200_and_atomic_refuses_partial(auth_client):
+    assert auth_client.post('/api/careers/bulk', json={'items': [CAREER]}).status_code == 200
+    response = auth_client.post('/api/careers/bulk?atomic=true', json={'items': [CAREER, {'title': 'x'}]})
+    assert response.status_code == 400
+    assert Career.query.count() == 1
+    assert response.get_json()['results'][0]['error'] == 'Not created: batch contains invalid items'
+
+
+def test_bulk_update_items_and_shared_change(auth_client, make_application):
+    first, second = make_application().id, make_application().id
+    response = auth_client.patch('/api/job-applications/bulk', json={'items': [
+        {'id': first, 'status': 'reviewed'}, {'id': 999, 'status': 'reviewed'}, {'id': second},
+    ]})
+    assert response.status_code == 207
+    assert [r.get('error') for r in response.get_json()['results']] == [
+        None, 'Application not found', 'status or notes is required']
+    db.session.expire_all()
+    assert statuses() == {first: 'reviewed', second: 'pending'}
+
+    response = auth_client.patch('/api/job-applications/bulk', json={'ids': [first, second], 'status': 'hired'})
+    assert response.status_code == 200
+    db.session.expire_all()
+    assert statuses() == {first: 'hired', second: 'hired'}
+
+
+def test_bulk_update_atomic_changes_nothing_on_any_error(auth_client, make_application):
+    first = make_application().id
+    response = auth_client.patch('/api/job-applications/bulk?atomic=1', json={'items': [
+        {'id': first, 'status': 'hired'}, {'id': 999, 'status': 'hired'},
+    ]})
+    assert response.status_code == 400
+    db.session.expire_all()
+    assert statuses() == {first: 'pending'}
+
+
+def test_bulk_delete_quotes(auth_client, make_quote):
+    kept, deleted = make_quote().id, make_quote().id
+    response = auth_client.delete('/api/contact-quotes/bulk', json={'ids': [deleted, 999]})
+    assert response.status_code == 207
+    assert [r['success'] for r in response.get_json()['results']] == [True, False]
+    assert [q.id for q in ContactQuote.query] == [kept]
+    assert auth_client.delete('/api/contact-quotes/bulk', json={'ids': [999]}).status_code == 400
+
+
+def test_bulk_bodies_are_checked(auth_client):
+    assert auth_client.post('/api/careers/bulk', json={'items': []}).get_json() == {'error': 'items must not be empty'}
+    assert auth_client.delete('/api/contact-quotes/bulk', json={'ids': [1, True]}).status_code == 400
+    too_many = {'ids': list(range(1001))}
+    assert auth_client.delete('/api/contact-quotes/bulk', json=too_many).get_json() == {
+        'error': 'At most 1000 ids per request'}
+
+
+def test_bulk_routes_need_a_login(client):
+    assert client.post('/api/careers/bulk', json={'items': [CAREER]}).status_code == 401
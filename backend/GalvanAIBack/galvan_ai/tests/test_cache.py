@@ -0,0 +1,97 @@
+import logging
+
+import pytest
+from sqlalchemy import update
+
+from app import db
+from app.cache import MemoryBackend, RedisBackend, ResponseCache, TableBackend, build_response_cache
+from app.models.career import Career
+from app.redis_client import LazyRedis, redis, redis_from_config
+
+CAREER = {
+    'title': 'Engineer', 'company': 'Galvan AI', 'location': 'Remote', 'type': 'Full-time',
+    'department': 'Engineering', 'description': 'Build things',
+}
+
+
+class SwitchableBackend(MemoryBackend):
+    """A MemoryBackend that can be taken down like a Redis behind an open breaker."""
+
+    available = True
+
+    def get_many(self, keys):
+        if not self.available:
+            raise ConnectionError('down')
+        return super().get_many(keys)
+
+    def incr(self, key):
+        if not self.available:
+            raise ConnectionError('down')
+        super().incr(key)
+
+
+def active_titles(client):
+    return [career['title'] for career in client.get('/api/careers/active').get_json()]
+
+
+def test_public_reads_are_cached_until_a_write_invalidates(auth_client):
+    career_id = auth_client.post('/api/careers', json=CAREER).get_json()['id']
+    assert active_titles(auth_client) == ['Engineer']
+    # Changed behind the API's back: the cached response is still served
+    db.session.execute(update(Career).values(title='Renamed'))
+    db.session.commit()
+    assert active_titles(auth_client) == ['Engineer']
+
+    auth_client.put(f'/api/careers/{career_id}', json=dict(CAREER, title='Edited'))
+    assert active_titles(auth_client) == ['Edited']
+
+
+def test_failed_writes_do_not_invalidate(auth_client):
+    auth_client.post('/api/careers', json=CAREER)
+    active_titles(auth_client)
+    db.session.execute(update(Career).values(title='Renamed'))
+    db.session.commit()
+    assert auth_client.post('/api/careers', json={'title': 'No company'}).status_code == 400
+    assert active_titles(auth_client) == ['Engineer']
+
+
+def test_tag_versions_are_shared_through_the_table(app):
+    # Two workers: separate entry stores, one kv_store table
+    worker_a = ResponseCache(MemoryBackend(), versions=TableBackend())
+    worker_b = ResponseCache(MemoryBackend(), versions=TableBackend())
+    with app.test_request_context('/api/careers/active'):
+        key_a, _ = worker_a.load(['careers'])
+        worker_b.invalidate('careers')
+        assert worker_a.load(['careers'])[0] != key_a
+
+
+def test_cache_is_bypassed_while_the_backend_is_down(app, caplog):
+    backend = SwitchableBackend()
+    cache = ResponseCache(backend)
+    with app.test_request_context('/api/careers/active'):
+        key, _ = cache.load(['careers'])
+        backend.available = False
+        with caplog.at_level(logging.WARNING):
+            assert cache.load(['careers']) == (None, None)
+            cache.invalidate('careers')
+        assert 'Response cache disabled' in caplog.text
+        # Back up: every tag is bumped before entries are trusted again
+        backend.available = True
+        assert cache.load(['careers'])[0] != key
+
+
+def test_build_response_cache_kinds():
+    assert build_response_cache('none') is None
+    cache = build_response_cache(None)
+    assert isinstance(cache.backend, MemoryBackend)
+    assert isinstance(cache.versions, TableBackend)
+
+
+@pytest.mark.skipif(redis is None, reason='redis-py is not installed')
+def test_redis_is_opt_in(app):
+    assert app.extensions['redis_client'] is None
+    assert redis_from_config(app.config) is None
+    client = redis_from_config(dict(app.config, REDIS_HOST='localhost'))
+    assert isinstance(client, LazyRedis)
+    assert (client.port, client.db, client.cooldown) == (6379, 1, 15.0)
+    assert isinstance(build_response_cache(None, client).backend, RedisBackend)
@@ -0,0 +1,63 @@
+import gzip
+
+import pytest
+
+from app import compression
+
+LONG_TEXT = 'Caching and compression notes. ' * 100
+
+
+@pytest.fixture
+def fake_brotli(monkeypatch):
+    """A stand-in 'br' compressor, so negotiation is tested without the brotli package."""
+    monkeypatch.setitem(compression.COMPRESSORS, 'br', lambda data, config: b'br:' + gzip.compress(data, mtime=0))
+
+
+def featured(client, accept_encoding=None):
+    headers = {'Accept-Encoding': accept_encoding} if accept_encoding is not None else {}
+    return client.get('/api/blog-posts/featured', headers=headers)
+
+
+def test_large_responses_are_gzipped(auth_client, blog_payload):
+    auth_client.post('/api/blog-posts', json=dict(blog_payload, intro=LONG_TEXT))
+    plain = featured(auth_client, '')
+    response = featured(auth_client, 'gzip, deflate')
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert gzip.decompress(response.data) == plain.data
+    assert len(response.data) < len(plain.data)
+
+
+def test_small_and_unaccepted_responses_stay_plain(auth_client, blog_payload):
+    assert 'Content-Encoding' not in featured(auth_client, 'gzip').headers
+    auth_client.post('/api/blog-posts', json=dict(blog_payload, intro=LONG_TEXT))
+    for accept in ('', 'identity', 'gzip;q=0'):
+        response = featured(auth_client, accept)
+        assert 'Content-Encoding' not in response.headers
+        assert 'Accept-Encoding' in response.headers['Vary']
+
+
+def test_client_preference_then_configured_order(app, fake_brotli):
+    for accept, expected in [('gzip, br', 'br'), ('gzip;q=1, br;q=0.5', 'gzip'), ('br;q=0', None), ('*', 'br')]:
+        with app.test_request_context(headers={'Accept-Encoding': accept}):
+            assert compression.accepted_encoding() == expected
+    app.config['COMPRESS_ALGORITHMS'] = ['gzip', 'br']
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip, br'}):
+        assert compression.accepted_encoding() == 'gzip'
+
+
+def test_cached_responses_keep_their_compressed_body(auth_client, blog_payload, fake_brotli):
+    auth_client.post('/api/blog-posts', json=dict(blog_payload, intro=LONG_TEXT))
+    first = featured(auth_client, 'br')
+    again = featured(auth_client, 'br')
+    assert first.headers['Content-Encoding'] == again.headers['Content-Encoding'] == 'br'
+    assert again.data == first.data
+    assert again.get_etag() == first.get_etag()
+    # The identity body is still served to clients that do not accept br
+    assert featured(auth_client, '').data == gzip.decompress(first.data[3:])
+
+
+def test_streams_and_files_are_not_compressed(auth_client, make_application):
+    make_application(cover_letter=LONG_TEXT)
+    export = auth_client.get('/api/job-applications/export', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in export.headers
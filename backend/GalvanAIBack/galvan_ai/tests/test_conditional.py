@@ -0,0 +1,69 @@
+from werkzeug.http import http_date
+
+from app import db
+from app.models.blog import BlogPost
+
+
+def create_post(client, payload, **changes):
+    return client.post('/api/blog-posts', json=dict(payload, **changes)).get_json()['id']
+
+
+def revalidate(client, url, response, **params):
+    return client.get(url, query_string=params, headers={'If-None-Match': response.headers['ETag']})
+
+
+def test_list_answers_304_until_it_changes(auth_client, blog_payload):
+    post_id = create_post(auth_client, blog_payload)
+    first = auth_client.get('/api/blog-posts')
+    assert first.status_code == 200
+    assert first.headers['ETag'].startswith('W/"')
+    assert first.headers['Cache-Control'] == 'no-cache'
+
+    again = revalidate(auth_client, '/api/blog-posts', first)
+    assert again.status_code == 304
+    assert again.data == b''
+    assert again.headers['ETag'] == first.headers['ETag']
+
+    auth_client.put(f'/api/blog-posts/{post_id}', json={'title': 'Edited'})
+    edited = revalidate(auth_client, '/api/blog-posts', first)
+    assert edited.status_code == 200
+    assert edited.get_json()['items'][0]['title'] == 'Edited'
+
+
+def test_deleting_a_row_changes_the_list_etag(auth_client, blog_payload):
+    create_post(auth_client, blog_payload)
+    newest = create_post(auth_client, blog_payload, title='Second')
+    first = auth_client.get('/api/blog-posts')
+    # Deleting the oldest row leaves max(updated_at) as it was; the count still moves
+    auth_client.delete(f'/api/blog-posts/{newest - 1}')
+    assert revalidate(auth_client, '/api/blog-posts', first).status_code == 200
+
+
+def test_query_string_is_part_of_the_etag(auth_client, blog_payload):
+    create_post(auth_client, blog_payload)
+    full = auth_client.get('/api/blog-posts')
+    assert revalidate(auth_client, '/api/blog-posts', full, fields='title').status_code == 200
+    assert revalidate(auth_client, '/api/blog-posts', full, paginate='false').status_code == 200
+
+
+def test_detail_answers_etag_and_if_modified_since(auth_client, blog_payload):
+    post_id = create_post(auth_client, blog_payload)
+    url = f'/api/blog-posts/{post_id}'
+    first = auth_client.get(url)
+    assert first.status_code == 200
+    assert 'Last-Modified' in first.headers
+    assert revalidate(auth_client, url, first).status_code == 304
+
+    updated_at = db.session.get(BlogPost, post_id).updated_at
+    assert auth_client.get(url, headers={'If-Modified-Since': http_date(updated_at)}).status_code == 304
+
+
+def test_cached_routes_revalidate_from_the_cache(auth_client, blog_payload):
+    create_post(auth_client, blog_payload)
+    first = auth_client.get('/api/blog-posts/featured')
+    assert first.status_code == 200
+    assert revalidate(auth_client, '/api/blog-posts/featured', first).status_code == 304
+
+
+def test_missing_row_is_404(client):
+    assert client.get('/api/blog-posts/999', headers={'If-None-Match': '*'}).status_code == 404
@@ -0,0 +1,99 @@
+import pytest
+
+from app import create_app
+from app.config import (
+    DevelopmentConfig, ProductionConfig, TestingConfig, database_url, engine_options, env_flag, env_float, env_int,
+    get_config,
+)
+
+
+def test_get_config_by_name_and_app_env(monkeypatch):
+    monkeypatch.delenv('APP_ENV', raising=False)
+    assert get_config() is DevelopmentConfig
+    assert get_config('Testing') is TestingConfig
+    monkeypatch.setenv('APP_ENV', 'testing')
+    assert get_config() is TestingConfig
+    with pytest.raises(ValueError):
+        get_config('staging')
+
+
+def test_production_needs_a_secret_key(monkeypatch):
+    monkeypatch.delenv('SECRET_KEY', raising=False)
+    with pytest.raises(RuntimeError):
+        get_config('production')
+    monkeypatch.setenv('SECRET_KEY', 'x')
+    assert get_config('production') is ProductionConfig
+
+
+def test_env_helpers(monkeypatch):
+    monkeypatch.setenv('SOME_INT', '')
+    monkeypatch.setenv('SOME_FLAG', 'Off')
+    assert env_int('SOME_INT', 7) == 7
+    assert env_flag('SOME_FLAG', True) is False
+    assert env_flag('MISSING_FLAG', True) is True
+    monkeypatch.setenv('SOME_INT', '12')
+    monkeypatch.setenv('SOME_FLAG', 'yes')
+    assert env_int('SOME_INT', 7) == 12
+    assert env_flag('SOME_FLAG', False) is True
+    monkeypatch.setenv('SOME_FLOAT', '0.25')
+    assert env_float('SOME_FLOAT', 1.0) == 0.25
+    assert env_float('MISSING_FLOAT', 1.0) == 1.0
+
+
+def test_database_url(monkeypatch):
+    monkeypatch.delenv('DATABASE_URL', raising=False)
+    assert database_url('sqlite:///x.db') == 'sqlite:///x.db'
+    monkeypatch.setenv('DATABASE_URL', 'postgres://u:p@db/galvan')
+    assert database_url('sqlite:///x.db') == 'postgresql://u:p@db/galvan'
+
+
+def test_engine_options_per_database(monkeypatch):
+    monkeypatch.setenv('DB_POOL_SIZE', '3')
+    assert engine_options('sqlite://') == {}
+    assert engine_options('sqlite:///:memory:') == {}
+    sqlite = engine_options('sqlite:///galvan.db')
+    assert sqlite['pool_size'] == 3
+    assert 'connect_args' not in sqlite
+    postgres = engine_options('postgresql://db/galvan')
+    assert postgres['connect_args'] == {'options': '-c statement_timeout=15000'}
+    assert engine_options('mysql://db/galvan')['connect_args'] == {
+        'init_command': 'SET SESSION max_execution_time=15000'}
+    monkeypatch.setenv('DB_STATEMENT_TIMEOUT_MS', '0')
+    assert 'connect_args' not in engine_options('postgresql://db/galvan')
+
+
+def test_create_app_takes_a_config_class():
+    class CustomConfig(TestingConfig):
+        RATE_LIMIT_ENABLED = False
+    app = create_app(CustomConfig)
+    assert app.config['TESTING'] is True
+    assert app.config['RATE_LIMIT_ENABLED'] is False
+
+
+def test_shared_state_is_built_per_app_from_its_config():
+    from app.cache import MemoryBackend
+    from app.kvstore import MemoryStore, TableStore
+
+    class MemoryState(TestingConfig):
+        STATE_BACKEND = 'memory'
+        STATE_MEMORY_MAX_ENTRIES = 5
+        RESPONSE_CACHE_TTL = 42
+
+    class NoCache(TestingConfig):
+        RESPONSE_CACHE_BACKEND = 'none'
+        STATE_BACKEND = 'none'
+
+    first, second = create_app(TestingConfig), create_app(MemoryState)
+    assert isinstance(first.extensions['state_store'], TableStore)
+    assert isinstance(first.extensions['response_cache'].backend, MemoryBackend)
+    assert first.extensions['rate_limiter'] is not second.extensions['rate_limiter']
+    assert first.extensions['redis_client'] is None
+    assert isinstance(second.extensions['state_store'], MemoryStore)
+    assert second.extensions['state_store'].max_entries == 5
+    assert second.extensions['response_cache'].default_ttl == 42
+
+    app = create_app(NoCache)
+    assert app.extensions['response_cache'] is None
+    assert app.extensions['state_store'] is None
+    with app.app_context():
+        assert app.test_client().get('/api/careers/active').status_code == 200
@@ -0,0 +1,73 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+RESPONSES = [
+    {'questionId': 'q1', 'questionLabel': 'Why us?', 'answer': 'Because'},
+    {'questionId': 'q2', 'questionLabel': 'Skills', 'answer': ['python', 'sql']},
+]
+
+
+def csv_rows(response):
+    assert response.mimetype == 'text/csv'
+    return list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+
+
+def ndjson_rows(response):
+    assert response.mimetype == 'application/x-ndjson'
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_application_csv_spreads_resume_and_answers(auth_client, make_application):
+    make_application(resume={'fileUrl': 'https://example.com/cv.pdf', 'fileName': 'cv.pdf'}, responses=RESPONSES)
+    make_application(responses=[{'questionId': 'q3', 'answer': {'fileUrl': '/uploads/a.png'}}])
+    response = auth_client.get('/api/job-applications/export')
+    assert response.status_code == 200
+    assert response.headers['Content-Disposition'] == 'attachment; filename="job-applications.csv"'
+    assert response.headers['Cache-Control'] == 'no-store'
+    first, second = csv_rows(response)
+    assert first['resume_fileName'] == 'cv.pdf'
+    assert (first['response:q1'], first['response:q2'], first['response:q3']) == ('Because', 'python; sql', '')
+    assert second['response:q3'] == '/uploads/a.png'
+
+
+def test_ndjson_uses_the_csv_column_names(auth_client, make_application):
+    make_application(responses=RESPONSES)
+    (record,) = ndjson_rows(auth_client.get('/api/job-applications/export?format=ndjson'))
+    assert record['response:q1'] == 'Because'
+    assert record['resume_fileUrl'] is None
+    header = csv_rows(auth_client.get('/api/job-applications/export'))[0].keys()
+    assert set(record) == set(header)
+
+
+@pytest.mark.parametrize('value', ['=HYPERLINK("http://x")', '+1', '-1', '@SUM(A1)', '\tcmd'])
+def test_csv_cells_are_never_formulas(auth_client, make_quote, value):
+    make_quote(name=value)
+    (row,) = csv_rows(auth_client.get('/api/contact-quotes/export'))
+    assert row['name'] == "'" + value
+    # NDJSON is data, not a spreadsheet: values are exported as they are
+    assert ndjson_rows(auth_client.get('/api/contact-quotes/export?format=ndjson'))[0]['name'] == value
+
+
+def test_exports_filter_by_date_and_job(auth_client, make_application, make_quote):
+    make_quote(created_at=datetime(2026, 1, 1, 23, 0))
+    make_quote(created_at=datetime(2026, 1, 2, 9, 0))
+    rows = csv_rows(auth_client.get('/api/contact-quotes/export?from=2026-01-01&to=2026-01-01'))
+    assert [row['created_at'] for row in rows] == ['2026-01-01T23:00:00']
+    make_application(job_id='7', status='hired')
+    make_application(job_id='8', status='hired')
+    rows = ndjson_rows(auth_client.get('/api/job-applications/export?format=ndjson&jobId=7&status=hired'))
+    assert [row['job_id'] for row in rows] == ['7']
+
+
+@pytest.mark.parametrize('query', ['format=xml', 'from=yesterday', 'to=2026-13-01'])
+def test_bad_export_parameters_are_400(auth_client, query):
+    assert auth_client.get(f'/api/job-applications/export?{query}').status_code == 400
+    assert auth_client.get(f'/api/contact-quotes/export?{query}').status_code == 400
+
+
+def test_exports_need_a_login(client):
+    assert client.get('/api/contact-quotes/export').status_code == 302
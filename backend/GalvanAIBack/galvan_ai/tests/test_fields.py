@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.models.blog import BlogPost
+from app.models.serialization import FieldSelectionError
+
+
+@pytest.fixture
+def statements(app):
+    """SQL statements run while the test executes."""
+    seen = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        seen.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    yield seen
+    event.remove(db.engine, 'before_cursor_execute', record)
+
+
+def test_parse_fields_builds_a_selection_tree():
+    assert BlogPost.parse_fields(None) is None
+    assert BlogPost.parse_fields(' , ') is None
+    assert BlogPost.parse_fields('title, author.name') == {'title': True, 'author': {'name': True}}
+    # A whole group wins over one of its sub-keys, in either order
+    assert BlogPost.parse_fields('author.name,author') == {'author': True}
+    assert BlogPost.parse_fields('author,author.name') == {'author': True}
+
+
+@pytest.mark.parametrize('raw', ['nope', 'author.nope', 'title.length'])
+def test_unknown_fields_are_rejected(raw):
+    with pytest.raises(FieldSelectionError):
+        BlogPost.parse_fields(raw)
+
+
+def test_selected_columns_follow_the_spec():
+    assert BlogPost.selected_columns({'title': True, 'author': {'name': True}}) == {'title', 'author_name'}
+    assert BlogPost.selected_columns({'author': True}) == {'author_name', 'author_avatar', 'author_role', 'author_bio'}
+
+
+def test_list_returns_only_requested_keys(auth_client, blog_payload, statements):
+    auth_client.post('/api/blog-posts', json=blog_payload)
+    statements.clear()
+    response = auth_client.get('/api/blog-posts', query_string={'fields': 'title,author.name'})
+    assert response.status_code == 200
+    assert response.get_json()['items'] == [{'title': 'Scaling Flask', 'author': {'name': 'Ada'}}]
+    select = next(s for s in statements if s.lstrip().upper().startswith('SELECT') and 'blog_post.title' in s)
+    # The image columns are never read for a projection that does not include them
+    assert 'blog_post.image' not in select
+    assert 'blog_post.author_avatar' not in select
+
+
+def test_legacy_list_and_detail_honour_fields(auth_client, blog_payload):
+    post_id = auth_client.post('/api/blog-posts', json=blog_payload).get_json()['id']
+    listed = auth_client.get('/api/blog-posts', query_string={'fields': 'id,tags', 'paginate': 'false'})
+    assert listed.get_json() == [{'id': post_id, 'tags': ['flask', 'sqlite']}]
+    detail = auth_client.get(f'/api/blog-posts/{post_id}', query_string={'fields': 'author'})
+    assert detail.get_json() == {'author': blog_payload['author']}
+
+
+def test_unknown_field_is_a_400(client):
+    response = client.get('/api/blog-posts', query_string={'fields': 'title,secret'})
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Unknown field: secret'}
+    assert client.get('/api/blog-posts/1', query_string={'fields': 'secret'}).status_code == 400
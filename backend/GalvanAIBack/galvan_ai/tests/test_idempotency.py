@@ -0,0 +1,93 @@
+import pytest
+
+from app.models.contact_quote import ContactQuote
+
+QUOTE = {'name': 'Ada', 'email': 'ada@example.com', 'company': 'Engines Ltd', 'projectDetails': 'A difference engine'}
+CACHE_KEY = 'idemp:/api/contact-quotes:{}'
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limits(app):
+    app.config['RATE_LIMIT_ENABLED'] = False
+
+
+def submit(client, key, body=QUOTE):
+    headers = {'Idempotency-Key': key} if key else {}
+    return client.post('/api/contact-quotes', json=body, headers=headers)
+
+
+def test_missing_key_is_rejected(client):
+    response = submit(client, None)
+    assert response.status_code == 409
+    assert ContactQuote.query.count() == 0
+
+
+def test_retry_replays_the_first_response(client):
+    first = submit(client, 'k1')
+    retry = submit(client, 'k1')
+    assert first.status_code == retry.status_code == 200
+    assert 'Idempotent-Replayed' not in first.headers
+    assert retry.headers['Idempotent-Replayed'] == 'true'
+    assert retry.get_json() == first.get_json()
+    assert retry.mimetype == 'application/json'
+    assert ContactQuote.query.count() == 1
+
+
+def test_different_keys_run_separately(client):
+    submit(client, 'k1')
+    submit(client, 'k2')
+    assert ContactQuote.query.count() == 2
+
+
+def test_client_errors_are_replayed_too(client):
+    first = submit(client, 'bad', {'name': 'No email'})
+    retry = submit(client, 'bad', QUOTE)
+    assert first.status_code == retry.status_code == 400
+    assert retry.headers['Idempotent-Replayed'] == 'true'
+    assert ContactQuote.query.count() == 0
+
+
+def test_in_flight_duplicate_gets_409_with_retry_after(app, client):
+    app.config['IDEMPOTENCY_WAIT_SECONDS'] = 0
+    app.extensions['state_store'].set(CACHE_KEY.format('busy'), b'pending', ex=60)
+    response = submit(client, 'busy')
+    assert response.status_code == 409
+    assert response.headers['Retry-After'] == '1'
+    assert ContactQuote.query.count() == 0
+
+
+def test_unreadable_record_is_500_without_running_the_handler(app, client):
+    app.extensions['state_store'].set(CACHE_KEY.format('corrupt'), b'no header line', ex=60)
+    response = submit(client, 'corrupt')
+    assert response.status_code == 500
+    assert ContactQuote.query.count() == 0
+
+
+def test_server_error_releases_the_key(app, client, monkeypatch):
+    def fail(data):
+        raise RuntimeError('database is down')
+    monkeypatch.setattr(ContactQuote, 'from_dict', staticmethod(fail))
+    assert submit(client, 'k1').status_code == 500
+    assert app.extensions['state_store'].get(CACHE_KEY.format('k1')) is None
+
+    monkeypatch.undo()
+    retry = submit(client, 'k1')
+    assert retry.status_code == 200
+    assert 'Idempotent-Replayed' not in retry.headers
+    assert ContactQuote.query.count() == 1
+
+
+def test_key_released_while_waiting_is_taken_over(app, client, monkeypatch):
+    store = app.extensions['state_store']
+    store.set(CACHE_KEY.format('freed'), b'pending', ex=60)
+    original_get = store.get
+
+    def get(key):
+        # The original fails and releases the key while the duplicate waits
+        store.delete(key)
+        return original_get(key)
+    monkeypatch.setattr(store, 'get', get)
+    response = submit(client, 'freed')
+    assert response.status_code == 200
+    assert 'Idempotent-Replayed' not in response.headers
+    assert ContactQuote.query.count() == 1
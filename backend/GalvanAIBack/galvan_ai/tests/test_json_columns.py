@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import StatementError
+
+from app import db
+from app.json_provider import RawJSON
+from app.models.blog import BlogPost
+from app.models.serialization import json_list, json_value
+
+
+def stored(post_id, column):
+    return db.session.execute(text(f'SELECT {column} FROM blog_post WHERE id = :id'), {'id': post_id}).scalar()
+
+
+def create_post(client, payload, **changes):
+    return client.post('/api/blog-posts', json=dict(payload, **changes)).get_json()['id']
+
+
+def test_lists_are_stored_as_json_and_loaded_as_text(auth_client, blog_payload):
+    post_id = create_post(auth_client, blog_payload)
+    assert stored(post_id, 'tags') == '["flask", "sqlite"]'
+    db.session.expire_all()
+    post = db.session.get(BlogPost, post_id)
+    # Not decoded on load; the serializer embeds the text as it is
+    assert post.tags == '["flask", "sqlite"]'
+    assert isinstance(post.to_dict({'tags': True})['tags'], RawJSON)
+    assert auth_client.get(f'/api/blog-posts/{post_id}').get_json()['tags'] == ['flask', 'sqlite']
+
+
+def test_strings_must_already_be_valid_json(auth_client, blog_payload):
+    post_id = create_post(auth_client, blog_payload)
+    post = db.session.get(BlogPost, post_id)
+    post.tags = '["unterminated"'
+    with pytest.raises(StatementError):
+        db.session.commit()
+    db.session.rollback()
+
+    post.tags = ['x', {'nested': True}]
+    db.session.commit()
+    assert stored(post_id, 'tags') == '["x", {"nested": true}]'
+
+
+@pytest.mark.parametrize('value', [[float('nan')], '[NaN]', '[Infinity]'])
+def test_non_finite_numbers_are_rejected(auth_client, blog_payload, value):
+    post = db.session.get(BlogPost, create_post(auth_client, blog_payload))
+    post.key_concepts = value
+    with pytest.raises(StatementError):
+        db.session.commit()
+    db.session.rollback()
+
+
+def test_json_path_filters_run_in_sql(auth_client, blog_payload):
+    create_post(auth_client, blog_payload)
+    create_post(auth_client, blog_payload, tags=['django'])
+    rows = BlogPost.query.filter(BlogPost.tags[0].as_string() == 'django').with_entities(BlogPost.tags).all()
+    assert rows == [('["django"]',)]
+
+
+def test_empty_and_null_columns_serialize_as_empty():
+    assert json_list(None) == []
+    assert json_list('') == []
+    assert json_value(None) is None
+    assert json_value('') is None
+    assert json_list([1]) == [1]
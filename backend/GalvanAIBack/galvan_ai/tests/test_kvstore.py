@@ -0,0 +1,154 @@
+import pytest
+
+from app import db
+from app import kvstore
+from app.kvstore import MemoryStore, TableStore, _Store, build_state_store
+
+
+class Clock:
+    """Stands in for the time module inside app.kvstore."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(kvstore, 'time', clock)
+    return clock
+
+
+@pytest.fixture(params=['memory', 'table'])
+def store(request, app):
+    return MemoryStore(max_entries=100) if request.param == 'memory' else TableStore(db.engine)
+
+
+def test_values_come_back_as_bytes(store):
+    assert store.get('missing') is None
+    assert store.set('k', 'value') is True
+    assert store.get('k') == b'value'
+    store.set('n', 12)
+    assert store.mget(['k', 'n', 'missing']) == [b'value', b'12', None]
+
+
+def test_set_nx_only_writes_a_missing_key(store):
+    assert store.set('k', 'first', nx=True) is True
+    assert store.set('k', 'second', nx=True) is None
+    assert store.get('k') == b'first'
+
+
+def test_set_nx_replaces_an_expired_key(store, clock):
+    store.set('k', 'old', ex=10)
+    clock.now += 11
+    assert store.set('k', 'new', nx=True, ex=10) is True
+    assert store.get('k') == b'new'
+
+
+def test_setex_expires(store, clock):
+    store.setex('k', 5, 'v')
+    clock.now += 4
+    assert store.get('k') == b'v'
+    clock.now += 2
+    assert store.get('k') is None
+
+
+def test_incr_and_expire(store, clock):
+    assert [store.incr('c') for _ in range(3)] == [1, 2, 3]
+    assert store.expire('c', 10) is True
+    assert store.expire('missing', 10) is False
+    clock.now += 11
+    # An expired counter starts again without its old TTL
+    assert store.incr('c') == 1
+    clock.now += 100
+    assert store.get('c') == b'1'
+
+
+def test_delete(store):
+    store.set('a', 1)
+    store.set('b', 2)
+    assert store.delete('a', 'b', 'c') == 2
+    assert store.mget(['a', 'b']) == [None, None]
+
+
+def test_pipeline_runs_as_one_batch(store):
+    pipe = store.pipeline()
+    pipe.incr('c').expire('c', 60).setex('s', 60, 'x').delete('nothing')
+    assert pipe.execute() == [1, True, True, 0]
+    assert pipe.execute() == []
+    assert store.mget(['c', 's']) == [b'1', b'x']
+
+
+def test_memory_store_evicts_least_recently_used():
+    store = MemoryStore(max_entries=3)
+    for key in 'abc':
+        store.set(key, key)
+    store.get('a')
+    store.set('d', 'd')
+    assert store.mget(['a', 'b', 'c', 'd']) == [b'a', None, b'c', b'd']
+
+
+def test_memory_store_drops_expired_entries_before_live_ones(clock):
+    store = MemoryStore(max_entries=2)
+    store.set('live', 1)
+    store.set('short', 2, ex=1)
+    clock.now += 2
+    store.set('new', 3)
+    assert store.mget(['live', 'new']) == [b'1', b'3']
+
+
+def test_memory_store_eviction_skips_outdated_expiries(clock):
+    store = MemoryStore(max_entries=2)
+    store.set('rewritten', 1, ex=1)
+    store.set('rewritten', 2)  # no TTL any more
+    store.set('extended', 3, ex=1)
+    store.expire('extended', 100)
+    clock.now += 2
+    store.set('new', 4)
+    # Neither key's first expiry applies, so the least recently used one goes
+    assert store.mget(['rewritten', 'extended', 'new']) == [None, b'3', b'4']
+
+
+def test_memory_store_expiry_heap_stays_bounded():
+    store = MemoryStore(max_entries=10)
+    for n in range(1000):
+        store.set('same', n, ex=60)
+    assert len(store._expiries) <= 2 * store.max_entries
+    assert store.get('same') == b'999'
+
+
+def test_stores_must_implement_run_batch():
+    class Incomplete(_Store):
+        pass
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_table_store_sweeps_expired_rows(app, clock, monkeypatch):
+    monkeypatch.setattr(TableStore, 'SWEEP_EVERY', 3)
+    store = TableStore(db.engine)
+    store.setex('old', 1, 'x')
+    clock.now += 2
+    store.set('a', 1)
+    store.set('b', 2)
+    rows = db.session.execute(db.select(kvstore.state_table.c.key)).scalars().all()
+    assert sorted(rows) == ['a', 'b']
+
+
+def test_table_store_is_shared_across_instances(app):
+    TableStore(db.engine).set('k', 'v')
+    assert TableStore(db.engine).get('k') == b'v'
+
+
+def test_build_state_store():
+    assert build_state_store('none') is None
+    assert isinstance(build_state_store(None), TableStore)
+    assert isinstance(build_state_store('memory', max_entries=5), MemoryStore)
+    # Asking for Redis without a client falls back to the table
+    assert isinstance(build_state_store('redis'), TableStore)
@@ -0,0 +1,58 @@
+import pytest
+
+from app import create_app
+from app.config import TestingConfig
+
+prometheus_client = pytest.importorskip('prometheus_client')
+
+
+def metrics_app(**settings):
+    config = type('MetricsConfig', (TestingConfig,), settings)
+    return create_app(config)
+
+
+def sample(name, **labels):
+    return prometheus_client.REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_metrics_are_off_without_a_token_or_public_flag(app):
+    assert 'metrics' not in app.view_functions
+
+
+def test_token_is_required_when_set():
+    client = metrics_app(METRICS_TOKEN='s3cret').test_client()
+    assert client.get('/metrics').status_code == 401
+    assert client.get('/metrics', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+    response = client.get('/metrics', headers={'Authorization': 'Bearer s3cret'})
+    assert response.status_code == 200
+    assert b'http_requests_total' in response.data
+
+
+def test_token_is_checked_even_when_public():
+    client = metrics_app(METRICS_TOKEN='s3cret', METRICS_PUBLIC=True).test_client()
+    assert client.get('/metrics').status_code == 401
+
+
+def test_requests_and_queries_are_counted_per_endpoint():
+    app = metrics_app(METRICS_PUBLIC=True)
+    client = app.test_client()
+    labels = {'method': 'GET', 'endpoint': 'api.get_blog_posts'}
+    before = sample('http_requests_total', status='200', **labels)
+    queries_before = sample('http_request_db_queries_sum', endpoint='api.get_blog_posts')
+    client.get('/api/blog-posts')
+    client.get('/api/blog-posts')
+    assert sample('http_requests_total', status='200', **labels) == before + 2
+    assert sample('http_request_duration_seconds_count', **labels) >= 2
+    # The ETag aggregate and the page query, on each request
+    assert sample('http_request_db_queries_sum', endpoint='api.get_blog_posts') >= queries_before + 4
+    assert sample('http_requests_in_progress', method='GET') == 0
+
+
+def test_unmatched_urls_share_one_label():
+    client = metrics_app(METRICS_PUBLIC=True).test_client()
+    # Anonymous requests for unknown URLs are sent to the login page
+    labels = {'method': 'GET', 'endpoint': '<unmatched>', 'status': '302'}
+    before = sample('http_requests_total', **labels)
+    client.get('/api/does-not-exist/1')
+    client.get('/api/does-not-exist/2')
+    assert sample('http_requests_total', **labels) == before + 2
@@ -0,0 +1,99 @@
+import os
+import shutil
+import sqlite3
+
+import pytest
+from sqlalchemy import inspect
+
+from app import create_app, db
+from app.config import TestingConfig
+from app.migrations import Migrator, load_migrations
+
+# The database as it was before versioned migrations, tracked in the repo; tests use copies
+BASELINE_DB = os.path.join(os.path.dirname(__file__), os.pardir, 'instance', 'galvan_ai.db')
+REVISIONS = [m.revision for m in load_migrations()]
+
+
+def file_app(tmp_path, db_path, auto_migrate=False):
+    class FileConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        SQLALCHEMY_ENGINE_OPTIONS = {}
+        AUTO_MIGRATE = auto_migrate
+        BLOB_STORE_PATH = str(tmp_path / 'blobs')
+    return create_app(FileConfig)
+
+
+def row_counts(path):
+    with sqlite3.connect(path) as conn:
+        tables = [name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        return {table: conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0] for table in tables}
+
+
+@pytest.fixture
+def baseline_copy(tmp_path):
+    path = tmp_path / 'baseline.db'
+    shutil.copyfile(BASELINE_DB, path)
+    return path
+
+
+def test_revisions_are_ordered_and_unique():
+    assert REVISIONS == sorted(set(REVISIONS))
+    assert REVISIONS[:8] == [f'{n:04d}' for n in range(1, 9)]
+
+
+def test_upgrade_fresh_database(tmp_path):
+    app = file_app(tmp_path, tmp_path / 'fresh.db')
+    with app.app_context():
+        migrator = Migrator(db.engine, log=lambda message: None)
+        assert [m.revision for m in migrator.pending()] == REVISIONS
+        assert migrator.upgrade() == REVISIONS
+        assert migrator.pending() == []
+        assert migrator.current() == REVISIONS[-1]
+        # Re-running is a no-op
+        assert migrator.upgrade() == []
+        tables = set(inspect(db.engine).get_table_names())
+        assert {'career', 'job_applications', 'kv_store', 'schema_migrations'} <= tables
+
+
+def test_downgrade_to_base_and_back(tmp_path):
+    app = file_app(tmp_path, tmp_path / 'fresh.db')
+    with app.app_context():
+        migrator = Migrator(db.engine, log=lambda message: None)
+        migrator.upgrade()
+        assert migrator.downgrade('0004') == REVISIONS[:3:-1]
+        assert migrator.current() == '0004'
+        assert 'kv_store' not in inspect(db.engine).get_table_names()
+        assert migrator.downgrade('base') == REVISIONS[3::-1]
+        assert set(inspect(db.engine).get_table_names()) <= {'schema_migrations'}
+        assert migrator.upgrade() == REVISIONS
+
+
+def test_upgrade_baseline_database_keeps_every_row(tmp_path, baseline_copy):
+    before = row_counts(baseline_copy)
+    app = file_app(tmp_path, baseline_copy)
+    with app.app_context():
+        migrator = Migrator(db.engine, log=lambda message: None)
+        assert migrator.upgrade() == REVISIONS
+        columns = {c['name'] for c in inspect(db.engine).get_columns('job_applications')}
+        assert {'status', 'notes', 'updated_at'} <= columns
+        team_columns = {c['name'] for c in inspect(db.engine).get_columns('team')}
+        assert {'background', 'interests'} <= team_columns
+        db.engine.dispose()
+    after = row_counts(baseline_copy)
+    for table, count in before.items():
+        assert after[table] == count, table
+
+
+def test_app_serves_a_migrated_baseline_database(tmp_path, baseline_copy):
+    before = row_counts(baseline_copy)
+    app = file_app(tmp_path, baseline_copy, auto_migrate=True)
+    client = app.test_client()
+    with app.app_context():
+        assert Migrator(db.engine).pending() == []
+    projects = client.get('/api/projects', query_string={'paginate': 'false'})
+    assert projects.status_code == 200
+    assert len(projects.get_json()) == before['project']
+    careers = client.get('/api/careers', query_string={'limit': 100})
+    assert len(careers.get_json()['items']) == before['career']
+    search = client.get('/api/search', query_string={'q': 'a'})
+    assert search.status_code == 200
@@ -0,0 +1,105 @@
+from datetime import datetime
+
+import pytest
+
+from sqlalchemy import update
+
+from app import db
+from app.models.career import Career
+from app.pagination import (
+    MAX_PAGE_SIZE, PaginationError, decode_cursor, decode_offset_cursor, encode_cursor, encode_offset_cursor,
+)
+
+
+def add_careers(created_at_values):
+    for n, created_at in enumerate(created_at_values):
+        db.session.add(Career(
+            title=f'Career {n}', company='Galvan AI', location='Remote', type='Full-time',
+            department='Engineering', description='Synthetic career', created_at=created_at,
+        ))
+    db.session.commit()
+    # The column default fills in None on insert; legacy rows really have NULLs
+    db.session.execute(update(Career).where(Career.id.in_(
+        [n + 1 for n, created_at in enumerate(created_at_values) if created_at is None]
+    )).values(created_at=None))
+    db.session.commit()
+
+
+def walk(client, limit, **params):
+    """Follow next_cursor to the end; returns the ids of every page."""
+    pages, cursor = [], None
+    while True:
+        query = dict(params, limit=limit, **({'cursor': cursor} if cursor else {}))
+        response = client.get('/api/careers', query_string=query)
+        assert response.status_code == 200
+        body = response.get_json()
+        pages.append([item['id'] for item in body['items']])
+        cursor = body['next_cursor']
+        if cursor is None:
+            return pages
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 3, 1, 12, 30, 15, 123456)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+    assert decode_cursor(encode_cursor(None, 7)) == (None, 7)
+    assert decode_offset_cursor(encode_offset_cursor(60)) == 60
+
+
+@pytest.mark.parametrize('cursor', ['', 'not-base64!', encode_offset_cursor(5), 'WyIyMDI2LTAxLTAxIiwgIngiXQ'])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(PaginationError):
+        decode_cursor(cursor)
+
+
+def test_pages_cover_every_row_once_in_order(client):
+    add_careers([datetime(2026, 1, day) for day in range(1, 8)])
+    pages = walk(client, 3)
+    assert [len(page) for page in pages] == [3, 3, 1]
+    ids = [i for page in pages for i in page]
+    assert ids == [7, 6, 5, 4, 3, 2, 1]
+
+
+def test_equal_timestamps_are_split_by_id(client):
+    same = datetime(2026, 1, 1)
+    add_careers([same] * 5)
+    ids = [i for page in walk(client, 2) for i in page]
+    assert ids == [5, 4, 3, 2, 1]
+
+
+def test_rows_without_timestamp_come_last(client):
+    add_careers([datetime(2026, 1, 1), None, datetime(2026, 1, 2), None])
+    ids = [i for page in walk(client, 1) for i in page]
+    assert ids == [3, 1, 4, 2]
+
+
+def test_exact_multiple_of_limit_has_no_empty_last_page(client):
+    add_careers([datetime(2026, 1, day) for day in range(1, 5)])
+    pages = walk(client, 2)
+    assert pages == [[4, 3], [2, 1]]
+
+
+def test_empty_collection(client):
+    response = client.get('/api/careers')
+    assert response.get_json() == {'items': [], 'next_cursor': None}
+
+
+def test_limit_is_capped(client):
+    add_careers([datetime(2026, 1, 1)] * (MAX_PAGE_SIZE + 5))
+    body = client.get('/api/careers', query_string={'limit': MAX_PAGE_SIZE * 10}).get_json()
+    assert len(body['items']) == MAX_PAGE_SIZE
+    assert body['next_cursor'] is not None
+
+
+@pytest.mark.parametrize('params', [{'limit': '0'}, {'limit': '-3'}, {'limit': 'ten'}, {'cursor': 'garbage'}])
+def test_bad_parameters_are_400(client, params):
+    response = client.get('/api/careers', query_string=params)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_paginate_false_returns_the_legacy_list(client):
+    add_careers([datetime(2026, 1, day) for day in range(1, 4)])
+    body = client.get('/api/careers', query_string={'paginate': 'false'}).get_json()
+    assert isinstance(body, list)
+    assert len(body) == 3
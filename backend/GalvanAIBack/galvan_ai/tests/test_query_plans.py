@@ -0,0 +1,22 @@
+import pytest
+
+from app import db
+from check_query_plans import explain, plan_issue, route_queries
+
+
+def test_plan_issue():
+    assert plan_issue(['SEARCH t USING INDEX ix (a=?)']) is None
+    assert plan_issue(['SCAN t USING INDEX ix']) is None
+    assert plan_issue(['SCAN t']) == 'scan'
+    assert plan_issue(['SEARCH t USING INDEX ix (a=?)', 'USE TEMP B-TREE FOR ORDER BY']) == 'sort'
+
+
+def test_list_routes_read_an_index_in_order(app):
+    if db.engine.dialect.name != 'sqlite':
+        pytest.skip('EXPLAIN QUERY PLAN is SQLite only')
+    failures = {}
+    for label, query in route_queries():
+        plan = explain(query)
+        if plan_issue(plan):
+            failures[label] = '; '.join(plan)
+    assert failures == {}
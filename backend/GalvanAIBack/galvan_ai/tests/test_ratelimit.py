@@ -0,0 +1,194 @@
+import uuid
+
+import pytest
+
+from app import create_app
+from app.config import TestingConfig
+from app.ratelimit import (
+    TOKEN_BUCKET_SHA, MemoryBuckets, RateLimiter, RateLimitError, check_rate_limits, parse_rate,
+)
+from app.redis_client import LazyRedis
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('5/minute', (5, 60)),
+    ('3/hour', (3, 3600)),
+    ('10/seconds', (10, 1)),
+    ('100/10minute', (100, 600)),
+    (' 2/Day ', (2, 86400)),
+    ('', None),
+    (None, None),
+])
+def test_parse_rate(text, expected):
+    assert parse_rate(text) == expected
+
+
+@pytest.mark.parametrize('text', ['5', '5/fortnight', 'five/minute', '0/minute', '5/minute/hour'])
+def test_parse_rate_rejects(text):
+    with pytest.raises(RateLimitError):
+        parse_rate(text)
+
+
+def test_check_rate_limits_names_the_bad_entry():
+    with pytest.raises(RateLimitError, match=r"RATE_LIMITS\['contact'\]\['email'\]"):
+        check_rate_limits({'contact': {'ip': '5/minute', 'email': 'lots'}})
+
+
+def test_bad_limit_fails_app_creation():
+    class BadLimits(TestingConfig):
+        RATE_LIMITS = {'contact': {'ip': '5/fortnight'}}
+    with pytest.raises(RateLimitError):
+        create_app(BadLimits)
+
+
+def per_period(count, period_ms=1024):
+    """A bucket of count tokens refilling count per period_ms, as (capacity, refill per ms).
+
+    The default period keeps the refill rate exact in binary floating point.
+    """
+    return count, count / period_ms
+
+
+def test_bucket_refills_over_time():
+    buckets = MemoryBuckets()
+    limits = [('b', *per_period(2))]
+    assert buckets.take(0, limits) == 0
+    assert buckets.take(0, limits) == 0
+    assert buckets.take(0, limits) == 512
+    assert buckets.take(511, limits) == 1
+    assert buckets.take(512, limits) == 0
+    # A long idle period refills only up to capacity
+    assert [buckets.take(60_000, limits) for _ in range(3)] == [0, 0, 512]
+
+
+def test_refused_request_takes_no_tokens():
+    buckets = MemoryBuckets()
+    roomy, tight = ('roomy', *per_period(8)), ('tight', *per_period(1))
+    assert buckets.take(0, [roomy, tight]) == 0
+    for _ in range(5):
+        assert buckets.take(0, [roomy, tight]) == 1024
+    # roomy only lost the single token of the allowed request
+    assert [buckets.take(0, [roomy]) for _ in range(8)] == [0] * 7 + [128]
+
+
+def test_memory_buckets_stay_bounded():
+    buckets = MemoryBuckets(max_entries=2)
+    for key in 'abc':
+        buckets.take(0, [(key, *per_period(1))])
+    assert list(buckets._buckets) == ['b', 'c']
+
+
+def test_limiter_without_redis_answers_in_seconds():
+    limiter = RateLimiter(None)
+    limits = [('ip:1', (1, 60))]
+    assert limiter.hit(limits) == 0
+    assert 59 <= limiter.hit(limits) <= 60
+    assert limiter.hit([]) == 0
+
+
+@pytest.fixture
+def fake_redis():
+    fakeredis = pytest.importorskip('fakeredis')
+    pytest.importorskip('lupa')
+    client = LazyRedis('localhost')
+    client._client = fakeredis.FakeRedis()
+    return client
+
+
+def test_lua_script_matches_memory_buckets(fake_redis, monkeypatch):
+    limiter = RateLimiter(fake_redis)
+    local = MemoryBuckets()
+    clock = {'now': 1_000.0}
+    monkeypatch.setattr('app.ratelimit.time.time', lambda: clock['now'])
+    limits = [('ip:1', (3, 60)), ('global', (5, 60))]
+    for step in (0, 0, 0, 0, 15, 20, 20, 60):
+        clock['now'] += step
+        now_ms = int(clock['now'] * 1000)
+        buckets = [(f'rl:{key}', count, count / (seconds * 1000.0)) for key, (count, seconds) in limits]
+        expected = local.take(now_ms, buckets)
+        assert limiter.hit(limits) == (-(-expected // 1000) if expected else 0)
+    assert fake_redis.call('pttl', 'rl:ip:1') > 0
+
+
+def test_script_is_loaded_once_then_run_by_sha(fake_redis):
+    limiter = RateLimiter(fake_redis)
+    fake_redis.call('script_flush')
+    assert limiter.hit([('ip:1', (2, 60))]) == 0
+    assert fake_redis.call('script_exists', TOKEN_BUCKET_SHA) == [True]
+    assert limiter.hit([('ip:1', (2, 60))]) == 0
+    assert limiter.hit([('ip:1', (2, 60))]) > 0
+
+
+def test_open_breaker_falls_back_to_local_buckets(fake_redis, monkeypatch):
+    limiter = RateLimiter(fake_redis)
+    monkeypatch.setattr(LazyRedis, 'available', property(lambda self: False))
+    assert limiter.hit([('ip:1', (1, 60))]) == 0
+    assert limiter.hit([('ip:1', (1, 60))]) > 0
+    assert fake_redis._client.keys('rl:*') == []
+
+
+def quote(email=None):
+    return {'name': 'Ada', 'email': email or f'{uuid.uuid4().hex[:8]}@example.com',
+            'company': 'Engines Ltd', 'projectDetails': 'A difference engine'}
+
+
+def submit(client, body, **headers):
+    return client.post('/api/contact-quotes', json=body, headers=dict(headers, **{'Idempotency-Key': uuid.uuid4().hex}))
+
+
+def test_per_email_limit_returns_429_with_retry_after(client):
+    # contact: 3/hour per email
+    statuses = [submit(client, quote('same@example.com')).status_code for _ in range(3)]
+    assert statuses == [200, 200, 200]
+    response = submit(client, quote('SAME@example.com '))
+    assert response.status_code == 429
+    assert 0 < int(response.headers['Retry-After']) <= 1200
+    assert 'error' in response.get_json()
+
+
+def test_per_ip_limit_ignores_spoofed_forwarded_for(client):
+    # contact: 5/minute per IP; X-Forwarded-For is not trusted by default
+    statuses = [
+        submit(client, quote(), **{'X-Forwarded-For': f'10.0.0.{n}'}).status_code
+        for n in range(6)
+    ]
+    assert statuses == [200] * 5 + [429]
+
+
+def test_trusted_proxy_hop_gives_the_client_address(app):
+    class BehindProxy(TestingConfig):
+        TRUSTED_PROXY_HOPS = 1
+    client = create_app(BehindProxy).test_client()
+    for n in range(5):
+        assert submit(client, quote(), **{'X-Forwarded-For': f'6.6.6.6, 10.0.0.{n}'}).status_code == 200
+    # Only the hop our proxy appended counts: a sixth request from a new address passes
+    assert submit(client, quote(), **{'X-Forwarded-For': '6.6.6.6, 10.0.0.9'}).status_code == 200
+    limited = [submit(client, quote(), **{'X-Forwarded-For': '1.1.1.1, 10.0.0.9'}).status_code for _ in range(5)]
+    assert limited == [200] * 4 + [429]
+
+
+def test_forwarded_clients_get_separate_buckets(app):
+    # As the Next.js routes forward it: one X-Forwarded-For hop holding the visitor's address
+    class BehindNextJs(TestingConfig):
+        TRUSTED_PROXY_HOPS = 1
+    client = create_app(BehindNextJs).test_client()
+    statuses = [submit(client, quote(), **{'X-Forwarded-For': '203.0.113.7'}).status_code for _ in range(6)]
+    assert statuses == [200] * 5 + [429]
+    assert submit(client, quote(), **{'X-Forwarded-For': '198.51.100.4'}).status_code == 200
+
+
+def test_limits_can_be_switched_off(app, client):
+    app.config['RATE_LIMIT_ENABLED'] = False
+    assert all(submit(client, quote('same@example.com')).status_code == 200 for _ in range(6))
+
+
+def test_throttled_request_can_retry_with_the_same_key(app, client):
+    for _ in range(3):
+        submit(client, quote('same@example.com'))
+    headers = {'Idempotency-Key': 'retry-me'}
+    assert client.post('/api/contact-quotes', json=quote('same@example.com'), headers=headers).status_code == 429
+    # The 429 released the key, so once there is room the retry runs rather than replays
+    app.extensions['rate_limiter'].local = MemoryBuckets()
+    response = client.post('/api/contact-quotes', json=quote('same@example.com'), headers=headers)
+    assert response.status_code == 200
+    assert 'Idempotent-Replayed' not in response.headers
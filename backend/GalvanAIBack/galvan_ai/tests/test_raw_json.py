@@ -0,0 +1,40 @@
+import json
+
+import pytest
+from flask import Flask, jsonify
+
+from app.json_provider import _MARKER, FastJSONProvider, RawJSON, orjson
+
+ENCODERS = ['stdlib', pytest.param('orjson', marks=pytest.mark.skipif(orjson is None, reason='orjson is not installed'))]
+
+
+@pytest.fixture(params=ENCODERS)
+def json_app(request):
+    app = Flask(__name__)
+    app.config['JSON_ENCODER'] = request.param
+    app.json = FastJSONProvider(app)
+    with app.app_context():
+        yield app
+
+
+def test_fragments_are_spliced_verbatim(json_app):
+    body = jsonify({'items': [{'tags': RawJSON('["a", "b"]')}, {'tags': RawJSON('[]')}], 'meta': RawJSON('{"x":1}')})
+    # The stored text (with its spacing) appears as-is, not re-encoded
+    assert body.get_data() == b'{"items":[{"tags":["a", "b"]},{"tags":[]}],"meta":{"x":1}}\n'
+
+
+def test_dumps_splices_too(json_app):
+    assert json.loads(json_app.json.dumps([RawJSON('{"a": [1]}'), 2])) == [{'a': [1]}, 2]
+
+
+def test_payload_containing_the_marker_is_still_exact(json_app):
+    # User data that happens to contain the marker must not be mistaken for a fragment
+    value = {'text': f'{_MARKER}0', 'tags': RawJSON('["a"]')}
+    assert json.loads(json_app.json.dumps(value)) == {'text': f'{_MARKER}0', 'tags': ['a']}
+    assert jsonify(value).get_json() == {'text': f'{_MARKER}0', 'tags': ['a']}
+
+
+def test_stored_lists_reach_responses(auth_client, blog_payload):
+    post_id = auth_client.post('/api/blog-posts', json=blog_payload).get_json()['id']
+    body = auth_client.get(f'/api/blog-posts/{post_id}', query_string={'fields': 'tags,keyConcepts'})
+    assert body.get_data() == b'{"keyConcepts":["caching"],"tags":["flask", "sqlite"]}\n'
@@ -0,0 +1,191 @@
+import threading
+
+import pytest
+
+from app import redis_client
+from app.kvstore import TableStore, build_state_store
+from app.redis_client import Failover, LazyRedis, RedisUnavailable, redis
+
+pytestmark = pytest.mark.skipif(redis is None, reason='redis-py is not installed')
+
+
+class Clock:
+    """Stands in for the time module inside app.redis_client; sleep() only moves the clock."""
+
+    def __init__(self, now=1_000.0):
+        self.now = now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeRedis:
+    """The few redis-py calls the tests make, with an outage switch."""
+
+    def __init__(self):
+        self.down = False
+        self.data = {}
+        self.calls = 0
+        self.ping_errors = []
+
+    def _check(self):
+        self.calls += 1
+        if self.down:
+            raise redis.ConnectionError('connection refused')
+
+    def ping(self):
+        if self.ping_errors:
+            raise self.ping_errors.pop(0)
+        self._check()
+        return True
+
+    def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        self._check()
+        self.data[key] = value
+        return True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(redis_client, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def client(clock, monkeypatch):
+    # The transitions are driven by hand; no background probe
+    monkeypatch.setattr(LazyRedis, '_run_probe', lambda self: None)
+    client = LazyRedis('localhost', failure_threshold=3, cooldown=15)
+    client._client = FakeRedis()
+    return client
+
+
+def trip(client):
+    client._client.down = True
+    for _ in range(client.failure_threshold):
+        with pytest.raises(redis.ConnectionError):
+            client.call('get', 'k')
+
+
+def test_breaker_opens_after_consecutive_failures(client):
+    client._client.down = True
+    for _ in range(2):
+        with pytest.raises(redis.ConnectionError):
+            client.call('get', 'k')
+    assert client.available
+    with pytest.raises(redis.ConnectionError):
+        client.call('get', 'k')
+    assert not client.available
+    with pytest.raises(RedisUnavailable):
+        client.call('get', 'k')
+    assert client._client.calls == 3
+
+
+def test_half_open_trial_closes_the_breaker(client, clock):
+    recovered = []
+    client.on_recover(lambda: recovered.append(True))
+    trip(client)
+    clock.now += 15
+    assert client.available
+
+    # A failed trial opens the breaker for another cooldown
+    with pytest.raises(redis.ConnectionError):
+        client.call('get', 'k')
+    assert not client.available
+    clock.now += 14
+    with pytest.raises(RedisUnavailable):
+        client.call('get', 'k')
+
+    clock.now += 1
+    client._client.down = False
+    client._client.data['k'] = b'v'
+    assert client.call('get', 'k') == b'v'
+    assert client.available
+    assert recovered == [True]
+    assert client._failures == 0
+
+
+def test_half_open_lets_exactly_one_trial_through(client, clock):
+    trip(client)
+    clock.now += 15
+    started, release = threading.Event(), threading.Event()
+    results = []
+
+    def slow_get(key):
+        started.set()
+        release.wait(5)
+        return b'v'
+    client._client.down = False
+    client._client.get = slow_get
+
+    trial = threading.Thread(target=lambda: results.append(client.call('get', 'k')))
+    trial.start()
+    assert started.wait(5)
+    assert not client.available
+    with pytest.raises(RedisUnavailable):
+        client.call('get', 'k')
+    release.set()
+    trial.join(5)
+    assert results == [b'v']
+    assert client.available
+
+
+def test_an_error_reply_counts_as_reachable(client, clock):
+    trip(client)
+    clock.now += 15
+
+    def busy(key):
+        raise redis.ResponseError('WRONGTYPE')
+    client._client.down = False
+    client._client.get = busy
+    with pytest.raises(redis.ResponseError):
+        client.call('get', 'k')
+    assert client.available
+    assert client._failures == 0
+
+
+def test_probe_pings_until_redis_answers(clock):
+    client = LazyRedis('localhost', failure_threshold=1, cooldown=2)
+    client._client = FakeRedis()
+    client._client.ping_errors = [
+        redis.ConnectionError('refused'), redis.TimeoutError('timed out'),
+        redis.ResponseError('LOADING'), redis.ConnectionError('refused'),
+    ]
+    client._failures = 1
+    client._open_until = clock.now + client.cooldown
+    started = clock.now
+    client._run_probe()
+    # It kept going past the cooldown and closed the breaker on the first answer
+    assert clock.now - started == 5
+    assert client._open_until == 0
+    assert client.available
+
+
+def test_failover_uses_the_table_store_while_redis_is_down(app, client, clock):
+    store = build_state_store('redis', client)
+    assert isinstance(store, Failover)
+    assert isinstance(store.fallback, TableStore)
+
+    client._client.down = True
+    for n in range(client.failure_threshold + 1):
+        assert store.set(f'k{n}', 'local') is True
+    calls = client._client.calls
+    assert store.get('k0') == b'local'
+    assert store.pipeline().incr('c').execute() == [1]
+    # Open breaker: Redis is not even tried
+    assert client._client.calls == calls
+
+    clock.now += client.cooldown
+    client._client.down = False
+    assert store.set('k0', b'remote') is True
+    assert store.get('k0') == b'remote'
+    assert client._client.data == {'k0': b'remote'}
+    assert store.fallback.get('k0') == b'local'
@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import update
+
+from app import db
+from app.models.blog import BlogPost
+from app.search import _fts_match, search_indexes_ready, search_terms
+
+
+@pytest.fixture(params=['fts', 'like'])
+def backend(request, app):
+    with db.engine.connect() as conn:
+        ready = search_indexes_ready(conn)
+    if request.param == 'fts' and not ready:
+        pytest.skip('SQLite without FTS5')
+    app.extensions['fts5'] = request.param == 'fts'
+    return request.param
+
+
+def create_post(client, payload, **changes):
+    return client.post('/api/blog-posts', json=dict(payload, **changes)).get_json()['id']
+
+
+def search(client, q, **params):
+    response = client.get('/api/search', query_string=dict(params, q=q))
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def ids(body):
+    return [(hit['type'], hit['id']) for hit in body['items']]
+
+
+def test_match_expression_quotes_user_input():
+    assert search_terms('scal* OR "x"') == ['scal', 'OR', 'x']
+    assert _fts_match(['a"b', 'OR', 'fla']) == '"a""b" "OR" "fla"*'
+
+
+def test_index_follows_inserts_updates_and_deletes(auth_client, blog_payload, backend):
+    post_id = create_post(auth_client, blog_payload, title='Quokka habits')
+    assert ids(search(auth_client, 'quokka')) == [('blogs', post_id)]
+    auth_client.put(f'/api/blog-posts/{post_id}', json={'title': 'Wombat habits'})
+    assert ids(search(auth_client, 'quokka')) == []
+    assert ids(search(auth_client, 'wombat')) == [('blogs', post_id)]
+    auth_client.delete(f'/api/blog-posts/{post_id}')
+    assert ids(search(auth_client, 'wombat')) == []
+
+
+def test_hits_carry_titles_and_escaped_snippets(auth_client, blog_payload, backend):
+    create_post(auth_client, blog_payload, title='Quokka', intro='<script>alert(1)</script> quokka facts')
+    hit = search(auth_client, 'quokka', type='blogs')['items'][0]
+    assert hit['title'] == 'Quokka'
+    assert '<mark>' in hit['snippet']
+    assert '<script>' not in hit['snippet']
+
+
+def test_every_term_must_match(auth_client, blog_payload, backend):
+    create_post(auth_client, blog_payload, title='Quokka habits')
+    create_post(auth_client, blog_payload, title='Quokka diet')
+    assert len(search(auth_client, 'quokka')['items']) == 2
+    assert len(search(auth_client, 'quokka diet')['items']) == 1
+
+
+def test_pages_follow_the_cursor(auth_client, blog_payload, backend):
+    for n in range(5):
+        create_post(auth_client, blog_payload, title=f'Quokka {n}')
+    first = search(auth_client, 'quokka', limit=3)
+    second = search(auth_client, 'quokka', limit=3, cursor=first['next_cursor'])
+    assert len(first['items']) == 3 and len(second['items']) == 2
+    assert second['next_cursor'] is None
+    assert not set(ids(first)) & set(ids(second))
+
+
+def test_like_fallback_lists_newest_first_and_undated_last(auth_client, blog_payload, app):
+    app.extensions['fts5'] = False
+    undated = create_post(auth_client, blog_payload, title='Quokka old')
+    older = create_post(auth_client, blog_payload, title='Quokka older')
+    newer = create_post(auth_client, blog_payload, title='Quokka newer')
+    db.session.execute(update(BlogPost).where(BlogPost.id == undated).values(created_at=None))
+    db.session.commit()
+    assert ids(search(auth_client, 'quokka')) == [('blogs', newer), ('blogs', older), ('blogs', undated)]
+
+
+@pytest.mark.parametrize('params', [{}, {'q': ' '}, {'q': 'x', 'type': 'users'}, {'q': 'x', 'cursor': 'bad'}])
+def test_bad_requests_are_400(client, params):
+    assert client.get('/api/search', query_string=params).status_code == 400
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+import serve
+
+SETTINGS = ('BIND', 'PORT', 'WEB_CONCURRENCY', 'WEB_THREADS', 'WEB_TIMEOUT', 'WEB_MAX_REQUESTS', 'WEB_PRELOAD',
+            'WEB_PIDFILE')
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in SETTINGS:
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_server_defaults(monkeypatch):
+    monkeypatch.setattr(serve.multiprocessing, 'cpu_count', lambda: 4)
+    options = serve.server_options()
+    assert options['bind'] == '0.0.0.0:5000'
+    assert options['workers'] == 9
+    assert options['threads'] == 4
+    assert options['max_requests'] == 1000
+    assert options['max_requests_jitter'] == 100
+    assert options['preload_app'] is True
+    assert options['pidfile'] is None
+
+
+def test_server_options_come_from_the_environment(monkeypatch):
+    monkeypatch.setenv('PORT', '8000')
+    monkeypatch.setenv('WEB_CONCURRENCY', '3')
+    monkeypatch.setenv('WEB_MAX_REQUESTS', '0')
+    monkeypatch.setenv('WEB_PRELOAD', 'false')
+    options = serve.server_options()
+    assert options['bind'] == '0.0.0.0:8000'
+    assert options['workers'] == 3
+    assert options['max_requests'] == options['max_requests_jitter'] == 0
+    assert options['preload_app'] is False
+    monkeypatch.setenv('BIND', 'unix:/tmp/galvan.sock')
+    assert serve.server_options()['bind'] == 'unix:/tmp/galvan.sock'
+
+
+def test_metrics_dir_is_emptied_of_old_samples(monkeypatch, tmp_path):
+    (tmp_path / 'counter_123.db').write_bytes(b'old')
+    (tmp_path / 'keep.txt').write_text('x')
+    monkeypatch.setenv('PROMETHEUS_MULTIPROC_DIR', str(tmp_path))
+    serve.prepare_metrics_dir()
+    assert sorted(os.listdir(tmp_path)) == ['keep.txt']
+
+
+def test_metrics_dir_defaults_to_a_fresh_one(monkeypatch):
+    # setenv first so the variable serve sets is removed again afterwards
+    monkeypatch.setenv('PROMETHEUS_MULTIPROC_DIR', '')
+    monkeypatch.delenv('PROMETHEUS_MULTIPROC_DIR')
+    serve.prepare_metrics_dir()
+    path = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    assert os.path.isdir(path) and not os.listdir(path)
+    os.rmdir(path)
@@ -0,0 +1,48 @@
+import logging
+
+from sqlalchemy import text
+
+from app import create_app, db
+from app.config import TestingConfig
+from app.sqlite import configured_pragmas
+
+
+def file_app(tmp_path, **settings):
+    class FileConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'pragmas.db'}"
+        SQLALCHEMY_ENGINE_OPTIONS = {}
+    for key, value in settings.items():
+        setattr(FileConfig, key, value)
+    return create_app(FileConfig)
+
+
+def test_file_database_runs_in_wal_with_tuned_pragmas(tmp_path):
+    app = file_app(tmp_path)
+    effective = app.extensions['sqlite_pragmas']
+    assert effective['journal_mode'] == 'wal'
+    assert effective['synchronous'] == 'NORMAL'
+    assert effective['busy_timeout'] == 5000
+    assert effective['temp_store'] == 'MEMORY'
+    assert effective['cache_size'] == -20000
+
+
+def test_every_new_connection_gets_the_pragmas(tmp_path):
+    app = file_app(tmp_path, SQLITE_BUSY_TIMEOUT_MS=1234, SQLITE_SYNCHRONOUS='FULL')
+    with app.app_context():
+        db.engine.dispose()
+        with db.engine.connect() as first, db.engine.connect() as second:
+            for conn in (first, second):
+                assert conn.execute(text('PRAGMA busy_timeout')).scalar() == 1234
+                assert conn.execute(text('PRAGMA synchronous')).scalar() == 2
+
+
+def test_empty_settings_are_skipped():
+    pragmas = configured_pragmas({'SQLITE_JOURNAL_MODE': 'WAL', 'SQLITE_SYNCHRONOUS': '', 'SQLITE_FOREIGN_KEYS': None})
+    assert pragmas == {'journal_mode': 'WAL'}
+
+
+def test_in_memory_database_does_not_warn_about_wal(caplog):
+    with caplog.at_level(logging.WARNING):
+        app = create_app('testing')
+    assert app.extensions['sqlite_pragmas']['journal_mode'] == 'memory'
+    assert 'journal_mode' not in caplog.text
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import db
+from app.models.career import Career
+from app.stats import StatsError, parse_days
+
+
+def add_career(title, is_active=True):
+    career = Career(title=title, company='Galvan AI', location='Remote', type='Full-time',
+                    department='Engineering', description='Build things', is_active=is_active)
+    db.session.add(career)
+    db.session.commit()
+    return career
+
+
+def test_application_counts_by_job_and_status(auth_client, make_application):
+    make_application(job_id='1')
+    make_application(job_id='1', status='hired')
+    make_application(job_id='2', status=None)
+    body = auth_client.get('/api/stats/applications').get_json()
+    assert body['total'] == 3
+    # Rows without a status count as pending
+    assert body['by_status'] == {'pending': 2, 'hired': 1}
+    assert body['by_job_status'] == [
+        {'jobId': '1', 'status': 'hired', 'count': 1},
+        {'jobId': '1', 'status': 'pending', 'count': 1},
+        {'jobId': '2', 'status': 'pending', 'count': 1},
+    ]
+
+
+def test_submissions_per_day_are_zero_filled(auth_client, make_application, make_quote):
+    now = datetime.utcnow()
+    make_application(created_at=now)
+    make_application(created_at=now - timedelta(days=2))
+    make_quote(created_at=now)
+    make_quote(created_at=now - timedelta(days=5))
+    series = auth_client.get('/api/stats/submissions?days=3').get_json()
+    assert [day['date'] for day in series] == [(now - timedelta(days=n)).date().isoformat() for n in (2, 1, 0)]
+    assert [(day['applications'], day['quotes']) for day in series] == [(1, 0), (0, 0), (1, 1)]
+
+
+def test_active_careers_with_applicant_counts(auth_client, make_application):
+    quiet = add_career('Quiet')
+    busy = add_career('Busy')
+    add_career('Closed', is_active=False)
+    make_application(job_id=str(busy.id))
+    make_application(job_id=str(busy.id))
+    body = auth_client.get('/api/stats/careers').get_json()
+    assert [(c['id'], c['applicants']) for c in body] == [(busy.id, 2), (quiet.id, 0)]
+
+
+def test_dashboard_combines_every_aggregate(auth_client):
+    body = auth_client.get('/api/stats?days=7').get_json()
+    assert set(body) == {'applications', 'submissions_per_day', 'active_careers'}
+    assert len(body['submissions_per_day']) == 7
+
+
+@pytest.mark.parametrize('raw, expected', [(None, 30), ('', 30), ('1', 1), ('365', 365)])
+def test_parse_days(raw, expected):
+    assert parse_days({'days': raw}) == expected
+
+
+@pytest.mark.parametrize('raw', ['0', '366', 'week'])
+def test_bad_days_are_400(auth_client, raw):
+    with pytest.raises(StatsError):
+        parse_days({'days': raw})
+    assert auth_client.get(f'/api/stats?days={raw}').status_code == 400
+
+
+def test_stats_need_a_login(client):
+    assert client.get('/api/stats').status_code == 302
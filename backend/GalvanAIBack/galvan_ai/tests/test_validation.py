@@ -0,0 +1,110 @@
+import pytest
+
+from app.models.questionnaire import Questionnaire
+from app.validation import MAX_ERRORS, Array, Field, Integer, Object, Schema, String
+
+VALID_QUESTIONNAIRE = {
+    'jobId': '1',
+    'title': 'Engineer questions',
+    'description': 'A few questions',
+    'questions': [{'id': 'q1', 'type': 'text', 'label': 'Why us?'}],
+}
+
+
+def fields(errors):
+    return [error['field'] for error in errors]
+
+
+def test_valid_payload_has_no_errors():
+    assert Questionnaire.SCHEMA.errors(VALID_QUESTIONNAIRE) == []
+
+
+def test_every_missing_required_field_is_reported():
+    errors = Questionnaire.SCHEMA.errors({})
+    assert fields(errors) == ['jobId', 'title', 'description', 'questions']
+    assert errors[0]['message'] == 'Job ID is required and must be a string'
+
+
+def test_blank_required_string_and_empty_list():
+    errors = Questionnaire.SCHEMA.errors(dict(VALID_QUESTIONNAIRE, title='  ', questions=[]))
+    assert errors == [
+        {'field': 'title', 'message': 'Title is required and must be a string'},
+        {'field': 'questions', 'message': 'Questions must have at least one item'},
+    ]
+
+
+def test_nested_errors_carry_paths_and_item_labels():
+    questions = [
+        {'id': 'q1', 'type': 'select', 'label': 'Pick', 'options': ['a', '']},
+        {'id': 'q2', 'type': 'text', 'label': 'Name', 'validation': {'minLength': 5, 'maxLength': 2}},
+        {'id': 'q3', 'type': 'bogus', 'label': 'Odd'},
+        {'id': 'q4', 'type': 'file', 'label': 'CV', 'validation': {'maxFileSize': 0}},
+        'not an object',
+    ]
+    errors = Questionnaire.SCHEMA.errors(dict(VALID_QUESTIONNAIRE, questions=questions))
+    assert fields(errors) == [
+        'questions[0].options[1]',
+        'questions[1].validation.minLength',
+        'questions[2].type',
+        'questions[3].validation.maxFileSize',
+        'questions[4]',
+    ]
+    assert errors[0]['message'] == 'Question 1 option 2 must be a non-empty string'
+    assert errors[1]['message'] == 'Question 2 validation minLength cannot be greater than maxLength'
+    assert errors[3]['message'] == 'Question 4 validation maxFileSize must be between 1 byte and 50MB'
+    assert errors[4]['message'] == 'Question 5 must be an object'
+
+
+def test_variants_only_apply_to_their_type():
+    # options are only required for choice questions
+    text = {'id': 'q1', 'type': 'text', 'label': 'Name'}
+    select = {'id': 'q2', 'type': 'select', 'label': 'Pick'}
+    errors = Questionnaire.SCHEMA.errors(dict(VALID_QUESTIONNAIRE, questions=[text, select]))
+    assert fields(errors) == ['questions[1].options']
+
+
+def test_partial_updates_check_only_sent_keys():
+    assert Questionnaire.SCHEMA.errors({'title': 'New title'}, partial=True) == []
+    assert Questionnaire.SCHEMA.errors({'title': 5}, partial=True) == [
+        {'field': 'title', 'message': 'Title must be a string'},
+    ]
+
+
+def test_non_object_body():
+    assert Questionnaire.SCHEMA.errors([]) == [{'field': '', 'message': 'Request body must be an object'}]
+
+
+@pytest.mark.parametrize('value, ok', [(3, True), (0, False), (11, False), (True, False), ('3', False)])
+def test_integer_bounds_reject_bools_and_strings(value, ok):
+    schema = Schema({'count': Integer(min=1, max=10)})
+    assert (schema.errors({'count': value}) == []) is ok
+
+
+def test_errors_are_capped():
+    schema = Schema({'items': Array(Object({'name': String(required=True)}))})
+    errors = schema.errors({'items': [{}] * (MAX_ERRORS * 3)})
+    assert len(errors) == MAX_ERRORS
+    assert errors[0] == {'field': 'items[0].name', 'message': 'Items item 1 name is required and must be a string'}
+
+
+def test_endpoint_returns_every_error(auth_client):
+    response = auth_client.post('/api/questionnaires', json={'jobId': '1', 'questions': 'nope'})
+    assert response.status_code == 400
+    body = response.get_json()
+    assert fields(body['errors']) == ['title', 'description', 'questions']
+    # 'error' keeps the single-message shape older clients read
+    assert body['error'] == '; '.join(error['message'] for error in body['errors'])
+
+
+def test_endpoint_accepts_valid_payload(auth_client):
+    response = auth_client.post('/api/questionnaires', json=VALID_QUESTIONNAIRE)
+    assert response.status_code == 200
+    assert response.get_json()['success'] is True
+
+
+def test_field_types_must_compile():
+    class Untyped(Field):
+        pass
+
+    with pytest.raises(TypeError):
+        Untyped()
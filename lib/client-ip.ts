@@ -0,0 +1,23 @@
+import { NextRequest } from "next/server";
+
+// The visitor's address as reported by the proxy in front of Next.js: x-real-ip, else the
+// last x-forwarded-for hop (the one that proxy appended; earlier entries are client-supplied).
+export function clientIp(req: NextRequest): string | null {
+  const realIp = req.headers.get("x-real-ip")?.trim();
+  if (realIp) {
+    return realIp;
+  }
+  const hops = (req.headers.get("x-forwarded-for") || "")
+    .split(",")
+    .map((hop) => hop.trim())
+    .filter(Boolean);
+  return hops.length ? hops[hops.length - 1] : null;
+}
+
+// Headers that pass the visitor's address on to Flask, which rate-limits per client IP.
+// Flask trusts this one hop when TRUSTED_PROXY_HOPS=1; without it every visitor shares
+// the Next.js server's address and one bucket.
+export function forwardedFor(req: NextRequest): Record<string, string> {
+  const ip = clientIp(req);
+  return ip ? { "X-Forwarded-For": ip } : {};
+}
@@ -187,7 +187,7 @@ class FileStorageVerifier:
         
         try:
             # Get applications from Flask backend
-            response = requests.get(f"{self.flask_url}/api/job-applications", timeout=10)
+            response = requests.get(f"{self.flask_url}/api/job-applications", params={"paginate": "false"}, timeout=10)
             
             if response.status_code == 200:
                 applications = response.json()